@@ -0,0 +1,67 @@
+"""
+Cold Import Time Benchmark for Browser Use API
+
+Measures how long a fresh interpreter takes to `import browser_use`, and to first use
+the client, compared with an empty interpreter start-up.
+
+Usage:
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+PACKAGE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'services')
+
+SCENARIOS = {
+    'interpreter': 'pass',
+    'import browser_use': 'import browser_use',
+    'first client': 'import browser_use; browser_use.BrowserUseClient()',
+    'import everything': 'from browser_use import *',
+}
+
+
+def time_snippet(code: str, runs: int) -> List[float]:
+    """Run a snippet in fresh interpreters and return wall-clock times in milliseconds"""
+    env = {**os.environ, 'PYTHONPATH': PACKAGE_ROOT}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(runs: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark every scenario and return median/min timings in milliseconds"""
+    # Warm the bytecode cache so we measure import work rather than compilation
+    time_snippet(SCENARIOS['import everything'], 1)
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        timings = time_snippet(code, runs)
+        results[name] = {'median_ms': statistics.median(timings), 'min_ms': min(timings)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of the browser_use package")
+    parser.add_argument('--runs', type=int, default=10, help="Interpreter launches per scenario")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    baseline = results['interpreter']['median_ms']
+
+    print(f"📊 Cold import time ({args.runs} runs each)")
+    for name, result in results.items():
+        overhead = result['median_ms'] - baseline
+        print(f"  {name:<20} median {result['median_ms']:7.1f} ms  "
+              f"min {result['min_ms']:7.1f} ms  (+{overhead:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
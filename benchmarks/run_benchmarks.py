@@ -0,0 +1,228 @@
+"""
+Client Throughput Benchmarks for Browser Use API
+
+Runs the package against the local simulator and measures, at increasing concurrency:
+    - submissions/sec (BrowserUseClient.create_task)
+    - polls/sec (BrowserUseClient.get_task_status)
+    - completion-detection lag and peak memory for BatchTaskManager, TaskManager and TaskMonitor
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --concurrency 1 8 32 --tasks 200 --json bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json  # flag regressions against a previous run
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'services'))
+
+from simulator import BrowserUseSimulator, SimulatorConfig  # noqa: E402
+from browser_use import BrowserUseClient, BatchTaskManager, TaskManager, TaskMonitor  # noqa: E402
+from browser_use.utils.metrics import get_metrics  # noqa: E402
+
+API_KEY = 'benchmark-key'
+
+
+def _quiet(func: Callable, *args, **kwargs) -> Any:
+    """Run a function with its progress output suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def _parallel(count: int, concurrency: int, func: Callable[[int], Any]) -> float:
+    """Call func(i) for i in range(count) on a thread pool and return the elapsed seconds"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(func, range(count)))
+    return time.perf_counter() - start
+
+
+class DetectionRecorder:
+    """Records when the client first sees each task reach a terminal state"""
+
+    def __init__(self):
+        self.detected: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: str, data: Dict[str, Any]):
+        if event == 'task_finished':
+            with self._lock:
+                self.detected.setdefault(data['task_id'], time.monotonic())
+
+    def lags(self, simulator: BrowserUseSimulator) -> List[float]:
+        lags = []
+        for task_id, detected in self.detected.items():
+            finished = simulator.finish_time(task_id)
+            if finished is not None:
+                lags.append(max(0.0, detected - finished))
+        return lags
+
+
+def _lag_summary(lags: List[float]) -> Dict[str, float]:
+    if not lags:
+        return {'lag_p50_ms': 0.0, 'lag_max_ms': 0.0}
+    return {'lag_p50_ms': statistics.median(lags) * 1000, 'lag_max_ms': max(lags) * 1000}
+
+
+def bench_submissions(base_url: str, tasks: int, concurrency: int) -> Dict[str, float]:
+    client = BrowserUseClient(base_url, API_KEY)
+    elapsed = _parallel(tasks, concurrency, lambda i: client.create_task(f"benchmark task {i}"))
+    return {'submissions_per_sec': tasks / elapsed}
+
+
+def bench_polls(base_url: str, tasks: int, concurrency: int) -> Dict[str, float]:
+    client = BrowserUseClient(base_url, API_KEY)
+    task_ids = [client.create_task(f"poll target {i}") for i in range(min(tasks, 50))]
+    elapsed = _parallel(tasks, concurrency, lambda i: client.get_task_status(task_ids[i % len(task_ids)]))
+    return {'polls_per_sec': tasks / elapsed}
+
+
+def bench_batch_manager(simulator: BrowserUseSimulator, tasks: int, poll_interval: float) -> Dict[str, float]:
+    manager = BatchTaskManager(simulator.base_url, API_KEY)
+    recorder = DetectionRecorder()
+    get_metrics().add_hook(recorder)
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        task_ids = _quiet(manager.create_batch_tasks, [{'instructions': f"batch {i}"} for i in range(tasks)])
+        _quiet(manager.wait_for_batch_completion, task_ids, poll_interval)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        get_metrics().remove_hook(recorder)
+    return {'tasks_per_sec': tasks / elapsed, 'peak_mb': peak / 1e6, **_lag_summary(recorder.lags(simulator))}
+
+
+def bench_task_manager(simulator: BrowserUseSimulator, tasks: int, poll_interval: float) -> Dict[str, float]:
+    manager = TaskManager(simulator.base_url, API_KEY)
+    recorder = DetectionRecorder()
+    get_metrics().add_hook(recorder)
+    sweeps = 0
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        for i in range(tasks):
+            _quiet(manager.create_and_track_task, f"tracked {i}")
+        while manager.active_tasks:
+            _quiet(manager.monitor_all_tasks)
+            sweeps += 1
+            if manager.active_tasks:
+                time.sleep(poll_interval)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        get_metrics().remove_hook(recorder)
+    return {'tasks_per_sec': tasks / elapsed, 'sweeps': sweeps, 'peak_mb': peak / 1e6,
+            **_lag_summary(recorder.lags(simulator))}
+
+
+def bench_task_monitor(simulator: BrowserUseSimulator, tasks: int, concurrency: int,
+                       poll_interval: float) -> Dict[str, float]:
+    client = BrowserUseClient(simulator.base_url, API_KEY)
+    monitor = TaskMonitor(simulator.base_url, API_KEY)
+    recorder = DetectionRecorder()
+    get_metrics().add_hook(recorder)
+    try:
+        tracemalloc.start()
+        task_ids = [client.create_task(f"monitored {i}") for i in range(tasks)]
+        elapsed = _parallel(tasks, concurrency,
+                            lambda i: monitor.wait_for_completion(task_ids[i], poll_interval, show_steps=False))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        get_metrics().remove_hook(recorder)
+    return {'tasks_per_sec': tasks / elapsed, 'peak_mb': peak / 1e6, **_lag_summary(recorder.lags(simulator))}
+
+
+def run(concurrency_levels: List[int], tasks: int, config: SimulatorConfig, poll_interval: float) -> Dict[str, Any]:
+    """Run every benchmark and return results keyed by benchmark and concurrency level"""
+    results: Dict[str, Any] = {}
+    with BrowserUseSimulator(config) as simulator:
+        for level in concurrency_levels:
+            results[f"submit@{level}"] = bench_submissions(simulator.base_url, tasks, level)
+            results[f"poll@{level}"] = bench_polls(simulator.base_url, tasks, level)
+            results[f"TaskMonitor@{level}"] = bench_task_monitor(simulator, min(tasks, level * 4), level,
+                                                                 poll_interval)
+        # These managers are single-threaded; they scale with task count rather than concurrency
+        results['BatchTaskManager'] = bench_batch_manager(simulator, tasks, poll_interval)
+        results['TaskManager'] = bench_task_manager(simulator, tasks, poll_interval)
+        results['_simulator_requests'] = simulator.request_count
+    return results
+
+
+# Metrics where a lower value is better; every other metric is a rate
+LOWER_IS_BETTER = ('peak_mb', 'lag_p50_ms', 'lag_max_ms', 'sweeps')
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return descriptions of metrics that regressed by more than tolerance (fraction)"""
+    regressions = []
+    for name, metrics in current.items():
+        if not isinstance(metrics, dict) or name not in baseline:
+            continue
+        for metric, value in metrics.items():
+            old = baseline[name].get(metric)
+            if not old:
+                continue
+            change = (value - old) / old
+            if metric in LOWER_IS_BETTER:
+                change = -change
+            if change < -tolerance:
+                regressions.append(f"{name}.{metric}: {old:.2f} -> {value:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Browser Use client against a local simulator")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--tasks', type=int, default=100, help="Tasks per benchmark")
+    parser.add_argument('--latency', type=float, default=0.005, help="Simulated per-request latency (s)")
+    parser.add_argument('--steps', type=int, default=5, help="Steps per simulated task")
+    parser.add_argument('--step-interval', type=float, default=0.1, help="Seconds between simulated steps")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--poll-interval', type=float, default=0.2)
+    parser.add_argument('--json', help="Write results to this file")
+    parser.add_argument('--compare', help="Previous results file to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed regression fraction")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(latency=args.latency, steps_per_task=args.steps, step_interval=args.step_interval,
+                             error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=0)
+    results = run(args.concurrency, args.tasks, config, args.poll_interval)
+
+    print("📊 Benchmark results")
+    for name, metrics in results.items():
+        if isinstance(metrics, dict):
+            print(f"  {name:<22} " + "  ".join(f"{k}={v:.2f}" for k, v in metrics.items()))
+    print(f"  Simulator requests served: {results['_simulator_requests']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("❌ Regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("✅ No regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,367 @@
+"""
+Local Browser Use API Simulator
+
+An in-process HTTP server that imitates the Browser Use endpoints wrapped by this
+package, so client throughput can be measured without spending credits.
+
+Simulated endpoints (under /api/v1):
+    POST /run-task, GET /tasks, GET /task/{id}, GET /task/{id}/status,
+    PUT /stop-task, /pause-task, /resume-task,
+    GET /task/{id}/media, /task/{id}/screenshots, /task/{id}/gif,
+    POST /uploads/presigned-url (+ PUT /upload/{name}),
+    GET /account/balance, /account/info, /account/usage
+
+Tasks progress on a clock: they wait `queue_delay` seconds as 'created', then produce
+one step every `step_interval` seconds until `steps_per_task` steps exist, and finish.
+With `webhook_url` set, each status change is also POSTed there (optionally signed).
+
+Usage:
+    with BrowserUseSimulator(SimulatorConfig(step_interval=0.1)) as sim:
+        client = BrowserUseClient(sim.base_url, "test-key")
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+API_PREFIX = '/api/v1'
+
+
+class SimulatorConfig:
+    """Behaviour of the simulated API"""
+
+    def __init__(self, latency: float = 0.0, latency_jitter: float = 0.0, queue_delay: float = 0.0,
+                 steps_per_task: int = 5, step_interval: float = 0.2, step_memory_size: int = 200,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, failure_rate: float = 0.0,
+                 retry_after: float = 0.0, seed: Optional[int] = None,
+                 webhook_url: Optional[str] = None, webhook_secret: Optional[str] = None,
+                 webhook_drop_rate: float = 0.0):
+        """
+        Args:
+            latency: Added delay per request (seconds)
+            latency_jitter: Random extra delay per request, uniform in [0, latency_jitter]
+            queue_delay: Time a task stays 'created' before it starts running
+            steps_per_task: Steps a task produces before finishing
+            step_interval: Seconds between steps
+            step_memory_size: Characters in each step's memory field
+            error_rate: Probability of answering a request with HTTP 500
+            rate_limit_rate: Probability of answering a request with HTTP 429
+            failure_rate: Probability that a task ends 'failed' instead of 'finished'
+            retry_after: Retry-After value sent with 429 responses
+            seed: Random seed for reproducible error injection
+            webhook_url: If set, status changes are POSTed here as they happen
+            webhook_secret: Secret used to sign webhook deliveries
+            webhook_drop_rate: Probability that a webhook delivery is silently dropped
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.queue_delay = queue_delay
+        self.steps_per_task = steps_per_task
+        self.step_interval = step_interval
+        self.step_memory_size = step_memory_size
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.failure_rate = failure_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.webhook_drop_rate = webhook_drop_rate
+
+
+class SimulatedTask:
+    """State of one simulated task; progress is derived from the clock"""
+
+    def __init__(self, task_id: str, payload: Dict[str, Any], config: SimulatorConfig, fails: bool):
+        self.id = task_id
+        self.payload = payload
+        self.created = time.monotonic()
+        self.created_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        self.fails = fails
+        self.queue_delay = config.queue_delay
+        self.steps_total = config.steps_per_task
+        self.step_interval = config.step_interval
+        self.memory_size = config.step_memory_size
+        self.paused_at: Optional[float] = None
+        self.paused_total = 0.0
+        self.stopped_at: Optional[float] = None
+        self.finish_monotonic: Optional[float] = None
+
+    def _elapsed_running(self, now: float) -> float:
+        end = self.stopped_at or self.paused_at or now
+        return max(0.0, end - self.created - self.queue_delay - self.paused_total)
+
+    def steps_done(self, now: float) -> int:
+        if self.step_interval <= 0:
+            return self.steps_total
+        return min(self.steps_total, int(self._elapsed_running(now) / self.step_interval))
+
+    def status(self, now: float) -> str:
+        if self.stopped_at is not None:
+            return 'stopped'
+        if now - self.created < self.queue_delay:
+            return 'created'
+        if self.paused_at is not None:
+            return 'paused'
+        if self.steps_done(now) >= self.steps_total:
+            if self.finish_monotonic is None:
+                self.finish_monotonic = (self.created + self.queue_delay + self.paused_total
+                                         + self.steps_total * self.step_interval)
+            return 'failed' if self.fails else 'finished'
+        return 'running'
+
+    def details(self, now: float) -> Dict[str, Any]:
+        status = self.status(now)
+        steps = [
+            {
+                'id': f"{self.id}-{n}",
+                'step': n,
+                'evaluation_previous_goal': 'Success - previous goal completed',
+                'memory': 'm' * self.memory_size,
+                'next_goal': f"Simulated goal {n}",
+                'url': 'https://example.com/'
+            }
+            for n in range(1, self.steps_done(now) + 1)
+        ]
+        finished = status in ('finished', 'failed', 'stopped')
+        return {
+            'id': self.id,
+            'task': self.payload.get('task'),
+            'status': status,
+            'created_at': self.created_at,
+            'finished_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()) if finished else None,
+            'live_url': f"https://live.example.com/{self.id}",
+            'steps': steps,
+            'output': self._output() if status == 'finished' else None
+        }
+
+    def _output(self) -> str:
+        if self.payload.get('structured_output_json'):
+            return json.dumps({'articles': [], 'total_count': 0})
+        return f"Simulated result for: {self.payload.get('task')}"
+
+
+class BrowserUseSimulator:
+    """Threaded local server simulating the Browser Use API"""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or SimulatorConfig()
+        self.tasks: Dict[str, SimulatedTask] = {}
+        self.request_count = 0
+        self.uploads: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> 'BrowserUseSimulator':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='browser-use-simulator',
+                                        daemon=True)
+        self._thread.start()
+        if self.config.webhook_url:
+            self._stop_webhooks = threading.Event()
+            threading.Thread(target=self._deliver_webhooks, name='browser-use-simulator-webhooks',
+                             daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.config.webhook_url:
+            self._stop_webhooks.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _deliver_webhooks(self):
+        """Watch task clocks and POST each status change to the webhook URL"""
+        import hashlib
+        import hmac
+        import urllib.request
+
+        delivered: Dict[str, str] = {}
+        while not self._stop_webhooks.wait(0.005):
+            now = time.monotonic()
+            with self._lock:
+                tasks = list(self.tasks.values())
+            for task in tasks:
+                status = task.status(now)
+                if delivered.get(task.id) == status:
+                    continue
+                delivered[task.id] = status
+                if self._roll(self.config.webhook_drop_rate):
+                    continue
+                body = json.dumps({'type': 'task.status_update',
+                                   'payload': {'task_id': task.id, 'status': status}}).encode('utf-8')
+                headers = {'Content-Type': 'application/json'}
+                if self.config.webhook_secret:
+                    timestamp = str(int(time.time()))
+                    headers['X-Browser-Use-Timestamp'] = timestamp
+                    headers['X-Browser-Use-Signature'] = hmac.new(
+                        self.config.webhook_secret.encode('utf-8'), timestamp.encode('utf-8') + b'.' + body,
+                        hashlib.sha256).hexdigest()
+                try:
+                    urllib.request.urlopen(urllib.request.Request(self.config.webhook_url, data=body,
+                                                                  headers=headers), timeout=5).close()
+                except OSError:
+                    pass
+
+    def __enter__(self) -> 'BrowserUseSimulator':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def finish_time(self, task_id: str) -> Optional[float]:
+        """time.monotonic() at which the task reached its terminal state, if it has"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None
+        task.status(time.monotonic())
+        return task.stopped_at or task.finish_monotonic
+
+    # Request handling
+
+    def _roll(self, probability: float) -> bool:
+        with self._lock:
+            return probability > 0 and self._random.random() < probability
+
+    def _handle(self, method: str, path: str, query: Dict[str, Any], body: bytes):
+        """Return (status, payload, headers) for a request"""
+        with self._lock:
+            self.request_count += 1
+        config = self.config
+        delay = config.latency + (self._random.uniform(0, config.latency_jitter) if config.latency_jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        if path.startswith('/upload/') and method == 'PUT':
+            self.uploads[path[len('/upload/'):]] = body
+            return 200, {}, {}
+        if not path.startswith(API_PREFIX):
+            return 404, {'detail': 'Not Found'}, {}
+        path = path[len(API_PREFIX):]
+
+        if self._roll(config.rate_limit_rate):
+            return 429, {'detail': 'Rate limited'}, {'Retry-After': str(config.retry_after)}
+        if self._roll(config.error_rate):
+            return 500, {'detail': 'Simulated server error'}, {}
+
+        now = time.monotonic()
+        parts = [p for p in path.split('/') if p]
+
+        if method == 'POST' and parts == ['run-task']:
+            payload = json.loads(body or b'{}')
+            if not payload.get('task'):
+                return 400, {'detail': 'task is required'}, {}
+            task_id = str(uuid.uuid4())
+            with self._lock:
+                fails = self._random.random() < config.failure_rate
+                self.tasks[task_id] = SimulatedTask(task_id, payload, config, fails)
+            return 200, {'id': task_id}, {}
+
+        if method == 'GET' and parts == ['tasks']:
+            page = int((query.get('page') or ['1'])[0])
+            limit = int((query.get('limit') or ['10'])[0])
+            with self._lock:
+                tasks = sorted(self.tasks.values(), key=lambda t: t.created, reverse=True)
+            listed = tasks[(page - 1) * limit:page * limit]
+            return 200, {
+                'tasks': [{'id': t.id, 'task': t.payload.get('task'), 'status': t.status(now),
+                           'created_at': t.created_at} for t in listed],
+                'page': page, 'limit': limit, 'total_count': len(tasks),
+                'total_pages': max(1, -(-len(tasks) // limit))
+            }, {}
+
+        if method == 'GET' and len(parts) >= 2 and parts[0] == 'task':
+            task = self.tasks.get(parts[1])
+            if task is None:
+                return 404, {'detail': 'Task not found'}, {}
+            if len(parts) == 2:
+                return 200, task.details(now), {}
+            if parts[2] == 'status':
+                return 200, task.status(now), {}
+            if parts[2] == 'media':
+                return 200, {'recordings': [f"https://media.example.com/{task.id}.mp4"]}, {}
+            if parts[2] == 'screenshots':
+                return 200, {'screenshots': [f"https://media.example.com/{task.id}/{n}.png"
+                                             for n in range(1, task.steps_done(now) + 1)]}, {}
+            if parts[2] == 'gif':
+                return 200, {'gif': f"https://media.example.com/{task.id}.gif"}, {}
+
+        if method == 'PUT' and parts and parts[0] in ('stop-task', 'pause-task', 'resume-task'):
+            task = self.tasks.get((query.get('task_id') or [None])[0])
+            if task is None:
+                return 404, {'detail': 'Task not found'}, {}
+            with self._lock:
+                if parts[0] == 'stop-task' and task.stopped_at is None:
+                    task.stopped_at = now
+                elif parts[0] == 'pause-task' and task.paused_at is None:
+                    task.paused_at = now
+                elif parts[0] == 'resume-task' and task.paused_at is not None:
+                    task.paused_total += now - task.paused_at
+                    task.paused_at = None
+            return 200, {}, {}
+
+        if method == 'POST' and parts == ['uploads', 'presigned-url']:
+            filename = json.loads(body or b'{}').get('filename', 'file')
+            host, port = self._server.server_address[:2]
+            return 200, {'presigned_url': f"http://{host}:{port}/upload/{filename}"}, {}
+
+        if method == 'GET' and parts[:1] == ['account']:
+            finished = sum(1 for t in self.tasks.values() if t.status(now) == 'finished')
+            if parts[1:] == ['balance']:
+                return 200, {'credits_remaining': 100.0, 'credits_used': float(len(self.tasks)),
+                             'total_credits': 100.0 + len(self.tasks),
+                             'usage_details': {'tasks_completed': finished,
+                                               'tasks_failed': len(self.tasks) - finished}}, {}
+            if parts[1:] == ['info']:
+                return 200, {'account_id': 'simulated', 'plan': 'simulator', 'status': 'active',
+                             'limits': {'concurrent_tasks': 1000}}, {}
+            if parts[1:] == ['usage']:
+                return 200, {'daily_usage': []}, {}
+
+        return 404, {'detail': 'Not Found'}, {}
+
+    def _make_handler(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; avoid Nagle/delayed-ACK stalls on keep-alive
+            disable_nagle_algorithm = True
+
+            def _dispatch(self, method: str):
+                url = urlparse(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, payload, headers = simulator._handle(method, url.path, parse_qs(url.query), body)
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._dispatch('GET')
+
+            def do_POST(self):
+                self._dispatch('POST')
+
+            def do_PUT(self):
+                self._dispatch('PUT')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
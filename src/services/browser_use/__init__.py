@@ -1,76 +1,95 @@
 """
 Browser Use API package provides a class-based interface to interact with the Browser Use API.
 It allows you to run, pause, resume, and stop tasks using the API, as well as manage account information and balance.
-"""
-# Import constants first
-from .constants import BASE_URL, API_KEY, HEADERS
-
-# Import models before they're needed by other modules
-from .models.models import (
-    SocialMediaCompany, SocialMediaCompanies,
-    WebsiteAnalysis, PriceComparison,
-    PriceComparisonResults, NewsArticle,
-    NewsCollection
-)
-
-# Now import core classes
-from .api.client import BrowserUseClient
-from .controllers.task_controller import TaskController
-from .controllers.media_manager import MediaManager
-from .controllers.task_monitor import TaskMonitor
-from .controllers.batch_task_manager import BatchTaskManager
-from .controllers.specialized_task_creator import SpecializedTaskCreator
-from .controllers.task_manager import TaskManager
-from .controllers.account_manager import AccountManager
-from .utils.config import ConfigManager
-from .utils.validation import ValidationUtils
-from .utils.helpers import print_api_help, print_refactored_api_help
-from .examples.examples import BrowserUseExamples
-from .examples.account_examples import check_account_balance, get_account_details, get_usage_history
 
-# Import legacy functions for backward compatibility
-from .legacy import (
-    create_task, create_structured_task,
-    get_task_status, get_task_details,
-    fetch_task_output, wait_for_task_completion,
-    monitor_task_progress, stop_task,
-    pause_task, resume_task,
-    get_task_media, get_task_screenshots,
-    get_task_gif, get_presigned_upload_url,
-    upload_file_to_presigned_url
-)
-
-# Import constants
-from .constants import BASE_URL, API_KEY, HEADERS
+Public names are loaded lazily (PEP 562): `import browser_use` is cheap, and each class,
+model or function is imported from its module the first time it is accessed.
+"""
+from ._lazy import lazy_attributes
 
-__all__ = [
+_LAZY_ATTRIBUTES = {
     # Core Classes
-    'BrowserUseClient', 'TaskController', 'MediaManager',
-    'TaskMonitor', 'BatchTaskManager', 'SpecializedTaskCreator',
-    'TaskManager', 'AccountManager', 'ConfigManager', 'ValidationUtils',
-    'BrowserUseExamples',
+    'BrowserUseClient': '.api.client',
+    'Cassette': '.api.cassette',
+    'StatusSynchronizer': '.api.status_sync',
+    'TaskEventHub': '.api.events',
+    'get_event_hub': '.api.events',
+    'WebhookReceiver': '.api.webhooks',
+    'TaskHandle': '.api.handles',
+    'as_completed': '.api.handles',
+    'TaskController': '.controllers.task_controller',
+    'MediaManager': '.controllers.media_manager',
+    'TaskMonitor': '.controllers.task_monitor',
+    'BatchTaskManager': '.controllers.batch_task_manager',
+    'SpecializedTaskCreator': '.controllers.specialized_task_creator',
+    'TaskManager': '.controllers.task_manager',
+    'AccountManager': '.controllers.account_manager',
+    'HedgedRunner': '.controllers.hedged_runner',
+    'PriorityScheduler': '.controllers.priority_scheduler',
+    'Workflow': '.controllers.workflow',
+    'MatrixRunner': '.controllers.matrix_runner',
+    'TaskPacker': '.controllers.task_packer',
+    'SessionAffinityPool': '.controllers.session_pool',
+    'ConfigManager': '.utils.config',
+    'ValidationUtils': '.utils.validation',
+    'ResultParser': '.utils.result_parser',
+    'Metrics': '.utils.metrics',
+    'get_metrics': '.utils.metrics',
+    'start_metrics_server': '.utils.metrics',
+    'configure_logging': '.utils.log',
+    'get_logger': '.utils.log',
+    'HealthProbe': '.utils.health',
+    'TaskHistory': '.utils.history',
+    'RateLimiter': '.utils.rate_limit',
+    'DedupeIndex': '.utils.dedupe',
+    'StepArchive': '.utils.step_archive',
+    'ConfigOptimizer': '.utils.config_optimizer',
+    'BrowserUseExamples': '.examples.examples',
+
     # Account Example Functions
-    'check_account_balance', 'get_account_details', 'get_usage_history',
-    
+    'check_account_balance': '.examples.account_examples',
+    'get_account_details': '.examples.account_examples',
+    'get_usage_history': '.examples.account_examples',
+
     # Models
-    'SocialMediaCompany', 'SocialMediaCompanies',
-    'WebsiteAnalysis', 'PriceComparison',
-    'PriceComparisonResults', 'NewsArticle',
-    'NewsCollection',
-    
+    'SocialMediaCompany': '.models.models',
+    'SocialMediaCompanies': '.models.models',
+    'WebsiteAnalysis': '.models.models',
+    'WebsiteAnalysisPack': '.models.models',
+    'PriceComparison': '.models.models',
+    'PriceComparisonResults': '.models.models',
+    'NewsArticle': '.models.models',
+    'NewsCollection': '.models.models',
+    'TaskResult': '.models.records',
+    'TaskSummary': '.models.records',
+
     # Helper Functions
-    'print_api_help', 'print_refactored_api_help',
-    
+    'print_api_help': '.utils.helpers',
+    'print_refactored_api_help': '.utils.helpers',
+
     # Legacy Functions
-    'create_task', 'create_structured_task',
-    'get_task_status', 'get_task_details',
-    'fetch_task_output', 'wait_for_task_completion',
-    'monitor_task_progress', 'stop_task',
-    'pause_task', 'resume_task',
-    'get_task_media', 'get_task_screenshots',
-    'get_task_gif', 'get_presigned_upload_url',
-    'upload_file_to_presigned_url',
-    
-    # Constants
-    'BASE_URL', 'API_KEY', 'HEADERS'
-]
+    'create_task': '.legacy',
+    'create_structured_task': '.legacy',
+    'get_task_status': '.legacy',
+    'get_task_details': '.legacy',
+    'fetch_task_output': '.legacy',
+    'wait_for_task_completion': '.legacy',
+    'monitor_task_progress': '.legacy',
+    'stop_task': '.legacy',
+    'pause_task': '.legacy',
+    'resume_task': '.legacy',
+    'get_task_media': '.legacy',
+    'get_task_screenshots': '.legacy',
+    'get_task_gif': '.legacy',
+    'get_presigned_upload_url': '.legacy',
+    'upload_file_to_presigned_url': '.legacy',
+
+    # Constants (resolved from the environment on first access)
+    'BASE_URL': '.constants',
+    'API_KEY': '.constants',
+    'HEADERS': '.constants',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
+
+__all__ = list(_LAZY_ATTRIBUTES)
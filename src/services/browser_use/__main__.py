@@ -0,0 +1,9 @@
+"""
+Allows running the weblens command as `python -m weblens` (`python -m browser_use` from src/services)
+"""
+import sys
+
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
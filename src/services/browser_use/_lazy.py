@@ -0,0 +1,35 @@
+"""
+Lazy Attribute Loading for Browser Use API
+
+This module lets package __init__ files expose their public names without importing
+the modules that define them until the name is first used (PEP 562).
+"""
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(package: str, namespace: Dict[str, Any],
+                    attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ functions for a package
+
+    Args:
+        package: The package's __name__
+        namespace: The package's globals(); loaded attributes are cached here
+        attributes: Mapping of public name to the relative module that defines it
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package __init__
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,4 +1,25 @@
 """
 API client for Browser Use
 """
-from .client import BrowserUseClient
+from .._lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'BrowserUseClient': '.client',
+    'extract_fields': '.json_stream',
+    'set_json_backend': '.json_stream',
+    'get_json_backend': '.json_stream',
+    'Cassette': '.cassette',
+    'CassetteMiss': '.cassette',
+    'StatusSynchronizer': '.status_sync',
+    'TaskEventHub': '.events',
+    'get_event_hub': '.events',
+    'WebhookReceiver': '.webhooks',
+    'TaskHandle': '.handles',
+    'as_completed': '.handles',
+    'wait': '.handles',
+    'gather': '.handles',
+    'FIRST_COMPLETED': '.handles',
+    'ALL_COMPLETED': '.handles',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
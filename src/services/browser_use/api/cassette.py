@@ -0,0 +1,176 @@
+"""
+Record/Replay Cassettes for Browser Use API
+
+This module provides a transport that records real API interactions into a compact
+on-disk cassette (gzip-compressed JSON lines) and replays them offline. Replays can
+reproduce the recorded timeline (each response is served no earlier than it was
+received during recording), scale it, or skip it entirely, so polling, parsing and
+scheduling overhead can be profiled deterministically without network access or credits.
+
+Usage:
+    # Record a production run
+    with Cassette('incident.cassette', mode='record'):
+        BatchTaskManager().wait_for_batch_completion(task_ids)
+
+    # Replay it 10x faster
+    with Cassette('incident.cassette', mode='replay', speed=10):
+        BatchTaskManager().wait_for_batch_completion(task_ids)
+"""
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple, Deque
+from urllib.parse import urlsplit, urlencode, parse_qsl
+
+import requests
+
+from . import http
+
+# Response headers worth keeping; everything else is dropped to keep cassettes small
+RECORDED_HEADERS = ('Content-Type', 'Retry-After')
+
+
+class CassetteMiss(requests.RequestException):
+    """Raised in replay mode for a request the cassette has no response for"""
+
+
+def _body_digest(kwargs: Dict[str, Any]) -> Optional[str]:
+    """Digest of the request body for matching, or None if the body is a stream"""
+    if kwargs.get('json') is not None:
+        body = json.dumps(kwargs['json'], sort_keys=True).encode('utf-8')
+    elif isinstance(kwargs.get('data'), (bytes, str)):
+        body = kwargs['data'].encode('utf-8') if isinstance(kwargs['data'], str) else kwargs['data']
+    else:
+        return None
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+def _request_key(method: str, url: str, kwargs: Dict[str, Any]) -> Tuple[str, str, str, Optional[str]]:
+    """Match key: method, path, normalized query and body digest (headers and host are ignored)"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query) + sorted((str(k), str(v)) for k, v in (kwargs.get('params') or {}).items())
+    return method.upper(), parts.path, urlencode(sorted(query)), _body_digest(kwargs)
+
+
+class Cassette:
+    """Transport that records API traffic to disk or replays it"""
+
+    def __init__(self, path: str, mode: str = 'replay', speed: Optional[float] = 1.0):
+        """
+        Args:
+            path: Cassette file
+            mode: 'record' to call the real API and save interactions, 'replay' to serve them offline
+            speed: Replay timing factor; 1.0 reproduces the recorded timeline, 10 is ten times faster,
+                None or 0 returns responses immediately
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.entries: List[Dict[str, Any]] = []
+        self._queues: Dict[Tuple, Deque[Dict[str, Any]]] = {}
+        self._last: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._previous_transport = None
+        if mode == 'replay':
+            self.load()
+
+    # Persistence
+
+    def load(self):
+        """Read the cassette file and index its entries for replay"""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            self.entries = [json.loads(line) for line in f if line.strip()]
+        self._queues = {}
+        for entry in self.entries:
+            key = (entry['method'], entry['path'], entry['query'], entry['body'])
+            self._queues.setdefault(key, deque()).append(entry)
+
+    def save(self):
+        """Write recorded entries to the cassette file"""
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+
+    # Transport
+
+    def __call__(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.mode == 'record':
+            return self._record(method, url, **kwargs)
+        return self._replay(method, url, **kwargs)
+
+    def _record(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.monotonic()
+        response = http.send(method, url, **kwargs)
+        content = response.content
+        elapsed = time.monotonic() - start
+
+        try:
+            body, encoding = content.decode('utf-8'), 'text'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+
+        method_key, path, query, digest = _request_key(method, url, kwargs)
+        entry = {
+            'method': method_key, 'path': path, 'query': query, 'body': digest,
+            'offset': round(start - self._started, 4), 'elapsed': round(elapsed, 4),
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            'content': body, 'encoding': encoding
+        }
+        with self._lock:
+            self.entries.append(entry)
+        return response
+
+    def _replay(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = _request_key(method, url, kwargs)
+        repeated = False
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                entry = queue.popleft()
+                self._last[key] = entry
+            else:
+                # Pollers may ask more often than recorded; keep serving the final answer
+                entry = self._last.get(key)
+                repeated = True
+        if entry is None:
+            raise CassetteMiss(f"No recorded response for {method} {key[1]}?{key[2]} in cassette {self.path}")
+
+        if self.speed:
+            delay = entry['elapsed'] / self.speed
+            if not repeated:
+                # Don't answer before the response arrived in the recording, so concurrent pollers
+                # see the same interleaving of state changes as the recorded run
+                due = self._started + (entry['offset'] + entry['elapsed']) / self.speed
+                delay = max(delay, due - time.monotonic())
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.url = url
+        response.headers.update(entry['headers'])
+        response.encoding = 'utf-8'
+        content = entry['content']
+        response._content = base64.b64decode(content) if entry['encoding'] == 'base64' else content.encode('utf-8')
+        response._content_consumed = True
+        return response
+
+    # Installation
+
+    def __enter__(self) -> 'Cassette':
+        self._previous_transport = http.get_transport()
+        self._started = time.monotonic()
+        http.set_transport(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        http.set_transport(self._previous_transport)
+        if self.mode == 'record':
+            self.save()
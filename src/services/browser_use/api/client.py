@@ -3,19 +3,24 @@ Core API Client for Browser Use API
 
 This module provides the core client for interacting with the Browser Use API.
 """
-import requests
 import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Callable
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
+from . import http
+from .json_stream import loads, extract_fields, STREAM_CHUNK_SIZE
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class BrowserUseClient:
     """Core Browser Use API client for basic task operations"""
     
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -56,9 +61,11 @@ class BrowserUseClient:
             if param in kwargs:
                 payload[param] = kwargs[param]
         
-        response = requests.post(f"{self.base_url}/run-task", headers=self.headers, json=payload)
+        response = http.post(f"{self.base_url}/run-task", '/run-task', headers=self.headers, json=payload)
         if response.status_code == 200:
-            return response.json()['id']
+            task_id = response.json()['id']
+            get_metrics().task_submitted(task_id)
+            return task_id
         else:
             raise Exception(f"Error: {response.status_code} - {response.text}")
     
@@ -80,37 +87,106 @@ class BrowserUseClient:
             if param in kwargs:
                 payload[param] = kwargs[param]
         
-        response = requests.post(f"{self.base_url}/run-task", headers=self.headers, json=payload)
+        response = http.post(f"{self.base_url}/run-task", '/run-task', headers=self.headers, json=payload)
         response.raise_for_status()
-        return response.json()["id"]
+        task_id = response.json()["id"]
+        get_metrics().task_submitted(task_id)
+        return task_id
+    
+    def submit(self, instructions: str, **kwargs) -> 'TaskHandle':
+        """
+        Create a task and return a TaskHandle for it
+
+        The handle is a concurrent.futures.Future (and awaitable) resolving to the task's
+        TaskResult; all handles of this endpoint share one background poller.
+
+        Args:
+            instructions: What should the agent do
+            **kwargs: Additional create_task parameters
+        """
+        return self.handle(self.create_task(instructions, **kwargs))
+    
+    def handle(self, task_id: str) -> 'TaskHandle':
+        """Get a TaskHandle for an existing task"""
+        from .handles import get_poller
+        return get_poller(self).track(task_id)
     
     def get_task_status(self, task_id: str) -> str:
         """Get current task status"""
-        response = requests.get(f'{self.base_url}/task/{task_id}/status', headers=self.headers)
-        return response.json()
+        response = http.get(f'{self.base_url}/task/{task_id}/status', '/task/{id}/status', headers=self.headers)
+        status = response.json()
+        get_metrics().task_observed(task_id, status)
+        return status
     
-    def get_task_details(self, task_id: str) -> Dict[str, Any]:
-        """Get full task details including output"""
-        response = requests.get(f'{self.base_url}/task/{task_id}', headers=self.headers)
-        return response.json()
+    def get_task_details(self, task_id: str, fields: Optional[List[str]] = None,
+                         last_steps: Optional[int] = None,
+                         on_step: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Get full task details including output
+        
+        Args:
+            task_id: The task ID
+            fields: If given, stream the response and decode only these top-level fields
+            last_steps: If given, stream the response and keep only the last N steps
+                (the result then also has 'steps_total')
+            on_step: If given with last_steps, called with every step as it streams by
+            
+        Returns:
+            Task details, or only the selected fields in streaming mode
+        """
+        if fields is None and last_steps is None:
+            response = http.get(f'{self.base_url}/task/{task_id}', '/task/{id}', headers=self.headers)
+            details = loads(response.content)
+            get_metrics().task_observed(task_id, details.get('status'), len(details.get('steps') or ()))
+            return details
+        return self._stream_task_fields(task_id, fields or [], last_steps, on_step)
+    
+    def _stream_task_fields(self, task_id: str, fields: List[str], last_steps: Optional[int] = None,
+                            on_step: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Read /task/{task_id} incrementally, decoding only the requested fields"""
+        with http.get(f'{self.base_url}/task/{task_id}', '/task/{id}', headers=self.headers, stream=True) as response:
+            response.raise_for_status()
+            result = extract_fields(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), fields, last_steps,
+                                    on_step=on_step)
+        get_metrics().task_observed(task_id, result.get('status'), result.get('steps_total'))
+        return result
+    
+    def list_tasks(self, page: int = 1, limit: int = 100) -> Dict[str, Any]:
+        """
+        List tasks, newest first
+        
+        Args:
+            page: Page number (starting at 1)
+            limit: Tasks per page
+            
+        Returns:
+            Dictionary with 'tasks' (id, status, created_at, ...) and 'total_pages'
+        """
+        response = http.get(f'{self.base_url}/tasks', '/tasks', headers=self.headers,
+                            params={'page': page, 'limit': limit})
+        response.raise_for_status()
+        return loads(response.content)
     
     def fetch_task_output(self, task_id: str) -> Any:
         """Retrieve the final task result"""
-        response = requests.get(f"{self.base_url}/task/{task_id}", headers=self.headers)
-        response.raise_for_status()
-        return response.json()["output"]
+        # Stream the body so large step lists are skipped rather than decoded
+        result = self._stream_task_fields(task_id, ['output'])
+        if 'output' not in result:
+            raise KeyError('output')
+        return result['output']
     
     def wait_for_task_completion(self, task_id: str, poll_interval: int = 5):
         """Poll task status until it completes"""
         while True:
-            response = requests.get(f"{self.base_url}/task/{task_id}/status", headers=self.headers)
+            response = http.get(f"{self.base_url}/task/{task_id}/status", '/task/{id}/status', headers=self.headers)
             response.raise_for_status()
             status = response.json()
+            get_metrics().task_observed(task_id, status)
             if status == "finished":
                 break
             elif status in ["failed", "stopped"]:
                 raise RuntimeError(f"Task {task_id} ended with status: {status}")
-            print("Waiting for task to finish...")
+            logger.debug("Waiting for task %s to finish...", task_id, extra={'task_id': task_id})
             time.sleep(poll_interval)
     
     def get_task_full_info(self, task_id: str) -> Dict[str, Any]:
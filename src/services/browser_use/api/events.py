@@ -0,0 +1,113 @@
+"""
+Task Event Hub for Browser Use API
+
+This module provides the process-wide hub that pushed task events (e.g. from the
+webhook receiver) are published to, and that waiters block on. Each event gets a
+sequence number, so a waiter that remembers the last sequence it saw never misses an
+event that arrived between two waits.
+
+Waiters such as TaskMonitor.wait_for_completion call wait() instead of sleeping
+between polls. While no receiver is running, wait() simply times out after the poll
+interval, so behavior without push delivery is unchanged.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+# Seconds between safety polls while push delivery is active
+DEFAULT_FALLBACK_INTERVAL = 60.0
+
+
+class TaskEventHub:
+    """Latest pushed status per task, with blocking waits for new events"""
+
+    def __init__(self, max_tasks: int = 10000, fallback_interval: float = DEFAULT_FALLBACK_INTERVAL):
+        """
+        Args:
+            max_tasks: Number of tasks whose latest event is kept (oldest are dropped)
+            fallback_interval: Poll interval used by waiters while push delivery is active
+        """
+        self.max_tasks = max_tasks
+        self.fallback_interval = fallback_interval
+        self.receivers = 0
+        self._sequence = 0
+        self._latest: 'OrderedDict[str, Tuple[int, Optional[str], Dict[str, Any]]]' = OrderedDict()
+        self._condition = threading.Condition()
+
+    @property
+    def push_enabled(self) -> bool:
+        """Whether a receiver is currently delivering events"""
+        return self.receivers > 0
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the most recent event"""
+        return self._sequence
+
+    def poll_interval(self, poll_interval: float) -> float:
+        """How long a waiter should wait between polls"""
+        return max(poll_interval, self.fallback_interval) if self.push_enabled else poll_interval
+
+    def publish(self, task_id: str, status: Optional[str] = None, data: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Record an event for a task and wake waiters
+
+        Args:
+            task_id: Task the event belongs to
+            status: New status, or None for events that carry no status (e.g. a new step)
+            data: Event payload
+
+        Returns:
+            The event's sequence number
+        """
+        with self._condition:
+            self._sequence += 1
+            previous = self._latest.pop(task_id, None)
+            if status is None and previous is not None:
+                status = previous[1]
+            self._latest[task_id] = (self._sequence, status, data or {})
+            while len(self._latest) > self.max_tasks:
+                self._latest.popitem(last=False)
+            self._condition.notify_all()
+            return self._sequence
+
+    def status(self, task_id: str) -> Optional[str]:
+        """Latest pushed status of a task, if any"""
+        entry = self._latest.get(task_id)
+        return entry[1] if entry else None
+
+    def updates(self, task_ids: Iterable[str], since: int) -> Dict[str, Optional[str]]:
+        """Latest status of each given task that has had an event after `since`"""
+        with self._condition:
+            return self._updates(set(task_ids), since)
+
+    def _updates(self, task_ids: set, since: int) -> Dict[str, Optional[str]]:
+        return {task_id: entry[1] for task_id, entry in self._latest.items()
+                if entry[0] > since and task_id in task_ids}
+
+    def wait(self, task_ids: Iterable[str], since: int, timeout: float) -> Tuple[Dict[str, Optional[str]], int]:
+        """
+        Block until one of the tasks has an event after `since`, or until the timeout
+
+        Returns:
+            (updates, sequence): latest status per updated task (empty on timeout) and the
+            sequence number to pass as `since` next time
+        """
+        task_ids = set(task_ids)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                updates = self._updates(task_ids, since)
+                remaining = deadline - time.monotonic()
+                if updates or remaining <= 0:
+                    return updates, self._sequence
+                self._condition.wait(remaining)
+
+
+_hub = TaskEventHub()
+
+
+def get_event_hub() -> TaskEventHub:
+    """Return the process-wide task event hub"""
+    return _hub
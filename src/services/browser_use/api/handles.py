@@ -0,0 +1,207 @@
+"""
+Task Handles for Browser Use API
+
+This module provides TaskHandle, a concurrent.futures.Future for a submitted task that
+can also be awaited from asyncio code. All handles of a client are driven by one shared
+background poller, which reads statuses in bulk (StatusSynchronizer), wakes early on
+webhook events (TaskEventHub) and fetches details only for finished tasks and, with a
+streamed window of recent steps, for handles with step subscribers.
+
+Usage:
+    client = BrowserUseClient()
+    handles = [client.submit(f"Find the price of {item}") for item in items]
+    for handle in as_completed(handles):
+        print(handle.task_id, handle.result().output)
+
+    # or, in async code
+    results = await asyncio.gather(*handles)
+"""
+import asyncio
+import concurrent.futures
+import threading
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator, Set, Tuple
+
+from .events import get_event_hub
+from .status_sync import StatusSynchronizer
+from ..models.records import TaskResult
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+FIRST_EXCEPTION = concurrent.futures.FIRST_EXCEPTION
+ALL_COMPLETED = concurrent.futures.ALL_COMPLETED
+
+# Most recent steps fetched per sweep for handles with step subscribers
+STEP_WINDOW = 50
+
+
+class TaskHandle(concurrent.futures.Future):
+    """
+    Future for a Browser Use task
+
+    The result is the task's TaskResult once it reaches a terminal status ('finished',
+    'failed' or 'stopped'); API errors while fetching the result are raised instead.
+    """
+
+    def __init__(self, task_id: str, poller: 'TaskPoller'):
+        super().__init__()
+        self.task_id = task_id
+        self.status: Optional[str] = None
+        self.seen_steps = 0
+        self._poller = poller
+        self._step_callbacks: List[Callable[['TaskHandle', Dict[str, Any]], None]] = []
+
+    def on_step(self, callback: Callable[['TaskHandle', Dict[str, Any]], None]):
+        """Call `callback(handle, step)` for each new step (steps are fetched only for subscribed handles)"""
+        self._step_callbacks.append(callback)
+
+    def cancel(self) -> bool:
+        """Stop the remote task and cancel the future"""
+        if self.done():
+            return False
+        try:
+            self._poller.controller.stop_task(self.task_id)
+        except Exception as e:
+            logger.warning("Failed to stop task %s: %s", self.task_id, e, extra={'task_id': self.task_id})
+        return super().cancel()
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+    def __repr__(self) -> str:
+        return f"<TaskHandle {self.task_id} status={self.status}>"
+
+
+class TaskPoller:
+    """Background poller shared by all handles of one API endpoint and key"""
+
+    def __init__(self, client, poll_interval: float = 2):
+        # Imported here: the controllers package imports the API client
+        from ..controllers.task_controller import TaskController
+
+        self.client = client
+        self.controller = TaskController(client.base_url, client.api_key)
+        self.status_sync = StatusSynchronizer(client)
+        self.poll_interval = poll_interval
+        self._handles: Dict[str, TaskHandle] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, task_id: str) -> TaskHandle:
+        """Return the handle for a task, creating it and starting the poller if needed"""
+        with self._lock:
+            handle = self._handles.get(task_id)
+            if handle is None:
+                handle = self._handles[task_id] = TaskHandle(task_id, self)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='browser-use-task-poller', daemon=True)
+                self._thread.start()
+        return handle
+
+    def _run(self):
+        hub = get_event_hub()
+        since = hub.sequence
+        pushed: Optional[Dict[str, Optional[str]]] = None
+        while True:
+            with self._lock:
+                for task_id in [t for t, h in self._handles.items() if h.done()]:
+                    del self._handles[task_id]
+                handles = dict(self._handles)
+                if not handles:
+                    self._thread = None
+                    return
+            try:
+                self._sweep(handles, pushed)
+            except Exception as e:
+                logger.error("Task poller sweep failed: %s", e)
+            pushed, since = hub.wait(handles, since, hub.poll_interval(self.poll_interval))
+
+    def _sweep(self, handles: Dict[str, TaskHandle], pushed: Optional[Dict[str, Optional[str]]]):
+        if pushed:
+            statuses = {task_id: status for task_id, status in pushed.items() if status and task_id in handles}
+        else:
+            statuses = self.status_sync.statuses(handles)
+
+        subscribed: Set[str] = {task_id for task_id, h in handles.items() if h._step_callbacks}
+        for task_id in subscribed:
+            self._deliver_steps(handles[task_id])
+
+        for task_id, status in statuses.items():
+            handle = handles[task_id]
+            handle.status = status
+            if status not in ['finished', 'failed', 'stopped'] or handle.done():
+                continue
+            if task_id in subscribed:
+                self._deliver_steps(handle)
+            try:
+                output = None
+                if status == 'finished':
+                    output = self.client.get_task_details(task_id, fields=['output']).get('output')
+                result = TaskResult(task_id, status, output=output)
+            except Exception as e:
+                self._settle(handle, exception=e)
+                continue
+            self._settle(handle, result=result)
+
+    def _deliver_steps(self, handle: TaskHandle):
+        try:
+            details = self.client.get_task_details(handle.task_id, fields=['status'], last_steps=STEP_WINDOW)
+        except Exception as e:
+            logger.warning("Error fetching steps for task %s: %s", handle.task_id, e, extra={'task_id': handle.task_id})
+            return
+        handle.status = details.get('status', handle.status)
+        steps = details.get('steps') or []
+        total = details.get('steps_total', len(steps))
+        # Steps older than the window are skipped if more than STEP_WINDOW arrived between sweeps
+        new_steps = steps[max(0, len(steps) - (total - handle.seen_steps)):] if total > handle.seen_steps else []
+        for step in new_steps:
+            for callback in list(handle._step_callbacks):
+                try:
+                    callback(handle, step)
+                except Exception as e:
+                    logger.error("Step callback for task %s failed: %s", handle.task_id, e,
+                                 extra={'task_id': handle.task_id})
+        handle.seen_steps = max(handle.seen_steps, total)
+
+    @staticmethod
+    def _settle(handle: TaskHandle, result: Any = None, exception: Optional[BaseException] = None):
+        # The handle may have been cancelled concurrently
+        if not handle.set_running_or_notify_cancel():
+            return
+        if exception is not None:
+            handle.set_exception(exception)
+        else:
+            handle.set_result(result)
+
+
+_pollers: Dict[Tuple[str, str], TaskPoller] = {}
+_pollers_lock = threading.Lock()
+
+
+def get_poller(client) -> TaskPoller:
+    """Return the shared poller for a client's endpoint and API key"""
+    key = (client.base_url, client.api_key)
+    with _pollers_lock:
+        poller = _pollers.get(key)
+        if poller is None:
+            poller = _pollers[key] = TaskPoller(client)
+        return poller
+
+
+def as_completed(handles: Iterable[TaskHandle], timeout: Optional[float] = None) -> Iterator[TaskHandle]:
+    """Yield handles as their tasks complete (see concurrent.futures.as_completed)"""
+    return concurrent.futures.as_completed(handles, timeout)
+
+
+def wait(handles: Iterable[TaskHandle], timeout: Optional[float] = None,
+         return_when: str = ALL_COMPLETED) -> Tuple[Set[TaskHandle], Set[TaskHandle]]:
+    """Wait for handles (see concurrent.futures.wait); returns (done, not_done)"""
+    return concurrent.futures.wait(handles, timeout, return_when)
+
+
+def gather(handles: Iterable[TaskHandle], timeout: Optional[float] = None) -> List[TaskResult]:
+    """Results of all handles, in order"""
+    handles = list(handles)
+    concurrent.futures.wait(handles, timeout)
+    return [handle.result(timeout=0) for handle in handles]
@@ -0,0 +1,125 @@
+"""
+HTTP Layer for Browser Use API
+
+This module sends every request made by the client and controllers. It reuses one
+connection-pooled session per thread, retries rate-limited (429) requests honoring
+Retry-After (for every method, POST /run-task included: a 429 means the request was
+rejected before it was processed, so retrying cannot create a task twice), and records
+per-endpoint latency, counters and in-flight gauges in the metrics registry.
+
+The transport that actually sends requests can be swapped with set_transport(), e.g.
+to record or replay traffic with a Cassette.
+"""
+import threading
+import time
+from typing import Optional, Callable
+
+import requests
+
+from ..utils.metrics import get_metrics
+
+# Number of times a rate-limited (HTTP 429) request is retried
+MAX_RETRIES = 2
+# Base delay (seconds) between retries when the server sends no Retry-After header
+RETRY_BACKOFF = 0.5
+
+_local = threading.local()
+
+# Callable(method, url, **kwargs) -> requests.Response; None sends through the pooled session
+_transport: Optional[Callable[..., requests.Response]] = None
+
+
+def get_session() -> requests.Session:
+    """Return this thread's pooled session"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def send(method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request through this thread's pooled session, bypassing any installed transport"""
+    return get_session().request(method, url, **kwargs)
+
+
+def set_transport(transport: Optional[Callable[..., requests.Response]]):
+    """
+    Replace the function used to send requests
+
+    Args:
+        transport: Callable(method, url, **kwargs) returning a requests.Response,
+            or None to restore the default pooled session
+    """
+    global _transport
+    _transport = transport
+
+
+def get_transport() -> Optional[Callable[..., requests.Response]]:
+    """Return the installed transport (None means the default pooled session)"""
+    return _transport
+
+
+def _retry_delay(response: requests.Response, attempt: int) -> float:
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF * (2 ** attempt)
+
+
+def request(method: str, url: str, endpoint: str, max_retries: Optional[int] = None,
+            **kwargs) -> requests.Response:
+    """
+    Send an HTTP request with instrumentation
+
+    Args:
+        method: HTTP method ('GET', 'POST', 'PUT', ...)
+        url: Full request URL
+        endpoint: Endpoint label used in metrics, e.g. '/task/{id}/status'
+        max_retries: Retries for 429 responses (MAX_RETRIES by default)
+        **kwargs: Passed to requests (headers, params, json, data, stream, timeout, ...)
+
+    Returns:
+        The response (status is not checked; callers decide how to handle errors)
+    """
+    metrics = get_metrics()
+    retries = MAX_RETRIES if max_retries is None else max_retries
+    transport = _transport or send
+    attempt = 0
+
+    while True:
+        metrics.request_started(endpoint)
+        start = time.perf_counter()
+        try:
+            response = transport(method, url, **kwargs)
+        except Exception as e:
+            # Also covers custom transports raising non-requests errors, so the in-flight gauge is released
+            metrics.request_finished(method, endpoint, None, time.perf_counter() - start, error=type(e).__name__)
+            raise
+        metrics.request_finished(method, endpoint, response.status_code, time.perf_counter() - start)
+
+        if response.status_code != 429 or attempt >= retries:
+            return response
+
+        metrics.request_retried(method, endpoint, response.status_code)
+        delay = _retry_delay(response, attempt)
+        response.close()
+        attempt += 1
+        time.sleep(delay)
+
+
+def get(url: str, endpoint: str, **kwargs) -> requests.Response:
+    """Instrumented GET"""
+    return request('GET', url, endpoint, **kwargs)
+
+
+def post(url: str, endpoint: str, **kwargs) -> requests.Response:
+    """Instrumented POST"""
+    return request('POST', url, endpoint, **kwargs)
+
+
+def put(url: str, endpoint: str, **kwargs) -> requests.Response:
+    """Instrumented PUT"""
+    return request('PUT', url, endpoint, **kwargs)
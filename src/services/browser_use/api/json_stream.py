@@ -0,0 +1,281 @@
+"""
+Streaming JSON Decoding for Browser Use API
+
+This module provides incremental decoding of large task payloads. It reads a response
+body chunk by chunk and pulls out selected top-level fields (e.g. status, output, the
+last N steps) without building the full JSON tree. Values of fields that are not
+requested are skipped by a lightweight scanner and never decoded.
+
+It also selects the JSON backend used for decoding: orjson when it is installed,
+the standard library json module otherwise.
+"""
+import codecs
+import json
+import re
+from collections import deque
+from typing import Dict, Any, Optional, Iterable, Union, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast backend
+    orjson = None
+
+# Size of the chunks read from a streamed response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_backend = 'orjson' if orjson is not None else 'json'
+
+_WHITESPACE = ' \t\n\r'
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,}\]\s]')
+
+
+def set_json_backend(name: str):
+    """
+    Select the JSON backend used by loads()
+
+    Args:
+        name: 'orjson', 'json', or 'auto' (orjson if installed)
+    """
+    global _backend
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'json'
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson backend requested but orjson is not installed")
+    if name not in ('orjson', 'json'):
+        raise ValueError(f"Unknown JSON backend: {name}")
+    _backend = name
+
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON backend"""
+    return _backend
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode a JSON document with the active backend"""
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _ValueScanner:
+    """Finds the end of one JSON value across chunk boundaries without decoding it"""
+
+    def __init__(self, first_char: str):
+        self.scalar = first_char not in '"[{'
+        self.in_string = first_char == '"'
+        self.depth = 1 if first_char in '[{' else 0
+        self.escape = False
+
+    def scan(self, buf: str, pos: int) -> Optional[int]:
+        """Scan from pos and return the index just past the value, or None if buf ran out"""
+        if self.scalar:
+            match = _SCALAR_END.search(buf, pos)
+            return match.start() if match else None
+
+        while True:
+            if self.in_string:
+                if self.escape:
+                    if pos >= len(buf):
+                        return None
+                    pos += 1
+                    self.escape = False
+                match = _STRING_SPECIAL.search(buf, pos)
+                if not match:
+                    return None
+                pos = match.end()
+                if match.group() == '\\':
+                    self.escape = True
+                    continue
+                self.in_string = False
+                if self.depth == 0:
+                    return pos
+            else:
+                match = _STRUCTURAL.search(buf, pos)
+                if not match:
+                    return None
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self.in_string = True
+                elif char in '[{':
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        return pos
+
+
+class StreamingFieldExtractor:
+    """
+    Extract selected top-level fields from a streamed JSON object
+
+    Args:
+        chunks: Iterable of bytes or str chunks (e.g. response.iter_content())
+        fields: Top-level keys to decode; every other value is skipped
+        last_steps: If set, decode the 'steps' array one element at a time and keep only the last N
+        steps_field: Name of the steps array
+        on_step: Called with every decoded step (requires last_steps), so all steps can be
+            consumed while only the last N are held
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], fields: Iterable[str],
+                 last_steps: Optional[int] = None, steps_field: str = 'steps',
+                 on_step: Optional[Callable[[Any], None]] = None):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self.fields = set(fields)
+        self.last_steps = last_steps
+        self.steps_field = steps_field
+        self.on_step = on_step
+        if last_steps is not None:
+            self.fields.add(steps_field)
+
+    def _more(self) -> bool:
+        """Append the next chunk to the buffer; return False at end of stream"""
+        for chunk in self._chunks:
+            if isinstance(chunk, (bytes, bytearray)):
+                chunk = self._decoder.decode(chunk)
+            if chunk:
+                self._buf += chunk
+                return True
+        tail = self._decoder.decode(b'', final=True)
+        if tail:
+            self._buf += tail
+            return True
+        return False
+
+    def _compact(self):
+        """Drop everything before the current position"""
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character"""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not self._more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at position {self._pos} of JSON stream")
+        self._pos += 1
+
+    def _read_value(self, capture: bool) -> Any:
+        """Read one value; decode it if capture is True, otherwise discard it as it streams by"""
+        self._compact()
+        scanner = _ValueScanner(self._peek())
+        start = self._pos
+        cursor = self._pos + (0 if scanner.scalar else 1)
+
+        while True:
+            end = scanner.scan(self._buf, cursor)
+            if end is not None:
+                break
+            if capture:
+                cursor = len(self._buf)
+            else:
+                # Nothing of a skipped value needs to stay in memory
+                self._buf, self._pos, start, cursor = '', 0, 0, 0
+            if not self._more():
+                if scanner.scalar:
+                    end = len(self._buf)
+                    break
+                raise ValueError("Unexpected end of JSON stream")
+
+        self._pos = end
+        if capture:
+            return loads(self._buf[start:end])
+        return None
+
+    def _read_steps(self) -> Dict[str, Any]:
+        """Decode the steps array keeping only the last N elements"""
+        steps = deque(maxlen=self.last_steps)
+        total = 0
+        if self._peek() == 'n':
+            self._read_value(capture=False)
+            return {self.steps_field: None, 'steps_total': 0}
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+        else:
+            while True:
+                step = self._read_value(capture=True)
+                if self.on_step is not None:
+                    self.on_step(step)
+                steps.append(step)
+                total += 1
+                separator = self._peek()
+                self._pos += 1
+                if separator == ']':
+                    break
+                if separator != ',':
+                    raise ValueError(f"Expected ',' or ']' in {self.steps_field} array")
+        return {self.steps_field: list(steps), 'steps_total': total}
+
+    def extract(self) -> Dict[str, Any]:
+        """
+        Read the stream and return the requested fields
+
+        Reading stops as soon as every requested field has been seen. When last_steps
+        is set, the result also carries 'steps_total' with the full step count.
+        """
+        result = {}
+        remaining = set(self.fields)
+
+        self._expect('{')
+        if self._peek() == '}':
+            return result
+
+        while remaining:
+            self._compact()
+            if self._peek() != '"':
+                raise ValueError("Expected object key in JSON stream")
+            key = self._read_value(capture=True)
+            self._expect(':')
+
+            if key == self.steps_field and self.last_steps is not None:
+                result.update(self._read_steps())
+                remaining.discard(key)
+            elif key in remaining:
+                result[key] = self._read_value(capture=True)
+                remaining.discard(key)
+            else:
+                self._read_value(capture=False)
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                break
+            if separator != ',':
+                raise ValueError("Expected ',' or '}' in JSON stream")
+
+        return result
+
+
+def extract_fields(chunks: Iterable[Union[bytes, str]], fields: Iterable[str],
+                   last_steps: Optional[int] = None,
+                   on_step: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
+    """
+    Extract selected top-level fields from a streamed JSON object
+
+    Args:
+        chunks: Iterable of bytes or str chunks
+        fields: Top-level keys to return
+        last_steps: If set, also return only the last N entries of 'steps' (plus 'steps_total')
+        on_step: Called with every step as it is decoded (requires last_steps)
+
+    Returns:
+        Dictionary containing the requested fields that were present in the document
+    """
+    return StreamingFieldExtractor(chunks, fields, last_steps, on_step=on_step).extract()
@@ -0,0 +1,98 @@
+"""
+Bulk Status Synchronization for Browser Use API
+
+This module reads the statuses of many tasks per request through the paginated task
+list endpoint instead of one /task/{id}/status request per task, so callers fetch
+details only for tasks that reached a terminal status. Tasks not found within the
+scanned pages are polled individually, and if the list endpoint is not available the
+synchronizer switches to per-task polling for good.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterable, Set
+
+import requests
+
+from .client import BrowserUseClient
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Status codes meaning the list endpoint does not exist for this deployment
+UNSUPPORTED_STATUSES = (404, 405, 501)
+
+
+class StatusSynchronizer:
+    """Read task statuses in bulk"""
+
+    def __init__(self, client: BrowserUseClient, page_size: int = 100, max_pages: int = 10,
+                 min_tasks: int = 2, max_workers: int = 16):
+        """
+        Args:
+            client: Client used for listing and per-task fallback polls
+            page_size: Tasks requested per list page
+            max_pages: Pages scanned per sync before remaining tasks are polled individually
+            min_tasks: Below this many tasks, per-task polls are cheaper than listing
+            max_workers: Parallel per-task polls in fallback mode
+        """
+        self.client = client
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.min_tasks = min_tasks
+        self.max_workers = max_workers
+        self.list_supported = True
+
+    def statuses(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Current status of each task
+
+        Returns:
+            Dictionary of task ID to status for every task that could be read
+        """
+        wanted = set(task_ids)
+        found: Dict[str, str] = {}
+        if self.list_supported and len(wanted) >= self.min_tasks:
+            found = self._list_statuses(wanted)
+        missing = list(wanted - set(found))
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(missing), self.max_workers))) as executor:
+                for task_id, status in zip(missing, executor.map(self._poll, missing)):
+                    if status is not None:
+                        found[task_id] = status
+        return found
+
+    def _poll(self, task_id: str) -> Optional[str]:
+        try:
+            return self.client.get_task_status(task_id)
+        except Exception as e:
+            logger.warning("Error checking task %s: %s", task_id, e, extra={'task_id': task_id})
+            return None
+
+    def _list_statuses(self, wanted: Set[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        page = 1
+        metrics = get_metrics()
+        while len(found) < len(wanted) and page <= self.max_pages:
+            try:
+                listing: Dict[str, Any] = self.client.list_tasks(page=page, limit=self.page_size)
+            except requests.exceptions.HTTPError as e:
+                if e.response is not None and e.response.status_code in UNSUPPORTED_STATUSES:
+                    logger.info("Task list endpoint unavailable; falling back to per-task status polling")
+                    self.list_supported = False
+                else:
+                    logger.warning("Task list request failed: %s", e)
+                break
+            except Exception as e:
+                logger.warning("Task list request failed: %s", e)
+                break
+
+            tasks = listing.get('tasks') or []
+            for task in tasks:
+                task_id = task.get('id')
+                if task_id in wanted and task.get('status'):
+                    found[task_id] = task['status']
+                    metrics.task_observed(task_id, task['status'])
+            if not tasks or page >= (listing.get('total_pages') or page):
+                break
+            page += 1
+        return found
@@ -0,0 +1,181 @@
+"""
+Webhook Receiver for Browser Use API
+
+This module provides an embedded, threaded HTTP receiver for task status and step
+callbacks. Verified events are published to the task event hub, which wakes
+TaskMonitor.wait_for_completion and BatchTaskManager.wait_for_batch_completion within
+milliseconds. While the receiver runs, those waiters only poll every
+`fallback_interval` seconds, in case a callback goes missing.
+
+Callbacks are JSON objects, either the event itself or wrapped as
+{"type": ..., "payload": {...}}, carrying 'task_id' (or 'id') and optionally 'status'
+and 'step'. When a secret is configured, each request must carry
+    X-Browser-Use-Timestamp: <unix seconds>
+    X-Browser-Use-Signature: hex HMAC-SHA256(secret, "<timestamp>.<raw body>")
+
+Usage:
+    with WebhookReceiver(secret='...', port=8080):
+        BatchTaskManager().wait_for_batch_completion(task_ids)
+"""
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+
+from .events import TaskEventHub, get_event_hub
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Header names are matched case-insensitively
+SIGNATURE_HEADER = 'x-browser-use-signature'
+TIMESTAMP_HEADER = 'x-browser-use-timestamp'
+EVENT_ID_HEADER = 'x-browser-use-event-id'
+# Maximum age of a signed request, to limit replays
+MAX_CLOCK_SKEW = 300
+
+
+def sign_payload(secret: str, timestamp: str, body: bytes) -> str:
+    """Signature expected for a callback body"""
+    message = timestamp.encode('utf-8') + b'.' + body
+    return hmac.new(secret.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+
+class WebhookReceiver:
+    """Threaded HTTP endpoint that feeds task callbacks into the event hub"""
+
+    def __init__(self, secret: Optional[str] = None, host: str = '127.0.0.1', port: int = 0,
+                 path: str = '/webhook', hub: Optional[TaskEventHub] = None,
+                 fallback_interval: Optional[float] = None, dedupe_size: int = 10000):
+        """
+        Args:
+            secret: Signing secret (defaults to BROWSER_USE_WEBHOOK_SECRET); unsigned requests
+                are accepted only when no secret is configured
+            host: Interface to bind
+            port: Port to listen on (0 picks a free port)
+            path: URL path callbacks are posted to
+            hub: Event hub to publish to (the process-wide hub by default)
+            fallback_interval: Safety poll interval for waiters while the receiver runs
+            dedupe_size: Number of recent event keys remembered for deduplication
+        """
+        self.secret = secret or os.getenv('BROWSER_USE_WEBHOOK_SECRET')
+        self.host = host
+        self.port = port
+        self.path = path
+        self.hub = hub or get_event_hub()
+        self.fallback_interval = fallback_interval
+        self.dedupe_size = dedupe_size
+        self.accepted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self._seen: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        if not self.secret:
+            logger.warning("Webhook receiver has no secret; callbacks will not be verified")
+
+    @property
+    def url(self) -> str:
+        """Callback URL to register with the API"""
+        host, port = self._server.server_address[:2] if self._server else (self.host, self.port)
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> 'WebhookReceiver':
+        """Start serving from a background thread"""
+        if self._server is not None:
+            return self
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        threading.Thread(target=self._server.serve_forever, name='browser-use-webhooks', daemon=True).start()
+        if self.fallback_interval is not None:
+            self.hub.fallback_interval = self.fallback_interval
+        self.hub.receivers += 1
+        logger.info("Webhook receiver listening on %s", self.url)
+        return self
+
+    def stop(self):
+        """Stop serving; waiters return to regular polling"""
+        if self._server is None:
+            return
+        self.hub.receivers -= 1
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+    def __enter__(self) -> 'WebhookReceiver':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def verify(self, headers: Dict[str, str], body: bytes) -> bool:
+        """Check the request signature and timestamp (headers keyed in lower case)"""
+        if not self.secret:
+            return True
+        signature = headers.get(SIGNATURE_HEADER) or ''
+        timestamp = headers.get(TIMESTAMP_HEADER) or ''
+        try:
+            if abs(time.time() - float(timestamp)) > MAX_CLOCK_SKEW:
+                return False
+        except ValueError:
+            return False
+        return hmac.compare_digest(sign_payload(self.secret, timestamp, body), signature)
+
+    def handle(self, headers: Dict[str, str], body: bytes) -> int:
+        """Process one callback; returns the HTTP status to answer with"""
+        headers = {name.lower(): value for name, value in headers.items()}
+        if not self.verify(headers, body):
+            self.rejected += 1
+            return 401
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400
+        payload = event.get('payload', event) if isinstance(event, dict) else None
+        task_id = payload.get('task_id') or payload.get('id') if isinstance(payload, dict) else None
+        if not task_id:
+            return 400
+
+        # Deliveries are retried, so the same event may arrive more than once
+        key = headers.get(EVENT_ID_HEADER) or hashlib.sha1(body).hexdigest()
+        with self._lock:
+            if key in self._seen:
+                self.duplicates += 1
+                return 200
+            self._seen[key] = None
+            if len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+            self.accepted += 1
+
+        status = payload.get('status')
+        self.hub.publish(task_id, status, payload)
+        get_metrics().inc('browser_use_webhook_events_total', type=str(event.get('type') or 'status'))
+        if status:
+            get_metrics().task_observed(task_id, status)
+        logger.debug("Webhook event for task %s: %s", task_id, status, extra={'task_id': task_id, 'status': status})
+        return 200
+
+    def _make_handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split('?')[0] != receiver.path:
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status = receiver.handle(dict(self.headers.items()), body)
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,263 @@
+"""
+Command-Line Runner for Browser Use API
+
+This module provides the `weblens` command for running batch manifests.
+
+Usage:
+    weblens run tasks.jsonl --concurrency 64 --out results.jsonl
+    weblens archive add steps.bua <task_id> ...
+    weblens archive compact steps.bua --older-than-days 90
+
+Each manifest line is a JSON object with 'instructions' (or 'task') and any
+create_task parameters, plus an optional 'id'. Results are appended to the output
+file as tasks finish. Progress is recorded in a state file (default: <out>.state), so
+re-running the same command resumes: finished tasks are skipped and tasks that were
+still running are watched again instead of being resubmitted. Ctrl-C stops in-flight
+tasks and saves state; a second Ctrl-C exits immediately.
+
+The archive commands manage a StepArchive of full task payloads: add fetches and
+archives terminal tasks, show prints one archived payload, stats reports the archive
+size and compact rewrites it without superseded (and optionally old) blocks.
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+from .constants import load_environment
+from .api.client import BrowserUseClient
+from .controllers.batch_task_manager import BatchTaskManager
+from .models.records import TaskResult
+from .utils.log import configure_logging, get_logger
+from .utils.step_archive import StepArchive
+
+logger = get_logger(__name__)
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read a JSON-lines manifest, assigning line-number IDs to entries without one"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            entry = json.loads(line)
+            if 'instructions' not in entry and 'task' in entry:
+                entry['instructions'] = entry.pop('task')
+            if 'instructions' not in entry:
+                raise ValueError(f"{path}:{line_number}: missing 'instructions'")
+            entry['id'] = str(entry.get('id', line_number))
+            entries.append(entry)
+    return entries
+
+
+class RunState:
+    """Append-only record of submitted and finished manifest entries"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.task_ids: Dict[str, Optional[str]] = {}
+        self.done: set = set()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        self._apply(json.loads(line))
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def _apply(self, event: Dict[str, Any]):
+        if event.get('done'):
+            self.done.add(event['id'])
+        else:
+            self.task_ids[event['id']] = event.get('task_id')
+
+    def record(self, **event: Any):
+        """Persist an event ({'id', 'task_id'} or {'id', 'done': True})"""
+        with self._lock:
+            self._apply(event)
+            self._file.write(json.dumps(event) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class _Progress:
+    """Progress display using rich when available, plain log lines otherwise"""
+
+    def __init__(self, total: int, completed: int, enabled: bool):
+        self.total = total
+        self.completed = completed
+        self.counts: Dict[str, int] = {}
+        self._bar = None
+        if enabled:
+            try:
+                from rich.progress import Progress
+                self._bar = Progress()
+                self._bar.start()
+                self._task = self._bar.add_task("Running tasks", total=total, completed=completed)
+            except ImportError:
+                self._bar = None
+
+    def advance(self, status: str):
+        self.completed += 1
+        self.counts[status] = self.counts.get(status, 0) + 1
+        if self._bar is not None:
+            self._bar.update(self._task, advance=1)
+        else:
+            logger.info("Progress: %d/%d (%s)", self.completed, self.total,
+                        ', '.join(f"{k}={v}" for k, v in sorted(self.counts.items())))
+
+    def close(self):
+        if self._bar is not None:
+            self._bar.stop()
+
+
+def run_manifest(args: argparse.Namespace) -> int:
+    """Run a manifest with resumable state and graceful interruption"""
+    load_environment()
+    entries = load_manifest(args.manifest)
+    state = RunState(args.state or f"{args.out}.state")
+
+    configs = []
+    entry_ids = []
+    for entry in entries:
+        if entry['id'] in state.done:
+            continue
+        config = {k: v for k, v in entry.items() if k != 'id'}
+        if state.task_ids.get(entry['id']):
+            config['task_id'] = state.task_ids[entry['id']]
+        configs.append(config)
+        entry_ids.append(entry['id'])
+
+    skipped = len(entries) - len(configs)
+    if skipped:
+        logger.info("Resuming: %d of %d tasks already finished", skipped, len(entries))
+
+    stop_event = threading.Event()
+
+    def handle_interrupt(signum, frame):
+        if stop_event.is_set():
+            raise KeyboardInterrupt
+        logger.warning("Interrupted: stopping in-flight tasks (press Ctrl-C again to exit immediately)")
+        stop_event.set()
+
+    previous_handler = signal.signal(signal.SIGINT, handle_interrupt)
+    progress = _Progress(len(entries), skipped, enabled=not args.no_progress)
+    out_file = open(args.out, 'a', encoding='utf-8')
+    out_lock = threading.Lock()
+
+    def on_submit(index: int, task_id: str):
+        state.record(id=entry_ids[index], task_id=task_id)
+
+    completed = set()
+
+    def on_complete(index: int, result: TaskResult):
+        completed.add(index)
+        record = {'id': entry_ids[index], 'task_id': result.task_id, 'status': result.status, 'output': result.output}
+        with out_lock:
+            out_file.write(json.dumps(record) + '\n')
+            out_file.flush()
+        # A task that could not be submitted (e.g. a transient 5xx or 429) has no task ID and is retried on resume
+        if result.task_id is not None:
+            state.record(id=entry_ids[index], done=True)
+        progress.advance(result.status)
+
+    finished_normally = False
+    try:
+        manager = BatchTaskManager(args.base_url, args.api_key)
+        results = manager.run_batch(configs, concurrency=args.concurrency, poll_interval=args.poll_interval,
+                                    on_submit=on_submit, on_complete=on_complete, stop_event=stop_event)
+        finished_normally = True
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        progress.close()
+        out_file.close()
+        if stop_event.is_set() or not finished_normally:
+            # Tasks stopped mid-run are resubmitted on the next run
+            for index, entry_id in enumerate(entry_ids):
+                if index not in completed and state.task_ids.get(entry_id):
+                    state.record(id=entry_id, task_id=None)
+        state.close()
+
+    if stop_event.is_set():
+        logger.warning("Run interrupted; re-run the same command to resume")
+        return 130
+
+    failed = sum(1 for result in results.values() if result.status != 'finished')
+    logger.info("Completed %d tasks (%d not finished); results in %s", len(results), failed, args.out)
+    return 1 if failed else 0
+
+
+def run_archive(args: argparse.Namespace) -> int:
+    """Add to, read, inspect or compact a step archive"""
+    with StepArchive(args.archive) as archive:
+        if args.action == 'add':
+            load_environment()
+            client = BrowserUseClient(args.base_url, args.api_key)
+            for task_id in args.task_ids:
+                status = client.get_task_status(task_id)
+                if status not in ['finished', 'failed', 'stopped']:
+                    logger.warning("Skipping task %s: still %s", task_id, status, extra={'task_id': task_id})
+                    continue
+                archive.archive_task(client, task_id)
+            print(json.dumps(archive.stats()))
+        elif args.action == 'show':
+            for task_id in args.task_ids:
+                print(archive.get_raw(task_id).decode('utf-8'))
+        elif args.action == 'stats':
+            print(json.dumps(archive.stats()))
+        elif args.action == 'compact':
+            cutoff = time.time() - args.older_than_days * 86400 if args.older_than_days is not None else None
+
+            def keep(entry: Dict[str, Any]) -> bool:
+                return cutoff is None or entry['archived_at'] >= cutoff
+
+            print(json.dumps(archive.compact(keep)))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='weblens', description="Run Browser Use tasks in bulk")
+    parser.add_argument('--log-level', default=None, help="Log level (default: LOG_LEVEL or INFO)")
+    parser.add_argument('--log-json', default=None, help="Also write JSON-lines logs to this file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="Run a JSON-lines task manifest")
+    run.add_argument('manifest', help="Manifest file, one JSON task per line")
+    run.add_argument('--out', default='results.jsonl', help="Results file (JSON lines, appended)")
+    run.add_argument('--state', default=None, help="State file for resuming (default: <out>.state)")
+    run.add_argument('--concurrency', type=int, default=8, help="Maximum tasks in flight")
+    run.add_argument('--poll-interval', type=float, default=5.0, help="Seconds between status sweeps")
+    run.add_argument('--base-url', default=None, help="API base URL (default: BROWSER_USE_BASE_URL)")
+    run.add_argument('--api-key', default=None, help="API key (default: BROWSER_USE_API_KEY)")
+    run.add_argument('--no-progress', action='store_true', help="Disable the progress bar")
+    run.set_defaults(handler=run_manifest)
+
+    archive = subparsers.add_parser('archive', help="Manage a compressed archive of task step logs")
+    archive.add_argument('action', choices=['add', 'show', 'stats', 'compact'], help="What to do")
+    archive.add_argument('archive', help="Archive file")
+    archive.add_argument('task_ids', nargs='*', help="Task IDs (add, show)")
+    archive.add_argument('--older-than-days', type=float, default=None,
+                         help="compact: also drop tasks archived more than this many days ago")
+    archive.add_argument('--base-url', default=None, help="API base URL (default: BROWSER_USE_BASE_URL)")
+    archive.add_argument('--api-key', default=None, help="API key (default: BROWSER_USE_API_KEY)")
+    archive.set_defaults(handler=run_archive)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the weblens command"""
+    args = build_parser().parse_args(argv)
+    configure_logging(level=args.log_level, json_file=args.log_json)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,17 +2,56 @@
 Constants for Browser Use API
 
 This module defines constants used throughout the Browser Use API client.
+
+Environment variables (including the .env file) are only read the first time the
+configuration is needed, e.g. when a client is built, not when the package is imported.
+BASE_URL, API_KEY and HEADERS remain available as module attributes and are resolved
+on first access.
 """
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# API Configuration and Constants
-BASE_URL = os.getenv("BROWSER_USE_BASE_URL") or "https://api.browser-use.com/api/v1"
-API_KEY = os.getenv("BROWSER_USE_API_KEY") or "your_api_key_here"
-HEADERS = {
-    "Authorization": f"Bearer {API_KEY}",
-    "Content-Type": "application/json"
-}
+from typing import Dict, Optional
+
+DEFAULT_BASE_URL = "https://api.browser-use.com/api/v1"
+DEFAULT_API_KEY = "your_api_key_here"
+
+_env_loaded = False
+
+
+def load_environment():
+    """Load the .env file once per process"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def get_base_url() -> str:
+    """API base URL from BROWSER_USE_BASE_URL, or the public default"""
+    load_environment()
+    return os.getenv("BROWSER_USE_BASE_URL") or DEFAULT_BASE_URL
+
+
+def get_api_key() -> str:
+    """API key from BROWSER_USE_API_KEY, or the placeholder value"""
+    load_environment()
+    return os.getenv("BROWSER_USE_API_KEY") or DEFAULT_API_KEY
+
+
+def get_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Request headers for the given API key (the configured key by default)"""
+    return {
+        "Authorization": f"Bearer {api_key or get_api_key()}",
+        "Content-Type": "application/json"
+    }
+
+
+def __getattr__(name: str):
+    # PEP 562: keep BASE_URL / API_KEY / HEADERS importable without reading the environment at import time
+    if name == 'BASE_URL':
+        return get_base_url()
+    if name == 'API_KEY':
+        return get_api_key()
+    if name == 'HEADERS':
+        return get_headers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,22 @@
 """
 Controllers for Browser Use API
 """
-from .task_controller import TaskController
-from .media_manager import MediaManager
-from .task_monitor import TaskMonitor
-from .batch_task_manager import BatchTaskManager
-from .specialized_task_creator import SpecializedTaskCreator
-from .task_manager import TaskManager
-from .account_manager import AccountManager
+from .._lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'TaskController': '.task_controller',
+    'MediaManager': '.media_manager',
+    'TaskMonitor': '.task_monitor',
+    'BatchTaskManager': '.batch_task_manager',
+    'SpecializedTaskCreator': '.specialized_task_creator',
+    'TaskManager': '.task_manager',
+    'AccountManager': '.account_manager',
+    'HedgedRunner': '.hedged_runner',
+    'PriorityScheduler': '.priority_scheduler',
+    'Workflow': '.workflow',
+    'MatrixRunner': '.matrix_runner',
+    'TaskPacker': '.task_packer',
+    'SessionAffinityPool': '.session_pool',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
@@ -3,17 +3,17 @@ Account Management for Browser Use API
 
 This module provides account management functionality for Browser Use API.
 """
-import requests
+from ..api import http
 from typing import Dict, Any, Optional
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
 
 class AccountManager:
     """Handle account management operations like checking balance"""
     
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -35,7 +35,7 @@ class AccountManager:
                 }
             }
         """
-        response = requests.get(f"{self.base_url}/account/balance", headers=self.headers)
+        response = http.get(f"{self.base_url}/account/balance", '/account/balance', headers=self.headers)
         response.raise_for_status()
         return response.json()
     
@@ -46,7 +46,7 @@ class AccountManager:
         Returns:
             Dictionary containing account information including subscription plan, limits, etc.
         """
-        response = requests.get(f"{self.base_url}/account/info", headers=self.headers)
+        response = http.get(f"{self.base_url}/account/info", '/account/info', headers=self.headers)
         response.raise_for_status()
         return response.json()
     
@@ -60,8 +60,9 @@ class AccountManager:
         Returns:
             Dictionary containing usage history
         """
-        response = requests.get(
-            f"{self.base_url}/account/usage", 
+        response = http.get(
+            f"{self.base_url}/account/usage",
+            '/account/usage',
             headers=self.headers,
             params={"days": days}
         )
@@ -3,24 +3,49 @@ Batch Task Management for Browser Use API
 
 This module provides batch task management functionality for Browser Use API.
 """
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Type, Union, Callable
 
-from ..constants import BASE_URL, API_KEY
+from pydantic import BaseModel
+
+from ..constants import get_base_url, get_api_key
 from ..api.client import BrowserUseClient
+from ..api.events import get_event_hub
+from ..api.status_sync import StatusSynchronizer
+from ..controllers.task_controller import TaskController
+from ..controllers.task_monitor import limit_exceeded
+from ..models.records import TaskResult
+from ..utils.config import ConfigManager
+from ..utils.metrics import get_metrics
+from ..utils.rate_limit import RateLimiter
+from ..utils.result_parser import ResultParser
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class BatchTaskManager:
     """Manage multiple tasks in batch"""
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            config_manager: Source of task type limits and settings (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.controller = TaskController(self.base_url, self.api_key)
+        self.config_manager = config_manager or ConfigManager()
+        self.status_sync = StatusSynchronizer(self.client)
     
     def create_batch_tasks(self, task_configs: List[dict]) -> List[str]:
         """
@@ -41,53 +66,281 @@ class BatchTaskManager:
                 instructions = config.pop('instructions')
                 task_id = self.client.create_task(instructions, **config)
                 task_ids.append(task_id)
-                print(f"✅ Created batch task {i}/{len(task_configs)}: {task_id}")
+                logger.info("Created batch task %d/%d: %s", i, len(task_configs), task_id,
+                            extra={'task_id': task_id})
             except Exception as e:
-                print(f"❌ Failed to create batch task {i}: {e}")
+                logger.error("Failed to create batch task %d: %s", i, e)
         
         return task_ids
     
-    def wait_for_batch_completion(self, task_ids: List[str], poll_interval: int = 5) -> Dict[str, Any]:
+    def wait_for_batch_completion(self, task_ids: List[str], poll_interval: int = 5,
+                                  output_model: Optional[Union[str, Type[BaseModel]]] = None) -> Dict[str, Any]:
         """
         Wait for multiple tasks to complete
         
         Args:
             task_ids: List of task IDs to monitor
-            poll_interval: How often to check statuses (in seconds)
+            poll_interval: How often to check statuses (in seconds); while a WebhookReceiver
+                runs, pushed events are handled immediately and polling slows to its fallback interval
+            output_model: Optional output type name or model to validate finished outputs against.
+                Each result then also carries 'parsed' and 'validation_error'.
             
         Returns:
-            Dictionary of task IDs to completion results
+            Dictionary of task IDs to TaskResult records (readable like dictionaries)
         """
-        print(f"⏳ Waiting for {len(task_ids)} tasks to complete...")
+        logger.info("Waiting for %d tasks to complete...", len(task_ids))
         
         completed_tasks = {}
         remaining_tasks = set(task_ids)
+        hub = get_event_hub()
+        since = hub.sequence
+        pushed = None
         
         while remaining_tasks:
+            if pushed:
+                # Woken by pushed events: only the tasks they mention need attention
+                statuses = {task_id: status for task_id, status in pushed.items() if status}
+            else:
+                # One list request covers many tasks; unlisted tasks fall back to per-task polls
+                statuses = self.status_sync.statuses(remaining_tasks)
             for task_id in list(remaining_tasks):
+                if pushed and task_id not in statuses:
+                    continue
                 try:
-                    status = self.client.get_task_status(task_id)
+                    if task_id not in statuses:
+                        raise RuntimeError("status unavailable")
+                    status = statuses[task_id]
                     
                     if status in ['finished', 'failed', 'stopped']:
-                        details = self.client.get_task_details(task_id)
-                        completed_tasks[task_id] = {
-                            'status': status,
-                            'output': details.get('output') if status == 'finished' else None
-                        }
+                        details = self.client.get_task_details(task_id, fields=['output'])
+                        completed_tasks[task_id] = TaskResult(
+                            task_id,
+                            status,
+                            output=details.get('output') if status == 'finished' else None
+                        )
                         remaining_tasks.remove(task_id)
-                        print(f"✅ Task {task_id} completed: {status}")
+                        logger.info("Task %s completed: %s", task_id, status,
+                                    extra={'task_id': task_id, 'status': status})
                 
                 except Exception as e:
-                    print(f"❌ Error checking task {task_id}: {e}")
+                    logger.error("Error checking task %s: %s", task_id, e, extra={'task_id': task_id})
                     remaining_tasks.remove(task_id)
             
             if remaining_tasks:
-                print(f"⏳ {len(remaining_tasks)} tasks still running...")
-                time.sleep(poll_interval)
+                logger.debug("%d tasks still running...", len(remaining_tasks))
+                # Returns early when a webhook event arrives; empty on timeout, which triggers a poll
+                pushed, since = hub.wait(remaining_tasks, since, hub.poll_interval(poll_interval))
+        
+        logger.info("All batch tasks completed")
+        
+        if output_model is not None:
+            self.validate_batch_results(completed_tasks, output_model)
         
-        print("🎉 All batch tasks completed!")
         return completed_tasks
     
+    def validate_batch_results(self, results: Dict[str, Any],
+                               output_model: Union[str, Type[BaseModel]],
+                               max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Validate the outputs of finished batch tasks in bulk
+        
+        Args:
+            results: Dictionary of task IDs to completion results
+            output_model: Output type name (e.g. 'news_collection') or model class
+            max_workers: Number of worker processes to validate with (None validates in-process)
+            
+        Returns:
+            The same results, each updated with 'parsed' and 'validation_error'
+        """
+        report = ResultParser(max_workers=max_workers).parse_task_results(results, output_model)
+        
+        for task_id, result in results.items():
+            result['parsed'] = report['parsed'].get(task_id)
+            result['validation_error'] = report['errors'].get(task_id)
+        
+        if report['errors']:
+            logger.warning("%d of %d batch results failed validation", len(report['errors']), len(results))
+        
+        return results
+    
+    def run_batch(self, task_configs: List[dict], concurrency: int = 8, poll_interval: float = 5,
+                  on_submit: Optional[Callable[[int, str], None]] = None,
+                  on_complete: Optional[Callable[[int, TaskResult], None]] = None,
+                  stop_event: Optional[threading.Event] = None,
+                  rate_limiter: Optional[RateLimiter] = None) -> Dict[int, TaskResult]:
+        """
+        Run many tasks with at most `concurrency` in flight at a time
+        
+        New tasks are submitted as soon as earlier ones finish, and every in-flight task
+        is polled in parallel once per sweep. Tasks that run past their deadline or step
+        budget are stopped and their slots are refilled in the same sweep.
+        
+        Args:
+            task_configs: Task configuration dictionaries, each containing:
+                - instructions: The task instructions (required unless task_id is given)
+                - task_id: ID of an already submitted task to resume watching instead
+                - task_type: Task type whose ConfigManager limits apply; with a ConfigManager
+                  optimizer, settings not given explicitly are chosen by it and the outcome
+                  is recorded
+                - deadline: Seconds from submission (or, for a resumed task_id, from the start of
+                  the run) before the task is stopped
+                - max_steps: Step budget after which the task is stopped
+                - Additional optional create_task parameters
+            concurrency: Maximum number of tasks in flight
+            poll_interval: Seconds to wait between sweeps that saw no completion
+            on_submit: Called with (index, task_id) after each task is created
+            on_complete: Called with (index, TaskResult) as each task finishes
+            stop_event: When set, stops submitting, stops in-flight tasks and returns
+            rate_limiter: Optional limiter every submission waits on (may be shared between runs)
+            
+        Returns:
+            Dictionary of config index to TaskResult for every task that completed
+        """
+        pending = deque(range(len(task_configs)))
+        in_flight: Dict[str, int] = {}
+        results: Dict[int, TaskResult] = {}
+        limits: Dict[str, Dict[str, Any]] = {}
+        stop_event = stop_event or threading.Event()
+        
+        def submit(index: int):
+            config = dict(task_configs[index])
+            task_id = config.pop('task_id', None)
+            task_type = config.pop('task_type', None)
+            task_limits = self.config_manager.get_limits_for_task_type(task_type)
+            optimizer = self.config_manager.optimizer
+            if task_type is not None and optimizer is not None and task_id is None:
+                chosen = optimizer.select(task_type, {})
+                config = {**{key: value for key, value in chosen.items() if key not in config}, **config}
+            for key in ('deadline', 'max_steps'):
+                if config.get(key) is not None:
+                    task_limits[key] = config[key]
+                config.pop(key, None)
+            try:
+                if task_id is None:
+                    if rate_limiter is not None:
+                        rate_limiter.acquire()
+                    task_id = self.client.create_task(config.pop('instructions'), **config)
+                    if on_submit:
+                        on_submit(index, task_id)
+                limits[task_id] = {**task_limits, 'started': time.monotonic(), 'task_type': task_type,
+                                   'config': config}
+                return index, task_id, None
+            except Exception as e:
+                return index, None, e
+        
+        def poll_steps(task_id: str):
+            # Step budgets need the step count; stream it without decoding the steps
+            try:
+                details = self.client.get_task_details(task_id, fields=['status'], last_steps=0)
+                return task_id, details.get('status'), details.get('steps_total'), None
+            except Exception as e:
+                return task_id, None, None, e
+        
+        def poll(task_ids: List[str]):
+            budgeted = [task_id for task_id in task_ids if limits[task_id]['max_steps'] is not None]
+            plain = [task_id for task_id in task_ids if limits[task_id]['max_steps'] is None]
+            polled = list(executor.map(poll_steps, budgeted))
+            if plain:
+                statuses = self.status_sync.statuses(plain)
+                polled.extend((task_id, statuses.get(task_id), None,
+                               None if task_id in statuses else RuntimeError("status unavailable"))
+                              for task_id in plain)
+            return polled
+        
+        def record(task_id: str, status: str, step_count: Optional[int] = None):
+            task_limits = limits.pop(task_id, None)
+            if task_limits and task_limits['task_type'] is not None and self.config_manager.optimizer is not None:
+                duration = time.monotonic() - task_limits['started']
+                if step_count is None:
+                    # Only step-budgeted tasks are polled with their step count; count the others' steps once
+                    try:
+                        step_count = self.client.get_task_details(task_id, fields=[], last_steps=0).get('steps_total')
+                    except Exception as e:
+                        logger.warning("Error counting steps of task %s: %s", task_id, e, extra={'task_id': task_id})
+                self.config_manager.record_result(task_limits['task_type'], task_limits['config'], duration, status,
+                                                  steps=step_count)
+        
+        def complete(index: int, result: TaskResult):
+            results[index] = result
+            if on_complete:
+                on_complete(index, result)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, 32))) as executor:
+            finished_normally = False
+            try:
+                while (pending or in_flight) and not stop_event.is_set():
+                    batch = []
+                    while pending and len(in_flight) + len(batch) < concurrency:
+                        batch.append(pending.popleft())
+                    for index, task_id, error in executor.map(submit, batch):
+                        if error is not None:
+                            logger.error("Failed to create batch task %d: %s", index, error)
+                            complete(index, TaskResult(None, 'error', output=str(error)))
+                        else:
+                            in_flight[task_id] = index
+                    
+                    completed = 0
+                    over_limit = []
+                    for task_id, status, step_count, error in poll(list(in_flight)):
+                        if error is not None:
+                            logger.warning("Error checking task %s: %s", task_id, error, extra={'task_id': task_id})
+                            continue
+                        if status not in ['finished', 'failed', 'stopped']:
+                            task_limits = limits[task_id]
+                            reason = limit_exceeded(time.monotonic() - task_limits['started'], step_count,
+                                                    task_limits['deadline'], task_limits['max_steps'])
+                            if reason:
+                                over_limit.append((task_id, reason, step_count))
+                            continue
+                        output = None
+                        if status == 'finished':
+                            try:
+                                details = self.client.get_task_details(task_id, fields=['output'], last_steps=0)
+                                output = details.get('output')
+                                step_count = details.get('steps_total', step_count)
+                            except Exception as e:
+                                # Leave it in flight; the next sweep retries
+                                logger.warning("Error fetching output of task %s: %s", task_id, e,
+                                               extra={'task_id': task_id})
+                                continue
+                        index = in_flight.pop(task_id)
+                        record(task_id, status, step_count)
+                        completed += 1
+                        logger.info("Task %s completed: %s", task_id, status,
+                                    extra={'task_id': task_id, 'status': status})
+                        complete(index, TaskResult(task_id, status, output=output, completed_at=time.time()))
+                    
+                    if over_limit:
+                        # Free the slots now; the next sweep submits replacements without waiting
+                        list(executor.map(self._stop_quietly, [task_id for task_id, _, _ in over_limit]))
+                        for task_id, reason, step_count in over_limit:
+                            index = in_flight.pop(task_id)
+                            record(task_id, 'stopped', step_count)
+                            completed += 1
+                            logger.warning("Task %s exceeded its %s limit; stopped", task_id, reason,
+                                           extra={'task_id': task_id, 'status': 'stopped', 'stop_reason': reason})
+                            get_metrics().inc('browser_use_tasks_limit_stopped_total', reason=reason)
+                            complete(index, TaskResult(task_id, 'stopped', completed_at=time.time()))
+                    
+                    logger.debug("%d tasks running, %d queued", len(in_flight), len(pending))
+                    if in_flight and not completed:
+                        stop_event.wait(poll_interval)
+                finished_normally = True
+            finally:
+                # Interrupted or aborted by an error: stop what is still running instead of orphaning it
+                if in_flight and (stop_event.is_set() or not finished_normally):
+                    logger.warning("Stopping %d in-flight tasks", len(in_flight))
+                    list(executor.map(self._stop_quietly, list(in_flight)))
+        
+        return results
+    
+    def _stop_quietly(self, task_id: str):
+        """Stop a task, logging instead of raising on failure"""
+        try:
+            self.controller.stop_task(task_id)
+        except Exception as e:
+            logger.warning("Failed to stop task %s: %s", task_id, e, extra={'task_id': task_id})
+    
     def get_task_statistics(self, task_ids: List[str]) -> Dict[str, Any]:
         """
         Get statistics for a list of tasks
@@ -139,7 +392,7 @@ class BatchTaskManager:
                 stats['total_steps'] += len(steps)
                 
             except Exception as e:
-                print(f"⚠️ Could not get stats for task {task_id}: {e}")
+                logger.warning("Could not get stats for task %s: %s", task_id, e, extra={'task_id': task_id})
         
         if durations:
             stats['average_duration'] = sum(durations) / len(durations)
@@ -0,0 +1,168 @@
+"""
+Hedged Task Execution for Browser Use API
+
+This module provides hedged task execution for Browser Use API. A task that has not
+finished within a chosen percentile of the historical duration for its task type gets
+a duplicate; whichever copy finishes first wins and the other is stopped. Hedges are
+capped both as a fraction of runs and as an absolute number of extra tasks.
+
+Usage:
+    runner = HedgedRunner(history=TaskHistory('task_history.json'), percentile=95)
+    result = runner.run("Find the price of ...", task_type='ecommerce')
+"""
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+from ..constants import get_base_url, get_api_key
+from ..api.client import BrowserUseClient
+from ..controllers.task_controller import TaskController
+from ..models.records import TaskResult
+from ..utils.history import TaskHistory
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class HedgedRunner:
+    """Run tasks with a duplicate launched for stragglers"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 history: Optional[TaskHistory] = None, percentile: float = 95, min_samples: int = 20,
+                 max_hedge_rate: float = 0.05, max_extra_tasks: Optional[int] = None,
+                 poll_interval: float = 2):
+        """
+        Args:
+            history: Duration history used for hedge delays and updated with each run
+            percentile: Hedge once a task has run longer than this percentile of its type
+            min_samples: Finished samples needed for a task type before it is hedged
+            max_hedge_rate: Maximum fraction of runs that may launch a hedge
+            max_extra_tasks: Maximum number of hedge tasks over the runner's lifetime (None: no limit)
+            poll_interval: Seconds between status checks
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.controller = TaskController(self.base_url, self.api_key)
+        self.history = history if history is not None else TaskHistory()
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_rate = max_hedge_rate
+        self.max_extra_tasks = max_extra_tasks
+        self.poll_interval = poll_interval
+        self.runs = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, task_type: str) -> Optional[float]:
+        """Seconds after which a task of this type is hedged, or None if history is too thin"""
+        if self.history.count(task_type) < self.min_samples:
+            return None
+        return self.history.percentile(task_type, self.percentile)
+
+    def _reserve_hedge(self) -> bool:
+        """Claim a hedge if both the rate and the extra-task caps allow it"""
+        with self._lock:
+            if self.max_extra_tasks is not None and self.hedges >= self.max_extra_tasks:
+                return False
+            if self.hedges + 1 > self.max_hedge_rate * self.runs:
+                return False
+            self.hedges += 1
+            return True
+
+    def run(self, instructions: str, task_type: str = 'default', hedge: bool = True, **kwargs) -> TaskResult:
+        """
+        Create a task and wait for it, hedging if it runs long
+
+        Args:
+            instructions: The task instructions
+            task_type: Task type used to look up and record durations
+            hedge: Set to False to run without hedging (the duration is still recorded)
+            **kwargs: Additional create_task parameters
+
+        Returns:
+            TaskResult of the copy that finished first (or of the original if none finished)
+        """
+        with self._lock:
+            self.runs += 1
+        delay = self.hedge_delay(task_type) if hedge else None
+
+        started: Dict[str, float] = {self.client.create_task(instructions, **kwargs): time.monotonic()}
+        primary_id = next(iter(started))
+        active: List[str] = [primary_id]
+        final_status = None
+        hedged = False
+
+        try:
+            while True:
+                for task_id in list(active):
+                    status = self.client.get_task_status(task_id)
+                    if status == 'finished':
+                        active.remove(task_id)
+                        return self._finish(task_id, task_type, started, active, hedged, primary_id, instructions)
+                    if status in ['failed', 'stopped']:
+                        active.remove(task_id)
+                        final_status = status
+                        logger.info("Task %s ended with status %s", task_id, status,
+                                    extra={'task_id': task_id, 'status': status})
+
+                if not active:
+                    duration = time.monotonic() - started[primary_id]
+                    self.history.record(task_type, duration, final_status)
+                    return TaskResult(primary_id, final_status, instructions=instructions, completed_at=time.time())
+
+                elapsed = time.monotonic() - started[primary_id]
+                if not hedged and delay is not None and elapsed >= delay and self._reserve_hedge():
+                    hedge_id = self.client.create_task(instructions, **kwargs)
+                    started[hedge_id] = time.monotonic()
+                    active.append(hedge_id)
+                    hedged = True
+                    get_metrics().inc('browser_use_hedges_launched_total', task_type=task_type)
+                    logger.info("Task %s exceeded p%g (%.1fs); launched hedge %s", primary_id, self.percentile,
+                                delay, hedge_id, extra={'task_id': primary_id})
+
+                time.sleep(self.poll_interval)
+        finally:
+            # Interrupted or failed while copies were still running: do not leave them behind
+            self._stop_all(active, 'abandoned task')
+
+    def _stop_all(self, task_ids: List[str], role: str):
+        """Stop every task in task_ids (ignoring errors) and clear the list"""
+        for task_id in task_ids:
+            try:
+                self.controller.stop_task(task_id)
+            except Exception as e:
+                logger.warning("Failed to stop %s %s: %s", role, task_id, e, extra={'task_id': task_id})
+        task_ids.clear()
+
+    def _finish(self, task_id: str, task_type: str, started: Dict[str, float], active: List[str],
+                hedged: bool, primary_id: str, instructions: str) -> TaskResult:
+        """Stop the losing copy and record the winner"""
+        self._stop_all(active, 'hedge loser')
+
+        # Record the duration the caller saw, so the percentile reflects end-to-end latency
+        duration = time.monotonic() - started[primary_id]
+        self.history.record(task_type, duration, 'finished', hedged=hedged)
+        if task_id != primary_id:
+            with self._lock:
+                self.hedge_wins += 1
+            get_metrics().inc('browser_use_hedges_won_total', task_type=task_type)
+
+        output = self.client.get_task_details(task_id, fields=['output']).get('output')
+        return TaskResult(task_id, 'finished', output=output, instructions=instructions, completed_at=time.time())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Runs, hedges launched and hedges that beat the original"""
+        with self._lock:
+            return {
+                'runs': self.runs,
+                'hedges': self.hedges,
+                'hedge_wins': self.hedge_wins,
+                'hedge_rate': self.hedges / self.runs if self.runs else 0.0
+            }
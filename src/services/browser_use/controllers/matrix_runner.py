@@ -0,0 +1,191 @@
+"""
+Profile Matrix Execution for Browser Use API
+
+This module runs one task across a matrix of browser profiles: proxy countries, LLM
+models, ConfigManager task-type profiles and any other task parameter. Every
+combination runs concurrently under one concurrency limit and an optional shared
+submission rate limit, and the results come back as an aligned table with per-profile
+timing and a diff of each output against a baseline profile.
+
+Usage:
+    matrix = MatrixRunner(concurrency=16)
+    result = matrix.run("Return the displayed price of ...",
+                        proxy_country_code=['us', 'de', 'jp'], llm_model=['gpt-4o', 'gpt-4o-mini'])
+    print(result.to_table())
+"""
+import difflib
+import itertools
+import json
+import time
+from typing import Dict, Any, Optional, List
+
+from ..constants import get_base_url, get_api_key
+from ..controllers.batch_task_manager import BatchTaskManager
+from ..models.records import TaskResult
+from ..utils.config import ConfigManager
+from ..utils.rate_limit import RateLimiter
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+def _output_text(output: Any) -> str:
+    """Normalize an output for diffing; JSON outputs are pretty-printed with sorted keys"""
+    if output is None:
+        return ''
+    if isinstance(output, str):
+        try:
+            output = json.loads(output)
+        except ValueError:
+            return output
+    return json.dumps(output, indent=2, sort_keys=True, default=str)
+
+
+class MatrixResult:
+    """Results of a matrix run, one row per profile in expansion order"""
+
+    def __init__(self, axes: List[str], rows: List[Dict[str, Any]], baseline: Optional[int]):
+        self.axes = axes
+        self.rows = rows
+        self.baseline = baseline
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def diff(self, index: int) -> List[str]:
+        """Unified diff of a row's output against the baseline output"""
+        if self.baseline is None:
+            return []
+        base, row = self.rows[self.baseline], self.rows[index]
+        return list(difflib.unified_diff(
+            _output_text(base['output']).splitlines(), _output_text(row['output']).splitlines(),
+            fromfile=self._label(base), tofile=self._label(row), lineterm=''))
+
+    def _label(self, row: Dict[str, Any]) -> str:
+        return ','.join(f"{axis}={row['profile'][axis]}" for axis in self.axes)
+
+    def to_table(self) -> str:
+        """Aligned text table: profile columns, status, duration and diff summary"""
+        headers = self.axes + ['status', 'seconds', 'diff']
+        lines = []
+        for index, row in enumerate(self.rows):
+            if index == self.baseline:
+                diff = 'baseline'
+            elif self.baseline is None or row['status'] != 'finished':
+                diff = '-'
+            else:
+                changes = [line for line in self.diff(index) if line[:1] in '+-' and line[:3] not in ('+++', '---')]
+                added = sum(1 for line in changes if line.startswith('+'))
+                diff = 'same' if not changes else f"+{added}/-{len(changes) - added}"
+            seconds = f"{row['duration']:.1f}" if row['duration'] is not None else '-'
+            lines.append([str(row['profile'][axis]) for axis in self.axes] + [row['status'], seconds, diff])
+
+        widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *lines)]
+
+        def render(cells: List[str]) -> str:
+            return '  '.join(cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+        rule = ['-' * width for width in widths]
+        return '\n'.join([render(headers), render(rule)] + [render(line) for line in lines])
+
+
+class MatrixRunner:
+    """Expand a task into profile combinations and run them concurrently"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 concurrency: int = 8, poll_interval: float = 5, submit_rate: Optional[float] = None,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            concurrency: Maximum number of matrix tasks in flight
+            poll_interval: Seconds between status sweeps
+            submit_rate: Maximum task submissions per second, shared by every run of this runner
+            config_manager: Source of task type settings and limits; with an optimizer, rows with a
+                task_type are recorded to it (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.config_manager = config_manager or ConfigManager()
+        self.batch_manager = BatchTaskManager(self.base_url, self.api_key, self.config_manager)
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.rate_limiter = RateLimiter(submit_rate) if submit_rate else None
+
+    @staticmethod
+    def expand(**axes: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Cartesian product of axis values, e.g. expand(llm_model=['a', 'b'], proxy_country_code=['us'])
+
+        Single values are treated as one-element axes.
+        """
+        names = list(axes)
+        values = [v if isinstance(v, (list, tuple)) else [v] for v in axes.values()]
+        return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+    def build_config(self, instructions: str, profile: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Task config for one profile: task-type profile, then shared params, then the profile's values"""
+        config = {}
+        if 'task_type' in profile:
+            config.update(self.config_manager.get_config_for_task_type(profile['task_type']))
+        config.update(params)
+        config.update(profile)
+        if 'proxy_country_code' in profile:
+            config['use_proxy'] = True
+        config['instructions'] = instructions
+        return config
+
+    def run(self, instructions: str, baseline: int = 0, params: Optional[Dict[str, Any]] = None,
+            **axes: List[Any]) -> MatrixResult:
+        """
+        Run a task once per profile combination
+
+        Args:
+            instructions: The task instructions
+            baseline: Row index whose output the others are diffed against
+            params: Task parameters shared by every profile
+            **axes: Matrix axes, e.g. proxy_country_code=['us', 'de'], llm_model=[...],
+                task_type=['web_scraping', 'ecommerce'] (ConfigManager profiles)
+
+        Returns:
+            MatrixResult with one row per profile
+        """
+        if not axes:
+            raise ValueError("At least one matrix axis is required")
+        profiles = self.expand(**axes)
+        configs = [self.build_config(instructions, profile, params or {}) for profile in profiles]
+        logger.info("Running %d-profile matrix", len(profiles))
+
+        submitted: Dict[int, float] = {}
+        durations: Dict[int, float] = {}
+
+        def on_submit(index: int, task_id: str):
+            submitted[index] = time.monotonic()
+
+        def on_complete(index: int, result: TaskResult):
+            if index in submitted:
+                durations[index] = time.monotonic() - submitted[index]
+
+        results = self.batch_manager.run_batch(configs, concurrency=self.concurrency, poll_interval=self.poll_interval,
+                                               on_submit=on_submit, on_complete=on_complete,
+                                               rate_limiter=self.rate_limiter)
+
+        rows = []
+        for index, profile in enumerate(profiles):
+            result = results.get(index)
+            rows.append({
+                'profile': profile,
+                'task_id': result.task_id if result else None,
+                'status': result.status if result else 'not run',
+                'duration': durations.get(index),
+                'output': result.output if result else None
+            })
+        if not 0 <= baseline < len(rows) or rows[baseline]['status'] != 'finished':
+            baseline = next((i for i, row in enumerate(rows) if row['status'] == 'finished'), None)
+        return MatrixResult(list(axes), rows, baseline)
@@ -0,0 +1,286 @@
+"""
+Priority Scheduling for Browser Use API
+
+This module provides a priority scheduler in front of task submission. At most
+`concurrency` tasks run at once. When higher-priority work is waiting and every slot
+is taken, the lowest-priority running task is paused with TaskController.pause_task and
+resumed once capacity frees up. Among waiting tasks of equal priority, tenants with
+fewer running tasks go first; waiting tasks gain one priority level per
+`aging_interval` seconds so low-priority work is never starved.
+
+Usage:
+    with PriorityScheduler(concurrency=10) as scheduler:
+        crawl = scheduler.submit("Crawl ...", priority=0, tenant='bulk')
+        lookup = scheduler.submit("Look up ...", priority=10, tenant='interactive')
+        result = lookup.wait()
+"""
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
+
+from ..constants import get_base_url, get_api_key
+from ..api.client import BrowserUseClient
+from ..controllers.task_controller import TaskController
+from ..models.records import TaskResult
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScheduledTask:
+    """Handle for a task submitted to a PriorityScheduler"""
+
+    def __init__(self, instructions: str, priority: int, tenant: str, config: Dict[str, Any]):
+        self.instructions = instructions
+        self.priority = priority
+        self.tenant = tenant
+        self.config = config
+        self.task_id: Optional[str] = None
+        self.state = 'queued'  # queued, running, paused or done
+        self.result: Optional[TaskResult] = None
+        self.preemptions = 0
+        # When the task (re-)entered the waiting list; used for aging and FIFO order
+        self.waiting_since = time.monotonic()
+        self.started_at: Optional[float] = None
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[TaskResult]:
+        """Block until the task completes; returns its TaskResult (None on timeout)"""
+        self._done.wait(timeout)
+        return self.result
+
+
+class PriorityScheduler:
+    """Run tasks by priority with pause/resume preemption and tenant fairness"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 concurrency: int = 8, poll_interval: float = 5, aging_interval: float = 300,
+                 max_preemptions: int = 3):
+        """
+        Args:
+            concurrency: Maximum number of running (not paused) tasks
+            poll_interval: Seconds between status sweeps
+            aging_interval: Seconds of waiting that raise a task's priority by one level
+            max_preemptions: How many times a single task may be paused
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.controller = TaskController(self.base_url, self.api_key)
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.aging_interval = aging_interval
+        self.max_preemptions = max_preemptions
+        self._waiting: List[ScheduledTask] = []
+        self._running: Dict[str, ScheduledTask] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, instructions: str, priority: int = 0, tenant: str = 'default', **kwargs) -> ScheduledTask:
+        """
+        Queue a task
+
+        Args:
+            instructions: The task instructions
+            priority: Higher runs first and may preempt lower-priority running tasks
+            tenant: Tenant or queue name used for fairness between equal priorities
+            **kwargs: Additional create_task parameters
+
+        Returns:
+            ScheduledTask handle
+        """
+        item = ScheduledTask(instructions, priority, tenant, kwargs)
+        with self._lock:
+            self._waiting.append(item)
+        self._wake.set()
+        return item
+
+    def start(self) -> 'PriorityScheduler':
+        """Start the scheduling thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, 32)))
+            self._thread = threading.Thread(target=self._run, name='browser-use-scheduler', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, stop_tasks: bool = False):
+        """
+        Stop scheduling
+
+        Args:
+            stop_tasks: Also stop running and paused tasks through the API
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if stop_tasks:
+            with self._lock:
+                task_ids = list(self._running) + [t.task_id for t in self._waiting if t.task_id]
+            for task_id in task_ids:
+                try:
+                    self.controller.stop_task(task_id)
+                except Exception as e:
+                    logger.warning("Failed to stop task %s: %s", task_id, e, extra={'task_id': task_id})
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until nothing is queued, paused or running; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._waiting and not self._running:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(min(self.poll_interval, 0.5))
+
+    def __enter__(self) -> 'PriorityScheduler':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.join()
+        self.stop(stop_tasks=exc_info[0] is not None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of waiting, paused and running tasks per tenant"""
+        with self._lock:
+            return {
+                'running': dict(Counter(t.tenant for t in self._running.values())),
+                'queued': dict(Counter(t.tenant for t in self._waiting if t.state == 'queued')),
+                'paused': dict(Counter(t.tenant for t in self._waiting if t.state == 'paused'))
+            }
+
+    # Scheduling loop
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._poll()
+                self._dispatch()
+            except Exception as e:
+                logger.error("Scheduler sweep failed: %s", e)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _effective_priority(self, item: ScheduledTask, now: float) -> int:
+        if not self.aging_interval:
+            return item.priority
+        return item.priority + int((now - item.waiting_since) // self.aging_interval)
+
+    def _next_candidate(self, now: float) -> Optional[ScheduledTask]:
+        """Highest effective priority; then tenant with fewest running tasks; then longest waiting"""
+        if not self._waiting:
+            return None
+        running_per_tenant = Counter(t.tenant for t in self._running.values())
+        return max(self._waiting, key=lambda t: (self._effective_priority(t, now),
+                                                 -running_per_tenant[t.tenant], -t.waiting_since))
+
+    def _preemption_victim(self, candidate: ScheduledTask) -> Optional[ScheduledTask]:
+        """Lowest-priority, most recently started running task that candidate outranks"""
+        victims = [t for t in self._running.values()
+                   if t.priority < candidate.priority and t.preemptions < self.max_preemptions]
+        if not victims:
+            return None
+        return min(victims, key=lambda t: (t.priority, -(t.started_at or 0)))
+
+    def _dispatch(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            with self._lock:
+                candidate = self._next_candidate(now)
+                if candidate is None:
+                    return
+                victim = None
+                if len(self._running) >= self.concurrency:
+                    victim = self._preemption_victim(candidate)
+                    if victim is None:
+                        return
+                self._waiting.remove(candidate)
+            if victim is not None and not self._pause(victim):
+                with self._lock:
+                    self._waiting.append(candidate)
+                return
+            self._start(candidate)
+
+    def _pause(self, item: ScheduledTask) -> bool:
+        try:
+            self.controller.pause_task(item.task_id)
+        except Exception as e:
+            logger.warning("Failed to pause task %s: %s", item.task_id, e, extra={'task_id': item.task_id})
+            return False
+        with self._lock:
+            self._running.pop(item.task_id, None)
+            item.state = 'paused'
+            item.preemptions += 1
+            item.waiting_since = time.monotonic()
+            self._waiting.append(item)
+        get_metrics().inc('browser_use_scheduler_preemptions_total', tenant=item.tenant)
+        logger.info("Paused task %s (priority %d) to make room", item.task_id, item.priority,
+                    extra={'task_id': item.task_id, 'status': 'paused'})
+        return True
+
+    def _start(self, item: ScheduledTask):
+        try:
+            if item.task_id is None:
+                item.task_id = self.client.create_task(item.instructions, **item.config)
+            else:
+                self.controller.resume_task(item.task_id)
+                logger.info("Resumed task %s", item.task_id, extra={'task_id': item.task_id, 'status': 'running'})
+        except Exception as e:
+            logger.error("Failed to start task for tenant %s: %s", item.tenant, e, extra={'task_id': item.task_id})
+            self._complete(item, TaskResult(item.task_id, 'error', output=str(e), instructions=item.instructions))
+            return
+        with self._lock:
+            item.state = 'running'
+            item.started_at = time.monotonic()
+            self._running[item.task_id] = item
+
+    def _poll(self):
+        with self._lock:
+            running = list(self._running.values())
+        if not running:
+            return
+
+        def status_of(item: ScheduledTask):
+            try:
+                return item, self.client.get_task_status(item.task_id)
+            except Exception as e:
+                logger.warning("Error checking task %s: %s", item.task_id, e, extra={'task_id': item.task_id})
+                return item, None
+
+        for item, status in self._executor.map(status_of, running):
+            if status not in ['finished', 'failed', 'stopped']:
+                continue
+            output = None
+            if status == 'finished':
+                output = self.client.get_task_details(item.task_id, fields=['output']).get('output')
+            with self._lock:
+                self._running.pop(item.task_id, None)
+            logger.info("Task %s completed: %s", item.task_id, status,
+                        extra={'task_id': item.task_id, 'status': status})
+            self._complete(item, TaskResult(item.task_id, status, output=output, instructions=item.instructions,
+                                            completed_at=time.time()))
+
+    def _complete(self, item: ScheduledTask, result: TaskResult):
+        item.state = 'done'
+        item.result = result
+        item._done.set()
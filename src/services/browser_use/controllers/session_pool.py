@@ -0,0 +1,220 @@
+"""
+Session Affinity for Browser Use API
+
+This module routes tasks for a site to the browser profile that already holds an
+authenticated session there. A profile is a named set of task parameters identifying
+one browser identity (e.g. proxy country and secrets); tasks always run with
+save_browser_data=True so cookies and logins persist. Once a task for a site finishes
+on a profile, later tasks for that site are sent to the same profile and told that
+they are probably logged in already, so agents can skip the login steps.
+
+A session is evicted when it has not been used for `stale_after` seconds or when a
+routed task fails; a routed task that still had to log in starts a new session.
+
+Usage:
+    pool = SessionAffinityPool(profiles={'eu': {'proxy_country_code': 'de'},
+                                         'us': {'proxy_country_code': 'us'}})
+    result = pool.run("Update the shipping address to ...", site='https://shop.example.com/account')
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import urlparse
+
+from ..constants import get_base_url, get_api_key
+from ..api.client import BrowserUseClient
+from ..models.records import TaskResult
+from ..utils.config import ConfigManager
+from ..utils.metrics import get_metrics
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_STALE_AFTER = 6 * 3600
+# Step goals that mean the agent had to authenticate
+LOGIN_PATTERN = re.compile(r'\b(log\s?in|sign\s?in|authenticat\w*|enter (the )?password)\b', re.IGNORECASE)
+SESSION_HINT = ("This browser profile was recently used on {site} and is probably still logged in; "
+                "check before logging in again.")
+
+
+def site_of(url: str) -> str:
+    """Normalized host name a URL or domain belongs to"""
+    host = urlparse(url if '//' in url else f'//{url}').hostname or url
+    host = host.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class SessionAffinityPool:
+    """Route tasks to the browser profile holding a site's authenticated session"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 profiles: Optional[Dict[str, Dict[str, Any]]] = None, stale_after: float = DEFAULT_STALE_AFTER,
+                 state_path: Optional[str] = None, config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            profiles: Profile name to the task parameters that select that browser identity
+            stale_after: Seconds of disuse after which a site's session is dropped
+            state_path: Optional JSON file the session table is loaded from and saved to
+            config_manager: Source of task type settings (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.config_manager = config_manager or ConfigManager()
+        self.profiles = profiles or {'default': {}}
+        self.stale_after = stale_after
+        self.state_path = state_path
+        self.stats = {'hits': 0, 'misses': 0, 'relogins': 0, 'evictions': 0}
+        # site -> {'profile', 'established_at', 'last_used'}
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        # task_id -> (site, profile, routed to an existing session)
+        self._pending: Dict[str, Tuple[str, str, bool]] = {}
+        self._lock = threading.Lock()
+        if state_path and os.path.exists(state_path):
+            self.load()
+
+    def sessions(self) -> Dict[str, Dict[str, Any]]:
+        """Current (non-stale) sessions per site"""
+        self.evict_stale()
+        with self._lock:
+            return {site: dict(session) for site, session in self._sessions.items()}
+
+    def route(self, site: str) -> Tuple[str, bool]:
+        """
+        Profile a task for a site should run on
+
+        Returns:
+            (profile name, whether it holds a live session for the site)
+        """
+        site = site_of(site)
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(site)
+            if session and session['profile'] in self.profiles and now - session['last_used'] <= self.stale_after:
+                return session['profile'], True
+            # No live session: use the profile holding the fewest sessions and pending tasks
+            load = Counter(s['profile'] for s in self._sessions.values())
+            load.update(profile for _, profile, _ in self._pending.values())
+            return min(self.profiles, key=lambda name: load[name]), False
+
+    def submit(self, instructions: str, site: str, task_type: str = 'form_filling', **kwargs) -> str:
+        """
+        Create a task routed by session affinity
+
+        Args:
+            instructions: The task instructions
+            site: URL or domain the task works on
+            task_type: ConfigManager task type the base configuration comes from
+            **kwargs: Additional create_task parameters (override the profile's)
+
+        Returns:
+            Task ID
+        """
+        site = site_of(site)
+        profile, hit = self.route(site)
+        config = {**self.config_manager.get_config_for_task_type(task_type), **self.profiles[profile], **kwargs,
+                  'save_browser_data': True}
+        if hit:
+            instructions = f"{instructions}\n\n{SESSION_HINT.format(site=site)}"
+        task_id = self.client.create_task(instructions, **config)
+        with self._lock:
+            self.stats['hits' if hit else 'misses'] += 1
+            self._pending[task_id] = (site, profile, hit)
+            # The session may have been evicted while the task was being created
+            session = self._sessions.get(site) if hit else None
+            if session is not None and session['profile'] == profile:
+                session['last_used'] = time.time()
+        get_metrics().inc('browser_use_session_affinity_total', result='hit' if hit else 'miss')
+        logger.debug("Task %s for %s routed to profile %s (%s)", task_id, site, profile,
+                     'session' if hit else 'no session', extra={'task_id': task_id})
+        return task_id
+
+    def complete(self, task_id: str, status: str, steps: Optional[List[Dict[str, Any]]] = None):
+        """
+        Update sessions from a finished task submitted through this pool
+
+        Args:
+            task_id: Task ID returned by submit()
+            status: Final task status
+            steps: The task's steps, used to tell whether the agent had to log in
+        """
+        with self._lock:
+            pending = self._pending.pop(task_id, None)
+        if pending is None:
+            return
+        site, profile, hit = pending
+        logged_in = any(LOGIN_PATTERN.search(str(step.get('next_goal') or '')) for step in steps or ())
+
+        if status != 'finished':
+            # The failure may have been caused by, or have lost, the session
+            if hit:
+                self.evict(site, reason='failed')
+            return
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(site)
+            if session is None or session['profile'] != profile or (hit and logged_in):
+                # New session; a routed task that had to log in means the old one had expired
+                if hit and logged_in:
+                    self.stats['relogins'] += 1
+                session = self._sessions[site] = {'profile': profile, 'established_at': now}
+            session['last_used'] = now
+        self._save()
+
+    def run(self, instructions: str, site: str, task_type: str = 'form_filling', **kwargs) -> TaskResult:
+        """Submit a routed task, wait for it and update sessions; returns its TaskResult"""
+        task_id = self.submit(instructions, site, task_type, **kwargs)
+        status = self.client.handle(task_id).result().status
+        details = self.client.get_task_details(task_id)
+        self.complete(task_id, status, details.get('steps'))
+        return TaskResult(task_id, status, output=details.get('output'), instructions=instructions,
+                          completed_at=time.time())
+
+    def evict(self, site: str, reason: str = 'manual'):
+        """Forget the session for a site"""
+        site = site_of(site)
+        with self._lock:
+            session = self._sessions.pop(site, None)
+            if session is not None:
+                self.stats['evictions'] += 1
+        if session is not None:
+            logger.info("Evicted session for %s on profile %s: %s", site, session['profile'], reason)
+            get_metrics().inc('browser_use_session_evictions_total', reason=reason)
+            self._save()
+
+    def evict_stale(self) -> int:
+        """Drop sessions unused for longer than stale_after; returns how many were dropped"""
+        cutoff = time.time() - self.stale_after
+        with self._lock:
+            stale = [site for site, session in self._sessions.items() if session['last_used'] < cutoff]
+        for site in stale:
+            self.evict(site, reason='stale')
+        return len(stale)
+
+    def load(self):
+        """Read the session table from state_path"""
+        with open(self.state_path, encoding='utf-8') as f:
+            sessions = json.load(f)
+        with self._lock:
+            self._sessions = sessions
+
+    def _save(self):
+        if not self.state_path:
+            return
+        with self._lock:
+            data = dict(self._sessions)
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.sessions_')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.state_path)
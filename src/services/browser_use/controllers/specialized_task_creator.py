@@ -5,23 +5,31 @@ This module provides specialized task creation functionality for Browser Use API
 """
 from typing import Dict, Any, Optional, List
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
 from ..api.client import BrowserUseClient
 from ..utils.config import ConfigManager
 from ..models.models import WebsiteAnalysis, PriceComparisonResults, NewsCollection
 
+WEBSITE_ANALYSIS_INSTRUCTIONS = ("Analyze the website at {url}. Provide title, meta description, main content summary, "
+                                 "count of links and images, estimated load time, and accessibility score (1-100).")
+
 class SpecializedTaskCreator:
     """Create tasks for specific use cases with optimized configurations"""
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            config_manager: Source of task type settings (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.client = BrowserUseClient(self.base_url, self.api_key)
-        self.config_manager = ConfigManager()
+        self.config_manager = config_manager or ConfigManager()
     
     def create_website_analysis_task(self, url: str, **kwargs) -> str:
         """
@@ -35,7 +43,7 @@ class SpecializedTaskCreator:
             Task ID
         """
         schema = WebsiteAnalysis.model_json_schema()
-        instructions = f"Analyze the website at {url}. Provide title, meta description, main content summary, count of links and images, estimated load time, and accessibility score (1-100)."
+        instructions = WEBSITE_ANALYSIS_INSTRUCTIONS.format(url=url)
         
         # Get optimized config for web scraping
         config = self.config_manager.get_config_for_task_type('web_scraping')
@@ -6,18 +6,24 @@ This module provides enhanced task management functionality for Browser Use API.
 import time
 from typing import Dict, Any, Optional
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
 from ..api.client import BrowserUseClient
+from ..api.status_sync import StatusSynchronizer
 from ..controllers.task_monitor import TaskMonitor
 from ..controllers.task_controller import TaskController
 from ..models.models import SocialMediaCompanies
+from ..models.records import TaskResult
+from ..utils.result_parser import ResultParser
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class TaskManager:
     """Enhanced task management class"""
     
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -27,6 +33,7 @@ class TaskManager:
         self.client = BrowserUseClient(self.base_url, self.api_key)
         self.monitor = TaskMonitor(self.base_url, self.api_key)
         self.controller = TaskController(self.base_url, self.api_key)
+        self.status_sync = StatusSynchronizer(self.client)
     
     def create_and_track_task(self, instructions: str, task_name: Optional[str] = None, **kwargs) -> str:
         """Create a task and add it to tracking"""
@@ -41,21 +48,24 @@ class TaskManager:
         }
         
         self.active_tasks[task_id] = task_info
-        print(f"✅ Created and tracking task: {task_info['name']} ({task_id})")
+        logger.info("Created and tracking task: %s (%s)", task_info['name'], task_id, extra={'task_id': task_id})
         return task_id
     
     def monitor_all_tasks(self):
         """Monitor all active tasks"""
         if not self.active_tasks:
-            print("No active tasks to monitor")
+            logger.info("No active tasks to monitor")
             return
         
-        print(f"📊 Monitoring {len(self.active_tasks)} active tasks...")
+        logger.debug("Monitoring %d active tasks...", len(self.active_tasks))
+        statuses = self.status_sync.statuses(self.active_tasks)
         
         for task_id, task_info in list(self.active_tasks.items()):
             try:
-                status = self.client.get_task_status(task_id)
-                print(f"🔄 {task_info['name']}: {status}")
+                if task_id not in statuses:
+                    raise RuntimeError("status unavailable")
+                status = statuses[task_id]
+                logger.debug("%s: %s", task_info['name'], status, extra={'task_id': task_id, 'status': status})
                 
                 if status in ['finished', 'failed', 'stopped']:
                     # Move to completed tasks
@@ -63,15 +73,16 @@ class TaskManager:
                     task_info['final_status'] = status
                     
                     if status == 'finished':
-                        details = self.client.get_task_details(task_id)
+                        details = self.client.get_task_details(task_id, fields=['output'])
                         task_info['output'] = details.get('output')
                     
-                    self.completed_tasks[task_id] = task_info
+                    self.completed_tasks[task_id] = TaskResult.from_task_info(task_info)
                     del self.active_tasks[task_id]
-                    print(f"✅ {task_info['name']} completed with status: {status}")
+                    logger.info("%s completed with status: %s", task_info['name'], status,
+                                extra={'task_id': task_id, 'status': status})
             
             except Exception as e:
-                print(f"❌ Error checking {task_info['name']}: {e}")
+                logger.error("Error checking %s: %s", task_info['name'], e, extra={'task_id': task_id})
     
     def get_task_summary(self):
         """Get summary of all tasks"""
@@ -87,9 +98,9 @@ class TaskManager:
         for task_id, task_info in self.active_tasks.items():
             try:
                 self.controller.stop_task(task_id)
-                print(f"🛑 Stopped {task_info['name']}")
+                logger.info("Stopped %s", task_info['name'], extra={'task_id': task_id})
             except Exception as e:
-                print(f"❌ Failed to stop {task_info['name']}: {e}")
+                logger.error("Failed to stop %s: %s", task_info['name'], e, extra={'task_id': task_id})
     
     def structured_output_example(self):
         """Example function demonstrating structured output usage"""
@@ -107,7 +118,7 @@ class TaskManager:
         print("Raw output:", output)
 
         try:
-            parsed = SocialMediaCompanies.model_validate_json(output)
+            parsed = ResultParser().parse(output, SocialMediaCompanies)
             print("Parsed output:")
             print(parsed)
         except Exception as e:
@@ -4,59 +4,228 @@ Task Monitor and Progress Tracking for Browser Use API
 This module provides task monitoring functionality for Browser Use API.
 """
 import json
+import logging
 import time
 from typing import Dict, Any, Optional
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
 from ..api.client import BrowserUseClient
+from ..api.events import get_event_hub
+from ..controllers.task_controller import TaskController
+from ..models.records import TaskSummary
+from ..utils.config import ConfigManager
+from ..utils.metrics import get_metrics
+from ..utils.step_buffer import StepBuffer, DEFAULT_BUFFER_SIZE
+from ..utils.log import get_logger, ensure_logging
+
+logger = get_logger(__name__)
+
+
+def limit_exceeded(elapsed: float, step_count: Optional[int], deadline: Optional[float] = None,
+                   max_steps: Optional[int] = None) -> Optional[str]:
+    """Return 'deadline' or 'max_steps' if a running task is over its limits, else None"""
+    if deadline is not None and elapsed >= deadline:
+        return 'deadline'
+    if max_steps is not None and step_count is not None and step_count >= max_steps:
+        return 'max_steps'
+    return None
+
 
 class TaskMonitor:
     """Monitor task progress with real-time feedback"""
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            config_manager: Source of task type limits and settings (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.controller = TaskController(self.base_url, self.api_key)
+        self.config_manager = config_manager or ConfigManager()
     
-    def wait_for_completion(self, task_id: str, poll_interval: int = 2, show_steps: bool = True):
+    def wait_for_completion(self, task_id: str, poll_interval: int = 2, show_steps: bool = True,
+                            task_type: Optional[str] = None, deadline: Optional[float] = None,
+                            max_steps: Optional[int] = None):
         """
         Poll task status until completion with step tracking
         
+        A task that runs past its deadline or step budget is stopped with
+        TaskController.stop_task, and the returned details carry 'stop_reason'.
+        While a WebhookReceiver is running, the next poll happens as soon as an event
+        for the task arrives, with slow polling only as a fallback.
+        
         Args:
             task_id: The task ID to monitor
             poll_interval: How often to check for updates (in seconds)
-            show_steps: Whether to print step details
+            show_steps: Whether to log step details (at INFO level; if no logging is configured,
+                the default utils.log.configure_logging() setup is applied)
+            task_type: Task type whose ConfigManager limits apply
+            deadline: Seconds from the start of monitoring before the task is stopped
+                (overrides the task type limit)
+            max_steps: Step budget (overrides the task type limit)
             
         Returns:
             The complete task details once finished
         """
+        limits = self.config_manager.get_limits_for_task_type(task_type)
+        deadline = deadline if deadline is not None else limits['deadline']
+        max_steps = max_steps if max_steps is not None else limits['max_steps']
+        started = time.monotonic()
+        stop_reason = None
         count = 0
-        unique_steps = []
+        seen_steps = 0
+        
+        if show_steps:
+            ensure_logging()
+        # Without step logging or a step budget, poll the small status endpoint and fetch
+        # the full details only once the task has ended
+        need_steps = (show_steps and logger.isEnabledFor(logging.INFO)) or max_steps is not None
+        hub = get_event_hub()
+        since = hub.sequence
         
         while True:
-            details = self.client.get_task_details(task_id)
-            status = details['status']
+            if need_steps:
+                details = self.client.get_task_details(task_id)
+                status = details['status']
+            else:
+                status = self.client.get_task_status(task_id)
+                details = self.client.get_task_details(task_id) if status in ['finished', 'failed', 'stopped'] else {}
             
-            # Track and display new steps
-            if show_steps:
+            # Steps are only ever appended, so anything past the last seen count is new
+            if show_steps and logger.isEnabledFor(logging.INFO):
                 new_steps = details.get('steps', [])
-                if new_steps != unique_steps:
-                    for step in new_steps:
-                        if step not in unique_steps:
-                            print(json.dumps(step, indent=4))
-                    unique_steps = new_steps
+                for step in new_steps[seen_steps:]:
+                    logger.info("Task %s step: %s", task_id, json.dumps(step, indent=4), extra={'task_id': task_id})
+                seen_steps = len(new_steps)
             
             count += 1
             
             # Check if task is complete
             if status in ['finished', 'failed', 'stopped']:
+                if stop_reason:
+                    details['stop_reason'] = stop_reason
                 return details
-                
-            time.sleep(poll_interval)
+            
+            if stop_reason is None:
+                step_count = len(details.get('steps') or ()) if need_steps else None
+                stop_reason = limit_exceeded(time.monotonic() - started, step_count, deadline, max_steps)
+                if stop_reason:
+                    self._stop_for_limit(task_id, stop_reason)
+                    continue
+            
+            timeout = self._next_poll_timeout(poll_interval, started, deadline, stop_reason)
+            _, since = hub.wait([task_id], since, timeout)
+    
+    def _stop_for_limit(self, task_id: str, reason: str):
+        """Stop a task that is over a limit, logging instead of raising if the stop fails"""
+        logger.warning("Task %s exceeded its %s limit; stopping", task_id, reason,
+                       extra={'task_id': task_id, 'stop_reason': reason})
+        get_metrics().inc('browser_use_tasks_limit_stopped_total', reason=reason)
+        try:
+            self.controller.stop_task(task_id)
+        except Exception as e:
+            # E.g. the task ended just before the stop request; the next poll shows its final status
+            logger.warning("Failed to stop task %s: %s", task_id, e, extra={'task_id': task_id})
+    
+    @staticmethod
+    def _next_poll_timeout(poll_interval: float, started: float, deadline: Optional[float],
+                           stop_reason: Optional[str]) -> float:
+        """Seconds until the next poll: the poll interval, cut short by a deadline not yet enforced"""
+        timeout = get_event_hub().poll_interval(poll_interval)
+        if deadline is not None and stop_reason is None:
+            timeout = max(0.0, min(timeout, deadline - (time.monotonic() - started)))
+        return timeout
+    
+    def wait_for_summary(self, task_id: str, poll_interval: int = 2, show_steps: bool = True,
+                         buffer_size: int = DEFAULT_BUFFER_SIZE, spill_dir: Optional[str] = None,
+                         task_type: Optional[str] = None, deadline: Optional[float] = None,
+                         max_steps: Optional[int] = None) -> TaskSummary:
+        """
+        Poll a task until completion with memory bounded by buffer_size steps
+        
+        Like wait_for_completion, but each poll streams only the status and the last
+        buffer_size steps, the most recent steps are kept in a ring buffer and older
+        ones are spilled to a JSON-lines file. Use this to watch many long-running tasks
+        from one process. If steps scrolled past the window between polls, the full step
+        list is streamed once at completion so the spill file is complete. The spill file
+        is kept after returning (see TaskSummary.discard_spill and SPILL_RETENTION).
+        
+        Args:
+            task_id: The task ID to monitor
+            poll_interval: How often to check for updates (in seconds)
+            show_steps: Whether to log each step's goal (at INFO level; if no logging is configured,
+                the default utils.log.configure_logging() setup is applied)
+            buffer_size: Steps kept in memory (also the window read per poll)
+            spill_dir: Directory for spill files (a temp directory by default, '' to drop old steps)
+            task_type: Task type whose ConfigManager limits apply
+            deadline: Seconds from the start of monitoring before the task is stopped
+            max_steps: Step budget
+            
+        Returns:
+            TaskSummary with status, output, step counts, recent steps and the spill file
+        """
+        limits = self.config_manager.get_limits_for_task_type(task_type)
+        deadline = deadline if deadline is not None else limits['deadline']
+        max_steps = max_steps if max_steps is not None else limits['max_steps']
+        buffer = StepBuffer(task_id, buffer_size, spill_dir)
+        started = time.monotonic()
+        started_at = time.time()
+        stop_reason = None
+        seen_steps = 0
+        missed_steps = 0
+        if show_steps:
+            ensure_logging()
+        log_steps = show_steps and logger.isEnabledFor(logging.INFO)
+        hub = get_event_hub()
+        since = hub.sequence
+        
+        while True:
+            details = self.client.get_task_details(task_id, fields=['status', 'output'], last_steps=buffer_size)
+            status = details.get('status')
+            steps = details.get('steps') or []
+            total = details.get('steps_total', len(steps))
+            if total > seen_steps:
+                # Steps are only ever appended; the window holds the last len(steps) of them
+                new_steps = steps[max(0, len(steps) - (total - seen_steps)):]
+                missed_steps += total - seen_steps - len(new_steps)
+                if log_steps:
+                    for step in new_steps:
+                        logger.info("Task %s step %s: %s", task_id, step.get('step', '?'),
+                                    step.get('next_goal', 'Processing...'), extra={'task_id': task_id})
+                buffer.extend(new_steps)
+                seen_steps = total
+            
+            if status in ['finished', 'failed', 'stopped']:
+                if missed_steps and buffer.spill_path:
+                    # Steps scrolled past between polls: stream the full list once so the spill file is complete
+                    try:
+                        buffer.rebuild(lambda add: self.client.get_task_details(
+                            task_id, fields=[], last_steps=buffer_size, on_step=add))
+                        missed_steps = 0
+                    except Exception as e:
+                        logger.warning("Could not re-read steps of task %s; %d steps missing from the summary: %s",
+                                       task_id, missed_steps, e, extra={'task_id': task_id})
+                return TaskSummary(task_id, status, output=details.get('output'), steps_total=total,
+                                   recent_steps=buffer.recent(),
+                                   spill_path=buffer.spill_path if buffer.spilled else None,
+                                   spilled_steps=buffer.spilled, missed_steps=missed_steps,
+                                   started_at=started_at, completed_at=time.time(), stop_reason=stop_reason)
+            
+            if stop_reason is None:
+                stop_reason = limit_exceeded(time.monotonic() - started, total, deadline, max_steps)
+                if stop_reason:
+                    self._stop_for_limit(task_id, stop_reason)
+                    continue
+            
+            timeout = self._next_poll_timeout(poll_interval, started, deadline, stop_reason)
+            _, since = hub.wait([task_id], since, timeout)
     
     def monitor_task_progress(self, task_id: str, show_steps: bool = True):
         """
@@ -64,41 +233,45 @@ class TaskMonitor:
         
         Args:
             task_id: The task ID to monitor
-            show_steps: Whether to show detailed steps
+            show_steps: Whether to log detailed steps (at INFO level; if no logging is configured,
+                the default utils.log.configure_logging() setup is applied)
             
         Returns:
             The complete task details once finished
         """
-        print(f"📊 Monitoring task: {task_id}")
+        if show_steps:
+            ensure_logging()
+        logger.info("Monitoring task: %s", task_id, extra={'task_id': task_id})
         
         count = 0
-        unique_steps = []
+        seen_steps = 0
         
         while True:
             try:
                 details = self.client.get_task_details(task_id)
                 status = details['status']
-                print(f"Status: {status} | Steps completed: {len(details.get('steps', []))}")
+                new_steps = details.get('steps', [])
+                logger.debug("Task %s status: %s | Steps completed: %d", task_id, status, len(new_steps),
+                             extra={'task_id': task_id, 'status': status, 'steps': len(new_steps)})
                 
                 if show_steps:
-                    new_steps = details.get('steps', [])
-                    if new_steps != unique_steps:
-                        for step in new_steps:
-                            if step not in unique_steps:
-                                print(f"📝 Step {step.get('step', '?')}: {step.get('next_goal', 'Processing...')}")
-                        unique_steps = new_steps
+                    for step in new_steps[seen_steps:]:
+                        logger.info("Task %s step %s: %s", task_id, step.get('step', '?'),
+                                    step.get('next_goal', 'Processing...'), extra={'task_id': task_id})
+                seen_steps = len(new_steps)
                 
                 if status in ['finished', 'failed', 'stopped']:
-                    print(f"🏁 Task {status}!")
+                    logger.info("Task %s %s", task_id, status, extra={'task_id': task_id, 'status': status})
                     if status == 'finished':
-                        print(f"📤 Output: {details.get('output', 'No output')}")
+                        logger.info("Task %s output: %s", task_id, details.get('output', 'No output'),
+                                    extra={'task_id': task_id})
                     return details
                     
                 count += 1
                 time.sleep(2)
                 
             except Exception as e:
-                print(f"❌ Error monitoring task: {e}")
+                logger.error("Error monitoring task %s: %s", task_id, e, extra={'task_id': task_id})
                 break
         
         return None
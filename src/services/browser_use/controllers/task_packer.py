@@ -0,0 +1,186 @@
+"""
+Task Packing for Browser Use API
+
+This module groups many small website analysis jobs into fewer browser tasks. Jobs
+with the same configuration (including allowed domains) are packed up to `pack_size`
+URLs per task, with a combined structured-output schema (WebsiteAnalysisPack); each
+pack's output is split back into one result per URL. URLs missing from a pack's
+output, or whose record does not validate, and every URL of a pack that failed, are
+retried as single tasks.
+
+Usage:
+    packer = TaskPacker(pack_size=10)
+    results = packer.analyze_websites(urls)
+    for url, result in results.items():
+        print(url, result.status, result.output)
+"""
+import json
+import time
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+from pydantic import ValidationError
+
+from ..constants import get_base_url, get_api_key
+from ..controllers.batch_task_manager import BatchTaskManager
+from ..controllers.specialized_task_creator import WEBSITE_ANALYSIS_INSTRUCTIONS
+from ..models.models import WebsiteAnalysis, WebsiteAnalysisPack
+from ..models.records import TaskResult
+from ..utils.config import ConfigManager
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+PACKED_INSTRUCTIONS = (
+    "Analyze each of the following websites in turn:\n{urls}\n"
+    "For every website, provide its url exactly as listed, title, meta description, main content summary, "
+    "count of links and images, estimated load time, and accessibility score (1-100). "
+    "Return one entry per website in 'analyses'."
+)
+
+
+def _normalize_url(url: str) -> str:
+    url = (url or '').strip().lower()
+    for prefix in ('https://', 'http://'):
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+
+class TaskPacker:
+    """Run website analyses packed several URLs per task, falling back to single tasks"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 pack_size: int = 10, concurrency: int = 8, poll_interval: float = 5,
+                 config_manager: Optional[ConfigManager] = None):
+        """
+        Args:
+            pack_size: Maximum URLs per packed task (1 disables packing)
+            concurrency: Maximum tasks in flight
+            poll_interval: Seconds between status sweeps
+            config_manager: Source of task type settings (a default ConfigManager if not given)
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.config_manager = config_manager or ConfigManager()
+        self.batch_manager = BatchTaskManager(self.base_url, self.api_key, self.config_manager)
+        self.pack_size = pack_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stats = {'jobs': 0, 'packed_tasks': 0, 'single_tasks': 0, 'fallbacks': 0}
+
+    def pack(self, jobs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group jobs into packs of compatible configuration
+
+        Args:
+            jobs: Job dictionaries with 'url' and optional task parameters
+
+        Returns:
+            Lists of jobs, each at most pack_size long, sharing one configuration
+        """
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for job in jobs:
+            config = {key: value for key, value in job.items() if key != 'url'}
+            groups.setdefault(json.dumps(config, sort_keys=True, default=str), []).append(job)
+        size = max(1, self.pack_size)
+        return [group[i:i + size] for group in groups.values() for i in range(0, len(group), size)]
+
+    def analyze_websites(self, jobs: List[Union[str, Dict[str, Any]]], **kwargs) -> Dict[str, TaskResult]:
+        """
+        Analyze many websites
+
+        Args:
+            jobs: URLs, or dictionaries with 'url' and per-job task parameters
+            **kwargs: Task parameters shared by all jobs
+
+        Returns:
+            Dictionary of URL to TaskResult; a finished result's output is the URL's
+            WebsiteAnalysis as a JSON string, as a single analysis task would return it
+        """
+        jobs = [{**kwargs, **({'url': job} if isinstance(job, str) else job)} for job in jobs]
+        self.stats['jobs'] += len(jobs)
+        packs = self.pack(jobs)
+        results: Dict[str, TaskResult] = {}
+        retry: List[Dict[str, Any]] = []
+
+        packed = [pack for pack in packs if len(pack) > 1]
+        singles = [pack[0] for pack in packs if len(pack) == 1]
+        if packed:
+            configs = [self._pack_config(pack) for pack in packed]
+            self.stats['packed_tasks'] += len(configs)
+            batch = self.batch_manager.run_batch(configs, concurrency=self.concurrency,
+                                                 poll_interval=self.poll_interval)
+            for index, pack in enumerate(packed):
+                split, missing = self._split(pack, batch.get(index))
+                results.update(split)
+                retry.extend(missing)
+            if retry:
+                logger.info("Retrying %d of %d packed jobs as single tasks", len(retry), sum(map(len, packed)))
+                self.stats['fallbacks'] += len(retry)
+
+        singles.extend(retry)
+        if singles:
+            self.stats['single_tasks'] += len(singles)
+            batch = self.batch_manager.run_batch([self._single_config(job) for job in singles],
+                                                 concurrency=self.concurrency, poll_interval=self.poll_interval)
+            for index, job in enumerate(singles):
+                results[job['url']] = batch.get(index) or TaskResult(None, 'error', name=job['url'])
+        return results
+
+    def _base_config(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        config = self.config_manager.get_config_for_task_type('web_scraping')
+        config.update({key: value for key, value in job.items() if key != 'url'})
+        return config
+
+    def _pack_config(self, pack: List[Dict[str, Any]]) -> Dict[str, Any]:
+        urls = '\n'.join(f"- {job['url']}" for job in pack)
+        return {
+            **self._base_config(pack[0]),
+            'instructions': PACKED_INSTRUCTIONS.format(urls=urls),
+            'structured_output_json': json.dumps(WebsiteAnalysisPack.model_json_schema())
+        }
+
+    def _single_config(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **self._base_config(job),
+            'instructions': WEBSITE_ANALYSIS_INSTRUCTIONS.format(url=job['url']),
+            'structured_output_json': json.dumps(WebsiteAnalysis.model_json_schema())
+        }
+
+    def _split(self, pack: List[Dict[str, Any]],
+               result: Optional[TaskResult]) -> Tuple[Dict[str, TaskResult], List[Dict[str, Any]]]:
+        """Per-URL results from a pack's output, and the jobs that need a single task"""
+        if result is None or result.status != 'finished':
+            return {}, list(pack)
+        try:
+            output = result.output
+            analyses = (json.loads(output) if isinstance(output, (str, bytes)) else output or {}).get('analyses')
+        except (ValueError, AttributeError):
+            analyses = None
+        if not isinstance(analyses, list):
+            logger.warning("Packed task %s returned no analyses", result.task_id, extra={'task_id': result.task_id})
+            return {}, list(pack)
+
+        by_url = {}
+        for item in analyses:
+            if isinstance(item, dict):
+                by_url.setdefault(_normalize_url(str(item.get('url', ''))), item)
+
+        split: Dict[str, TaskResult] = {}
+        missing: List[Dict[str, Any]] = []
+        for job in pack:
+            item = by_url.get(_normalize_url(job['url']))
+            try:
+                analysis = WebsiteAnalysis.model_validate(item)
+            except ValidationError:
+                missing.append(job)
+                continue
+            split[job['url']] = TaskResult(result.task_id, 'finished', output=analysis.model_dump_json(),
+                                           name=job['url'], completed_at=result.completed_at or time.time())
+        return split, missing
@@ -0,0 +1,304 @@
+"""
+Workflow Engine for Browser Use API
+
+This module provides DAG workflows of chained browser tasks. Each node is a task
+template: either instructions (a format string or a callable) or one of the
+SpecializedTaskCreator presets. A node receives the validated outputs of the nodes it
+depends on, can fan out into one task per item of an upstream list, and runs as soon
+as its dependencies are done, so independent branches run concurrently.
+
+Node results are memoized by a key built from the rendered task specs, so a rerun only
+recomputes nodes whose inputs changed or that were explicitly invalidated.
+
+Usage:
+    workflow = Workflow(cache_dir='.workflow_cache')
+    workflow.add_node('news', preset='news_collection', args={'topic': 'laptops'})
+    workflow.add_node('articles', depends_on=['news'], output_model='website_analysis',
+                      for_each=lambda inputs: inputs['news']['articles'],
+                      instructions=lambda ctx: f"Analyze the article '{ctx['item']['title']}'")
+    results = workflow.run()
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, Optional, List, Callable, Union, Type
+
+from pydantic import BaseModel
+
+from ..constants import get_base_url, get_api_key
+from ..api.client import BrowserUseClient
+from ..controllers.specialized_task_creator import SpecializedTaskCreator
+from ..utils.result_parser import ResultParser
+from ..utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Preset name -> (SpecializedTaskCreator method, output type)
+PRESETS = {
+    'website_analysis': ('create_website_analysis_task', 'website_analysis'),
+    'price_comparison': ('create_price_comparison_task', 'price_comparison'),
+    'news_collection': ('create_news_collection_task', 'news_collection'),
+}
+
+Template = Union[str, Callable[[Dict[str, Any]], str]]
+
+
+def _render_text(template: Template, context: Dict[str, Any]) -> str:
+    if callable(template):
+        return template(context)
+    # Non-string inputs are substituted as JSON
+    values = {k: v if isinstance(v, str) else json.dumps(v, default=str) for k, v in context.items()}
+    return template.format_map(values)
+
+
+class WorkflowNode:
+    """A task template in a workflow"""
+
+    def __init__(self, name: str, instructions: Optional[Template] = None, preset: Optional[str] = None,
+                 args: Optional[Union[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]] = None,
+                 depends_on: Optional[List[str]] = None,
+                 for_each: Optional[Callable[[Dict[str, Any]], List[Any]]] = None,
+                 output_model: Optional[Union[str, Type[BaseModel]]] = None, version: int = 0, **config):
+        """
+        Args:
+            name: Unique node name; downstream nodes see this node's output under it
+            instructions: Format string over the inputs (e.g. "Summarize {news}") or callable(context) -> str
+            preset: SpecializedTaskCreator preset ('website_analysis', 'price_comparison', 'news_collection')
+            args: Preset arguments, as a dict (callable values are called with the context) or callable(context)
+            depends_on: Names of nodes whose outputs this node needs
+            for_each: Callable(inputs) -> items; runs one task per item, exposed to templates as 'item'
+            output_model: Output type name or model to validate and structure the output with
+            version: Bump to invalidate memoized results after changing the template
+            **config: Additional task parameters
+        """
+        if (instructions is None) == (preset is None):
+            raise ValueError(f"Node {name} needs exactly one of instructions or preset")
+        if preset is not None and preset not in PRESETS:
+            raise ValueError(f"Unknown preset for node {name}: {preset}")
+        self.name = name
+        self.instructions = instructions
+        self.preset = preset
+        self.args = args or {}
+        self.depends_on = list(depends_on or [])
+        self.for_each = for_each
+        self.output_model = output_model or (PRESETS[preset][1] if preset else None)
+        self.version = version
+        self.config = config
+
+    def render(self, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build the task specs for the given upstream outputs, one per fan-out item"""
+        items = list(self.for_each(inputs)) if self.for_each else [None]
+        specs = []
+        for item in items:
+            context = {**inputs, 'item': item} if self.for_each else dict(inputs)
+            if self.preset:
+                if callable(self.args):
+                    args = self.args(context)
+                else:
+                    args = {k: v(context) if callable(v) else v for k, v in self.args.items()}
+                specs.append({'preset': self.preset, 'args': args, 'config': self.config})
+            else:
+                specs.append({'instructions': _render_text(self.instructions, context), 'config': self.config})
+        return specs
+
+
+class NodeResult:
+    """Outcome of a workflow node"""
+
+    __slots__ = ('name', 'status', 'output', 'task_ids', 'cached', 'error')
+
+    def __init__(self, name: str, status: str, output: Any = None, task_ids: Optional[List[str]] = None,
+                 cached: bool = False, error: Optional[str] = None):
+        self.name = name
+        self.status = status  # finished, failed or skipped
+        self.output = output
+        self.task_ids = task_ids or []
+        self.cached = cached
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"NodeResult({self.name!r}, {self.status!r}, cached={self.cached})"
+
+
+class Workflow:
+    """Run a DAG of browser tasks with concurrent branches and memoized nodes"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 cache_dir: Optional[str] = None, concurrency: int = 8, poll_interval: float = 5):
+        """
+        Args:
+            cache_dir: Directory for memoized node results (in-memory only if None)
+            concurrency: Maximum number of tasks running at once across all nodes
+            poll_interval: Seconds between status checks
+        """
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.client = BrowserUseClient(self.base_url, self.api_key)
+        self.creator = SpecializedTaskCreator(self.base_url, self.api_key)
+        self.parser = ResultParser()
+        self.cache_dir = cache_dir
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.nodes: Dict[str, WorkflowNode] = {}
+        self._memo: Dict[str, Dict[str, Any]] = {}
+        self._slots = threading.BoundedSemaphore(concurrency)
+
+    def add_node(self, name: str, **kwargs) -> WorkflowNode:
+        """Add a node (see WorkflowNode for arguments)"""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate node: {name}")
+        node = WorkflowNode(name, **kwargs)
+        self.nodes[name] = node
+        return node
+
+    def order(self) -> List[str]:
+        """Node names in dependency order; raises ValueError on unknown dependencies or cycles"""
+        ordered: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Workflow cycle: {' -> '.join(path + [name])}")
+            if name not in self.nodes:
+                raise ValueError(f"Unknown dependency: {name} (required by {path[-1]})")
+            state[name] = 'visiting'
+            for dependency in self.nodes[name].depends_on:
+                visit(dependency, path + [name])
+            state[name] = 'done'
+            ordered.append(name)
+
+        for name in self.nodes:
+            visit(name, [])
+        return ordered
+
+    def run(self, invalidate: Optional[List[str]] = None) -> Dict[str, NodeResult]:
+        """
+        Run the workflow
+
+        Args:
+            invalidate: Node names to recompute even if memoized (downstream nodes are
+                recomputed only if their inputs change as a result)
+
+        Returns:
+            Dictionary of node name to NodeResult
+        """
+        order = self.order()
+        invalidate = set(invalidate or ())
+        results: Dict[str, NodeResult] = {}
+        started: Dict[Any, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, len(order))) as executor:
+            while len(results) < len(order):
+                for name in order:
+                    node = self.nodes[name]
+                    if name in results or name in started.values():
+                        continue
+                    if not all(d in results for d in node.depends_on):
+                        continue
+                    failed = [d for d in node.depends_on if results[d].status != 'finished']
+                    if failed:
+                        results[name] = NodeResult(name, 'skipped', error=f"Upstream failed: {', '.join(failed)}")
+                        logger.warning("Skipping node %s: upstream %s failed", name, ', '.join(failed))
+                        continue
+                    inputs = {d: results[d].output for d in node.depends_on}
+                    started[executor.submit(self._run_node, node, inputs, name in invalidate)] = name
+                if not started:
+                    continue
+                done, _ = wait(list(started), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = started.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error("Node %s failed: %s", name, e)
+                        results[name] = NodeResult(name, 'failed', error=str(e))
+
+        return {name: results[name] for name in order}
+
+    # Node execution
+
+    def _run_node(self, node: WorkflowNode, inputs: Dict[str, Any], force: bool) -> NodeResult:
+        specs = node.render(inputs)
+        model_name = getattr(node.output_model, '__name__', node.output_model)
+        key = hashlib.sha256(json.dumps([node.name, node.version, model_name, specs],
+                                        sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+        if not force:
+            cached = self._cache_get(key)
+            if cached is not None:
+                logger.info("Node %s: using memoized result", node.name)
+                return NodeResult(node.name, 'finished', cached['output'], cached['task_ids'], cached=True)
+
+        logger.info("Node %s: running %d task(s)", node.name, len(specs))
+        with ThreadPoolExecutor(max_workers=max(1, min(len(specs), self.concurrency))) as executor:
+            outcomes = list(executor.map(lambda spec: self._run_spec(node, spec), specs))
+
+        task_ids = [task_id for task_id, _, _ in outcomes if task_id]
+        errors = [error for _, _, error in outcomes if error]
+        if errors:
+            return NodeResult(node.name, 'failed', task_ids=task_ids, error='; '.join(errors))
+
+        outputs = [output for _, output, _ in outcomes]
+        output = outputs if node.for_each else outputs[0]
+        self._cache_put(key, {'output': output, 'task_ids': task_ids})
+        logger.info("Node %s finished", node.name)
+        return NodeResult(node.name, 'finished', output, task_ids)
+
+    def _run_spec(self, node: WorkflowNode, spec: Dict[str, Any]):
+        """Create one task, wait for it and validate its output; returns (task_id, output, error)"""
+        task_id = None
+        with self._slots:
+            try:
+                if 'preset' in spec:
+                    method = getattr(self.creator, PRESETS[spec['preset']][0])
+                    task_id = method(**spec['args'], **spec['config'])
+                elif node.output_model is not None:
+                    schema = self.parser.get_model(node.output_model).model_json_schema()
+                    task_id = self.client.create_structured_task(spec['instructions'], schema, **spec['config'])
+                else:
+                    task_id = self.client.create_task(spec['instructions'], **spec['config'])
+
+                while True:
+                    status = self.client.get_task_status(task_id)
+                    if status in ['finished', 'failed', 'stopped']:
+                        break
+                    time.sleep(self.poll_interval)
+                if status != 'finished':
+                    return task_id, None, f"Task {task_id} {status}"
+
+                output = self.client.get_task_details(task_id, fields=['output']).get('output')
+                if node.output_model is not None:
+                    output = self.parser.parse(output, node.output_model).model_dump(mode='json')
+                return task_id, output, None
+            except Exception as e:
+                return task_id, None, f"{type(e).__name__}: {e}"
+
+    # Memoization
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if key in self._memo:
+            return self._memo[key]
+        if self.cache_dir:
+            try:
+                with open(os.path.join(self.cache_dir, f"{key}.json"), encoding='utf-8') as f:
+                    self._memo[key] = json.load(f)
+                    return self._memo[key]
+            except (OSError, ValueError):
+                return None
+        return None
+
+    def _cache_put(self, key: str, entry: Dict[str, Any]):
+        self._memo[key] = entry
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, f"{key}.json"), 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=str)
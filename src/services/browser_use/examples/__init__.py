@@ -1,5 +1,13 @@
 """
 Examples for Browser Use API
 """
-from .examples import BrowserUseExamples
-from .account_examples import check_account_balance, get_account_details, get_usage_history
+from .._lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'BrowserUseExamples': '.examples',
+    'check_account_balance': '.account_examples',
+    'get_account_details': '.account_examples',
+    'get_usage_history': '.account_examples',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
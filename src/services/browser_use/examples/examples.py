@@ -6,7 +6,7 @@ This module provides example functions demonstrating Browser Use API capabilitie
 import time
 from typing import Dict, Any, Optional
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key
 from ..api.client import BrowserUseClient
 from ..controllers.task_controller import TaskController
 from ..controllers.task_monitor import TaskMonitor
@@ -15,14 +15,15 @@ from ..controllers.task_manager import TaskManager
 from ..controllers.batch_task_manager import BatchTaskManager
 from ..controllers.specialized_task_creator import SpecializedTaskCreator
 from ..utils.validation import ValidationUtils
+from ..utils.log import configure_logging
 from ..models.models import SocialMediaCompanies
 
 class BrowserUseExamples:
     """Example functions demonstrating Browser Use API capabilities"""
     
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
-        self.base_url = base_url or BASE_URL
-        self.api_key = api_key or API_KEY
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
         self.client = BrowserUseClient(self.base_url, self.api_key)
         self.controller = TaskController(self.base_url, self.api_key)
         self.monitor = TaskMonitor(self.base_url, self.api_key)
@@ -116,6 +117,9 @@ class BrowserUseExamples:
         print("🚀 Browser Use API Demo Suite")
         print("=" * 50)
         
+        # Show task progress logged by the managers
+        configure_logging()
+        
         # Validate API connection first
         if not ValidationUtils.validate_api_connection():
             print("❌ API validation failed. Please check your API key and connection.")
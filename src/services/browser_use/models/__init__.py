@@ -1,9 +1,20 @@
 """
 Models for Browser Use API
 """
-from .models import (
-    SocialMediaCompany, SocialMediaCompanies,
-    WebsiteAnalysis, PriceComparison,
-    PriceComparisonResults, NewsArticle,
-    NewsCollection
-)
+from .._lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'SocialMediaCompany': '.models',
+    'SocialMediaCompanies': '.models',
+    'WebsiteAnalysis': '.models',
+    'PackedWebsiteAnalysis': '.models',
+    'WebsiteAnalysisPack': '.models',
+    'PriceComparison': '.models',
+    'PriceComparisonResults': '.models',
+    'NewsArticle': '.models',
+    'NewsCollection': '.models',
+    'TaskResult': '.records',
+    'TaskSummary': '.records',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
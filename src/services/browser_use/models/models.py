@@ -27,6 +27,14 @@ class WebsiteAnalysis(BaseModel):
     accessibility_score: int
 
 
+class PackedWebsiteAnalysis(WebsiteAnalysis):
+    url: str
+
+
+class WebsiteAnalysisPack(BaseModel):
+    analyses: List[PackedWebsiteAnalysis]
+
+
 class PriceComparison(BaseModel):
     product_name: str
     price: float
@@ -0,0 +1,154 @@
+"""
+Compact Task Records for Browser Use API
+
+This module contains lightweight typed records for task results and summaries.
+Unlike the raw JSON dictionaries returned by the API they use __slots__ and intern
+strings that repeat across tasks (statuses, task names).
+"""
+import json
+import os
+import sys
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, List, Iterator
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class TaskResult(Mapping):
+    """
+    Compact record of a completed task
+
+    A Mapping over its fields (result['status'], result.get('output'), dict(result),
+    **result) so it can replace the per-task dictionaries previously kept by TaskManager
+    and BatchTaskManager. Use to_dict() where a real dict is required, e.g. json.dumps.
+    """
+
+    __slots__ = ('task_id', 'name', 'status', 'output', 'instructions',
+                 'created_at', 'completed_at', 'parsed', 'validation_error')
+
+    # Dictionary keys used by older code mapped to slot names
+    _ALIASES = {'id': 'task_id', 'final_status': 'status'}
+
+    def __init__(self, task_id: str, status: str, output: Any = None, name: Optional[str] = None,
+                 instructions: Optional[str] = None, created_at: Optional[float] = None,
+                 completed_at: Optional[float] = None):
+        self.task_id = task_id
+        self.name = _intern(name)
+        self.status = _intern(status)
+        self.output = output
+        self.instructions = instructions
+        self.created_at = created_at
+        self.completed_at = completed_at
+        self.parsed = None
+        self.validation_error = None
+
+    @classmethod
+    def from_task_info(cls, task_info: Dict[str, Any]) -> 'TaskResult':
+        """Build a record from a TaskManager tracking dictionary"""
+        return cls(
+            task_id=task_info['id'],
+            status=task_info.get('final_status'),
+            output=task_info.get('output'),
+            name=task_info.get('name'),
+            instructions=task_info.get('instructions'),
+            created_at=task_info.get('created_at'),
+            completed_at=task_info.get('completed_at')
+        )
+
+    def _slot(self, key: str) -> str:
+        key = self._ALIASES.get(key, key)
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return key
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, self._slot(key))
+
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, self._slot(key), value)
+
+    def __contains__(self, key: str) -> bool:
+        return self._ALIASES.get(key, key) in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style get"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a plain dictionary"""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"TaskResult(task_id={self.task_id!r}, status={self.status!r})"
+
+
+class TaskSummary:
+    """
+    Bounded summary of a monitored task
+
+    Returned by TaskMonitor.wait_for_summary instead of the full details payload: only
+    the most recent steps are held in memory, older ones are in the spill file.
+    """
+
+    __slots__ = ('task_id', 'status', 'output', 'steps_total', 'recent_steps', 'spill_path',
+                 'spilled_steps', 'missed_steps', 'started_at', 'completed_at', 'stop_reason')
+
+    def __init__(self, task_id: str, status: str, output: Any = None, steps_total: int = 0,
+                 recent_steps: Optional[List[Dict[str, Any]]] = None, spill_path: Optional[str] = None,
+                 spilled_steps: int = 0, missed_steps: int = 0, started_at: Optional[float] = None,
+                 completed_at: Optional[float] = None, stop_reason: Optional[str] = None):
+        self.task_id = task_id
+        self.status = _intern(status)
+        self.output = output
+        self.steps_total = steps_total
+        self.recent_steps = recent_steps or []
+        self.spill_path = spill_path
+        self.spilled_steps = spilled_steps
+        # Steps that arrived and scrolled out of the polled window between two polls
+        self.missed_steps = missed_steps
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.stop_reason = stop_reason
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return self.completed_at - self.started_at
+
+    def iter_steps(self) -> Iterator[Dict[str, Any]]:
+        """All observed steps in order: spilled steps from disk, then the recent ones"""
+        if self.spill_path and self.spilled_steps:
+            with open(self.spill_path, encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+        yield from self.recent_steps
+
+    def discard_spill(self):
+        """Delete the spill file; iter_steps() then yields only the recent steps"""
+        if self.spill_path:
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+        self.spill_path = None
+        self.spilled_steps = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the summary to a plain dictionary"""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"TaskSummary(task_id={self.task_id!r}, status={self.status!r}, steps_total={self.steps_total})"
@@ -0,0 +1,188 @@
+"""
+Pytest Plugin for Browser Use API
+
+This module runs browser-task test cases as remote Browser Use tasks. Tests marked
+with `browser_task` are all submitted when collection finishes, at most
+TEST_PARALLEL_WORKERS at a time, and watched by one shared poller
+(BatchTaskManager.run_batch). Tasks still running after TEST_TIMEOUT (milliseconds)
+are stopped. Submission order is longest-first by each test's historical duration,
+kept in the pytest cache, so slow tests do not end up running last.
+
+Once the package is installed, the plugin is registered through the pytest11 entry
+point (as weblens.pytest_plugin); otherwise enable it with `-p weblens.pytest_plugin`.
+
+Usage:
+    @pytest.mark.browser_task("Open example.com and return the page title", llm_model='gpt-4o')
+    def test_title(browser_task):
+        assert 'Example' in browser_task.output
+
+The `browser_task` fixture waits for the test's task and returns its TaskResult; the
+test fails if the task did not finish.
+"""
+import math
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+import pytest
+
+from .constants import load_environment
+from .controllers.batch_task_manager import BatchTaskManager
+from .models.records import TaskResult
+from .utils.history import TaskHistory
+from .utils.log import get_logger
+
+logger = get_logger(__name__)
+
+MARKER = 'browser_task'
+DEFAULT_WORKERS = 3
+DEFAULT_TIMEOUT_MS = 30000
+
+_runner_key = pytest.StashKey['BrowserTaskRunner']()
+
+
+class BrowserTaskRunner:
+    """Run the tasks of marked tests in the background and hand results to their fixtures"""
+
+    def __init__(self, items: List[pytest.Item], workers: int, timeout: Optional[float],
+                 poll_interval: float, history: TaskHistory):
+        self.items = items
+        self.workers = workers
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.history = history
+        self.results: Dict[str, TaskResult] = {}
+        self._events = {item.nodeid: threading.Event() for item in items}
+        self._submitted: Dict[int, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='browser-use-pytest', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop in-flight tasks (if any) and wait for the runner to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _configs(self) -> List[Dict[str, Any]]:
+        configs = []
+        for item in self.items:
+            marker = item.get_closest_marker(MARKER)
+            config = dict(marker.kwargs)
+            config['instructions'] = marker.args[0] if marker.args else config.pop('instructions')
+            if self.timeout is not None:
+                config.setdefault('deadline', self.timeout)
+            configs.append(config)
+        return configs
+
+    def _run(self):
+        def on_submit(index: int, task_id: str):
+            self._submitted[index] = time.monotonic()
+
+        def on_complete(index: int, result: TaskResult):
+            nodeid = self.items[index].nodeid
+            if index in self._submitted:
+                self.history.record(nodeid, time.monotonic() - self._submitted[index], result.status)
+            self.results[nodeid] = result
+            self._events[nodeid].set()
+
+        try:
+            BatchTaskManager().run_batch(self._configs(), concurrency=self.workers, poll_interval=self.poll_interval,
+                                         on_submit=on_submit, on_complete=on_complete, stop_event=self._stop)
+        except Exception as e:
+            logger.error("Browser task runner failed: %s", e)
+            for item in self.items:
+                self.results.setdefault(item.nodeid, TaskResult(None, 'error', output=str(e)))
+        finally:
+            for event in self._events.values():
+                event.set()
+
+    def has(self, nodeid: str) -> bool:
+        """Whether the test's task is run by this runner"""
+        return nodeid in self._events
+
+    def wait(self, nodeid: str) -> Optional[TaskResult]:
+        self._events[nodeid].wait()
+        return self.results.get(nodeid)
+
+
+def _history(config: pytest.Config) -> TaskHistory:
+    """Duration history kept in the pytest cache (in memory only with -p no:cacheprovider)"""
+    if not getattr(config, 'cache', None):
+        return TaskHistory()
+    return TaskHistory(os.path.join(str(config.cache.mkdir('browser_use')), 'durations.json'))
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup('browser_use', 'Browser Use tasks')
+    group.addoption('--browser-workers', type=int, default=None,
+                    help=f"Browser tasks run concurrently (default: TEST_PARALLEL_WORKERS or {DEFAULT_WORKERS})")
+    group.addoption('--browser-timeout', type=float, default=None,
+                    help="Per-task timeout in milliseconds, 0 for none "
+                         f"(default: TEST_TIMEOUT or {DEFAULT_TIMEOUT_MS})")
+    group.addoption('--browser-poll-interval', type=float, default=2.0, help="Seconds between status sweeps")
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line('markers', f"{MARKER}(instructions, **params): run the test's task on Browser Use")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]):
+    """Move browser tests to the front, longest expected duration first"""
+    marked = [item for item in items if item.get_closest_marker(MARKER)]
+    if not marked or not getattr(config, 'cache', None):
+        return
+    history = _history(config)
+
+    def expected(item: pytest.Item) -> float:
+        # Tests without history go first, since they may be the slowest
+        median = history.percentile(item.nodeid, 50, status=None)
+        return math.inf if median is None else median
+
+    marked.sort(key=expected, reverse=True)
+    others = [item for item in items if not item.get_closest_marker(MARKER)]
+    items[:] = marked + others
+
+
+def pytest_collection_finish(session: pytest.Session):
+    config = session.config
+    marked = [item for item in session.items if item.get_closest_marker(MARKER)]
+    if not marked or config.option.collectonly:
+        return
+    load_environment()
+    workers = config.getoption('browser_workers') or int(os.getenv('TEST_PARALLEL_WORKERS', DEFAULT_WORKERS))
+    timeout_ms = config.getoption('browser_timeout')
+    if timeout_ms is None:
+        timeout_ms = float(os.getenv('TEST_TIMEOUT', DEFAULT_TIMEOUT_MS))
+    runner = BrowserTaskRunner(marked, workers, timeout_ms / 1000 if timeout_ms else None,
+                               config.getoption('browser_poll_interval'), _history(config))
+    config.stash[_runner_key] = runner
+    runner.start()
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    runner = session.config.stash.get(_runner_key, None)
+    if runner is not None:
+        runner.stop()
+        runner.history.flush()
+
+
+@pytest.fixture
+def browser_task(request: pytest.FixtureRequest) -> TaskResult:
+    """Result of the task declared by this test's browser_task marker"""
+    runner = request.config.stash.get(_runner_key, None)
+    if runner is None or not runner.has(request.node.nodeid):
+        pytest.fail(f"{request.node.nodeid} needs a @pytest.mark.{MARKER}(instructions) marker")
+    result = runner.wait(request.node.nodeid)
+    if result is None:
+        pytest.fail("Browser task was not run (session interrupted)")
+    if result.status == 'stopped' and runner.timeout is not None:
+        pytest.fail(f"Browser task {result.task_id} stopped (timeout {runner.timeout:g}s)")
+    if result.status != 'finished':
+        pytest.fail(f"Browser task {result.task_id} ended with status {result.status}: {result.output}")
+    return result
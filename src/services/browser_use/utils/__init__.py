@@ -1,6 +1,28 @@
 """
 Utility functions for Browser Use API
 """
-from .config import ConfigManager
-from .validation import ValidationUtils
-from .helpers import print_api_help, print_refactored_api_help
+from .._lazy import lazy_attributes
+
+_LAZY_ATTRIBUTES = {
+    'ConfigManager': '.config',
+    'ValidationUtils': '.validation',
+    'print_api_help': '.helpers',
+    'print_refactored_api_help': '.helpers',
+    'ResultParser': '.result_parser',
+    'OUTPUT_MODELS': '.result_parser',
+    'Metrics': '.metrics',
+    'get_metrics': '.metrics',
+    'start_metrics_server': '.metrics',
+    'configure_logging': '.log',
+    'ensure_logging': '.log',
+    'get_logger': '.log',
+    'HealthProbe': '.health',
+    'TaskHistory': '.history',
+    'RateLimiter': '.rate_limit',
+    'DedupeIndex': '.dedupe',
+    'StepArchive': '.step_archive',
+    'StepBuffer': '.step_buffer',
+    'ConfigOptimizer': '.config_optimizer',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_ATTRIBUTES)
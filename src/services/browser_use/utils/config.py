@@ -5,14 +5,23 @@ This module provides configuration management functionality for Browser Use API.
 """
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key, load_environment, DEFAULT_API_KEY
+
+if TYPE_CHECKING:
+    from .config_optimizer import ConfigOptimizer
 
 class ConfigManager:
     """Configuration management for Browser Use API"""
     
-    def __init__(self):
+    def __init__(self, optimizer: Optional['ConfigOptimizer'] = None):
+        """
+        Args:
+            optimizer: Optional ConfigOptimizer that picks settings per task type from past results;
+                BatchTaskManager.run_batch consults it for entries with a task_type and records their outcome
+        """
+        self.optimizer = optimizer
         self.default_config = {
             'llm_model': 'gpt-4o',
             'use_adblock': True,
@@ -21,9 +30,16 @@ class ConfigManager:
             'highlight_elements': False,
             'save_browser_data': False
         }
+        # Run limits enforced while monitoring: deadline in seconds from the start of monitoring (submission,
+        # for tasks run_batch creates), max_steps in agent steps
+        self.default_limits = {
+            'deadline': None,
+            'max_steps': None
+        }
+        self.task_limits: Dict[str, Dict[str, Optional[float]]] = {}
     
     def get_config_for_task_type(self, task_type: str) -> Dict[str, Any]:
-        """Get optimized configuration for different task types"""
+        """Get optimized configuration for different task types (static; the optimizer is not consulted)"""
         configs = {
             'web_scraping': {
                 **self.default_config,
@@ -51,9 +67,32 @@ class ConfigManager:
         
         return configs.get(task_type, self.default_config)
     
+    def record_result(self, task_type: str, config: Dict[str, Any], duration: float, status: str,
+                      steps: Optional[int] = None):
+        """Report a completed task to the optimizer (no-op without one)"""
+        if self.optimizer is not None:
+            self.optimizer.record(task_type, config, duration, status, steps=steps)
+    
+    def get_limits_for_task_type(self, task_type: Optional[str]) -> Dict[str, Optional[float]]:
+        """Get the deadline and max-step budget for a task type (None means unlimited)"""
+        return {**self.default_limits, **self.task_limits.get(task_type, {})}
+    
+    def set_limits_for_task_type(self, task_type: str, deadline: Optional[float] = None,
+                                 max_steps: Optional[int] = None):
+        """
+        Set run limits for a task type
+        
+        Args:
+            task_type: Task type the limits apply to
+            deadline: Seconds from the start of monitoring before the task is stopped
+            max_steps: Number of agent steps after which the task is stopped
+        """
+        self.task_limits[task_type] = {'deadline': deadline, 'max_steps': max_steps}
+    
     def setup_environment(self):
         """Setup and validate environment for Browser Use API"""
         print("🔧 Setting up Browser Use API environment...")
+        load_environment()
         
         # Check for .env file
         env_file = ".env"
@@ -105,10 +144,11 @@ LOG_FILE=logs/testlens.log
     @staticmethod
     def get_api_info() -> Dict[str, Any]:
         """Get API configuration information"""
+        api_key = get_api_key()
         info = {
-            "base_url": BASE_URL,
-            "api_key_configured": API_KEY != "your_api_key_here" and bool(API_KEY),
-            "api_key_preview": f"{API_KEY[:10]}..." if API_KEY and API_KEY != "your_api_key_here" else "Not configured"
+            "base_url": get_base_url(),
+            "api_key_configured": api_key != DEFAULT_API_KEY and bool(api_key),
+            "api_key_preview": f"{api_key[:10]}..." if api_key and api_key != DEFAULT_API_KEY else "Not configured"
         }
         
         print("📊 API Configuration:")
@@ -0,0 +1,142 @@
+"""
+Configuration Optimizer for Browser Use API
+
+This module picks task settings (llm_model, use_proxy, use_adblock, ...) per task type
+from observed results. Each completed task is recorded in a TaskHistory with the
+settings it ran with, its duration and step count. select() then returns the
+fastest candidate whose success rate meets the target, and with a small probability
+(`exploration`) a less-sampled candidate instead, so estimates stay fresh. Until some
+candidate has enough successful runs, the least-run candidates are tried in turn.
+BatchTaskManager.run_batch selects settings for entries with a task_type and records
+their outcome; ConfigManager.get_config_for_task_type stays a static lookup.
+
+Usage:
+    optimizer = ConfigOptimizer(TaskHistory('config_history.json'),
+                                candidates={'llm_model': ['gpt-4o', 'gpt-4o-mini']})
+    manager = BatchTaskManager(config_manager=ConfigManager(optimizer=optimizer))
+    manager.run_batch([{'instructions': task, 'task_type': 'web_scraping'} for task in tasks])
+"""
+import itertools
+import json
+import random
+import statistics
+from typing import Dict, Any, Optional, List
+
+from .history import TaskHistory
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# Settings the optimizer chooses between unless other candidates are given
+DEFAULT_CANDIDATES: Dict[str, List[Any]] = {
+    'llm_model': ['gpt-4o', 'gpt-4o-mini'],
+    'use_proxy': [True, False],
+    'use_adblock': [True, False]
+}
+
+
+class ConfigOptimizer:
+    """Choose per-task-type settings from recorded duration and success history"""
+
+    def __init__(self, history: Optional[TaskHistory] = None, candidates: Optional[Dict[str, List[Any]]] = None,
+                 target_success_rate: float = 0.9, exploration: float = 0.05, min_samples: int = 5,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            history: Where samples are kept (in memory by default; pass a file-backed one to persist)
+            candidates: Setting name to the values to choose from
+            target_success_rate: Minimum share of 'finished' runs a candidate needs to be chosen
+            exploration: Probability of trying a candidate other than the current best
+            min_samples: Runs a candidate needs before its estimates are trusted
+            seed: Random seed for reproducible exploration
+        """
+        self.history = history if history is not None else TaskHistory()
+        self.candidates = candidates or DEFAULT_CANDIDATES
+        self.target_success_rate = target_success_rate
+        self.exploration = exploration
+        self.min_samples = min_samples
+        self._random = random.Random(seed)
+
+    def profiles(self) -> List[Dict[str, Any]]:
+        """Every combination of candidate values"""
+        names = list(self.candidates)
+        return [dict(zip(names, values)) for values in itertools.product(*(self.candidates[n] for n in names))]
+
+    def record(self, task_type: str, config: Dict[str, Any], duration: float, status: str,
+               steps: Optional[int] = None):
+        """
+        Record a completed task
+
+        Args:
+            task_type: Task type the task belongs to
+            config: Settings the task ran with (only candidate settings are kept)
+            duration: Seconds from submission to completion
+            status: Final task status
+            steps: Number of agent steps, if known
+        """
+        self.history.record(task_type, duration, status, profile=self._profile_key(config), steps=steps)
+
+    def stats(self, task_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-profile statistics for a task type
+
+        Returns:
+            Profile key (JSON of the settings) to runs, success_rate, median_duration and mean_steps
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for sample in self.history.samples(task_type):
+            if 'profile' in sample:
+                grouped.setdefault(sample['profile'], []).append(sample)
+
+        stats = {}
+        for key, samples in grouped.items():
+            finished = [s for s in samples if s['status'] == 'finished']
+            steps = [s['steps'] for s in finished if s.get('steps') is not None]
+            stats[key] = {
+                'runs': len(samples),
+                'success_rate': len(finished) / len(samples),
+                'median_duration': statistics.median(s['duration'] for s in finished) if finished else None,
+                'mean_steps': statistics.mean(steps) if steps else None
+            }
+        return stats
+
+    def best(self, task_type: str) -> Optional[Dict[str, Any]]:
+        """Fastest sufficiently sampled profile meeting the success target (fewer steps break ties), or None"""
+        eligible = [(s['median_duration'], s['mean_steps'] or 0, key) for key, s in self.stats(task_type).items()
+                    if s['runs'] >= self.min_samples and s['success_rate'] >= self.target_success_rate
+                    and s['median_duration'] is not None and key in self._known_keys()]
+        if not eligible:
+            return None
+        return json.loads(min(eligible)[2])
+
+    def select(self, task_type: str, base_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Configuration to run the next task of a type with
+
+        Args:
+            task_type: Task type
+            base_config: Static configuration the chosen settings are applied over
+
+        Returns:
+            base_config with the chosen candidate settings applied
+        """
+        best = self.best(task_type)
+        if best is None or self._random.random() < self.exploration:
+            profile = self._explore(task_type, best)
+            logger.debug("Exploring settings %s for task type %s", profile, task_type)
+        else:
+            profile = best
+        return {**base_config, **profile}
+
+    def _explore(self, task_type: str, best: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Least-run profile other than the best (ties broken at random)"""
+        runs = {key: s['runs'] for key, s in self.stats(task_type).items()}
+        options = [p for p in self.profiles() if p != best] or self.profiles()
+        fewest = min(runs.get(self._profile_key(p), 0) for p in options)
+        return self._random.choice([p for p in options if runs.get(self._profile_key(p), 0) == fewest])
+
+    def _known_keys(self) -> set:
+        return {self._profile_key(p) for p in self.profiles()}
+
+    def _profile_key(self, config: Dict[str, Any]) -> str:
+        return json.dumps({name: config.get(name) for name in self.candidates}, sort_keys=True)
@@ -0,0 +1,237 @@
+"""
+Incremental Deduplication for Browser Use API
+
+This module provides a persistent local index for recurring news and price collection
+runs. Each record is keyed by a hash of its identity (normalized title, URL and source
+for articles; product and store for prices) and stored with a digest of its content,
+so a run yields only records that are new or changed since earlier runs, plus price
+deltas. A Bloom filter in front of the SQLite store answers "never seen" without a
+lookup, which is the common case for fresh articles.
+
+Usage:
+    index = DedupeIndex('news.db')
+    result = index.news(task_output)
+    ingest(result.new + result.changed)
+"""
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, List, Iterable, Union
+
+from pydantic import BaseModel
+
+# Fields that identify a record; everything else counts as content
+NEWS_KEY_FIELDS = ('title', 'url', 'source')
+PRICE_KEY_FIELDS = ('product_name', 'store_name')
+DEFAULT_CAPACITY = 100000
+DEFAULT_ERROR_RATE = 0.01
+
+
+def normalize(value: Any) -> str:
+    """Lower-case, whitespace-collapsed text used for record identity"""
+    text = re.sub(r'\s+', ' ', str(value or '')).strip().lower()
+    # Scheme, "www." and trailing slashes do not make a URL different
+    return re.sub(r'^https?://(www\.)?', '', text).rstrip('/')
+
+
+def record_key(kind: str, record: Dict[str, Any], fields: Iterable[str]) -> str:
+    """Identity hash of a record from its normalized key fields"""
+    parts = [kind] + [normalize(record.get(field)) for field in fields]
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+
+def content_digest(record: Dict[str, Any]) -> str:
+    """Hash of a record's full content, ignoring case and whitespace differences in text"""
+    content = {field: normalize(value) if isinstance(value, str) else value for field, value in record.items()}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:32]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE,
+                 bits: Optional[bytes] = None):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits and len(bits) == (self.size + 7) // 8 else bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.sha256(key.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class DedupeResult:
+    """Outcome of indexing one run's records"""
+
+    def __init__(self):
+        self.new: List[Dict[str, Any]] = []
+        self.changed: List[Dict[str, Any]] = []
+        self.unchanged = 0
+        self.price_deltas: List[Dict[str, Any]] = []
+
+    @property
+    def emitted(self) -> List[Dict[str, Any]]:
+        """Records downstream systems need to ingest"""
+        return self.new + self.changed
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'new': len(self.new),
+            'changed': len(self.changed),
+            'unchanged': self.unchanged,
+            'price_deltas': len(self.price_deltas)
+        }
+
+    def __repr__(self) -> str:
+        return f"<DedupeResult {self.summary()}>"
+
+
+class DedupeIndex:
+    """Persistent index of seen news and price records"""
+
+    def __init__(self, path: str = ':memory:', capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE):
+        """
+        Args:
+            path: SQLite database file (':memory:' for a throwaway index)
+            capacity: Expected number of distinct records, used to size the Bloom filter
+            error_rate: Target false-positive rate of the Bloom filter
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                price REAL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value BLOB);
+        """)
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'bloom'").fetchone()
+        self.bloom = BloomFilter(capacity, error_rate, row[0] if row else None)
+        if row is None or len(row[0]) != len(self.bloom.bits):
+            # New index, or the filter was resized: rebuild it from the stored keys
+            for (key,) in self._db.execute("SELECT key FROM records"):
+                self.bloom.add(key)
+
+    def news(self, output: Any) -> DedupeResult:
+        """Index a news collection output (NewsCollection, dict, JSON string or list of articles)"""
+        return self.update('news', _records(output, 'articles'), NEWS_KEY_FIELDS)
+
+    def prices(self, output: Any) -> DedupeResult:
+        """Index a price comparison output; changed prices are also reported in price_deltas"""
+        return self.update('price', _records(output, 'products'), PRICE_KEY_FIELDS, price_field='price')
+
+    def update(self, kind: str, records: Iterable[Dict[str, Any]], key_fields: Iterable[str],
+               price_field: Optional[str] = None) -> DedupeResult:
+        """
+        Index records and return those not seen before or whose content changed
+
+        Args:
+            kind: Namespace of the records (e.g. 'news', 'price')
+            records: Records as dictionaries
+            key_fields: Fields forming the record identity
+            price_field: Numeric field whose changes are reported as deltas
+        """
+        key_fields = tuple(key_fields)
+        result = DedupeResult()
+        now = time.time()
+        seen_in_run = set()
+        with self._lock, self._db:
+            for record in records:
+                key = record_key(kind, record, key_fields)
+                if key in seen_in_run:
+                    continue
+                seen_in_run.add(key)
+                digest = content_digest(record)
+                price = _number(record.get(price_field)) if price_field else None
+
+                row = None
+                if key in self.bloom:
+                    row = self._db.execute("SELECT digest, price FROM records WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self._db.execute("INSERT INTO records VALUES (?, ?, ?, ?, ?, ?)",
+                                     (key, kind, digest, price, now, now))
+                    self.bloom.add(key)
+                    result.new.append(record)
+                    continue
+
+                old_digest, old_price = row
+                if old_digest == digest:
+                    self._db.execute("UPDATE records SET last_seen = ? WHERE key = ?", (now, key))
+                    result.unchanged += 1
+                    continue
+                self._db.execute("UPDATE records SET digest = ?, price = ?, last_seen = ? WHERE key = ?",
+                                 (digest, price, now, key))
+                result.changed.append(record)
+                if price is not None and old_price is not None and price != old_price:
+                    delta = {field: record.get(field) for field in key_fields}
+                    delta.update({
+                        'old_price': old_price,
+                        'new_price': price,
+                        'change': round(price - old_price, 6),
+                        'change_pct': round((price - old_price) / old_price * 100, 2) if old_price else None
+                    })
+                    result.price_deltas.append(delta)
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('bloom', ?)", (bytes(self.bloom.bits),))
+        return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def prune(self, older_than: float) -> int:
+        """
+        Forget records not seen for `older_than` seconds
+
+        The Bloom filter keeps their keys, so re-appearing records cost one lookup.
+
+        Returns:
+            Number of records removed
+        """
+        with self._lock, self._db:
+            return self._db.execute("DELETE FROM records WHERE last_seen < ?", (time.time() - older_than,)).rowcount
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> 'DedupeIndex':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _records(output: Any, list_field: str) -> List[Dict[str, Any]]:
+    """Records of a structured output in any of the shapes tasks return"""
+    if isinstance(output, (str, bytes)):
+        output = json.loads(output)
+    if isinstance(output, BaseModel):
+        output = output.model_dump()
+    if isinstance(output, dict):
+        output = output.get(list_field) or []
+    return [item.model_dump() if isinstance(item, BaseModel) else dict(item) for item in output or []]
+
+
+def _number(value: Union[int, float, str, None]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
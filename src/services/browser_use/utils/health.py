@@ -0,0 +1,146 @@
+"""
+Health Probe for Browser Use API
+
+This module provides a lightweight connectivity and credential check. It calls the
+read-only account info endpoint (no task is created, no credits are spent), measures
+the round-trip latency, and caches the result on disk for a TTL so that many processes
+starting at once share one probe. Failed probes are reused only for a few seconds, so
+recovery is noticed quickly. A background mode refreshes the cache periodically.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import requests
+
+from ..api import http
+from ..constants import get_base_url, get_api_key
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a probe result is reused before the API is contacted again
+DEFAULT_TTL = 300
+# Seconds a failed probe result is reused
+DEFAULT_FAILURE_TTL = 5
+PROBE_TIMEOUT = 10
+
+
+class HealthProbe:
+    """Cheap, cached probe of API reachability and credentials"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 ttl: float = DEFAULT_TTL, cache_dir: Optional[str] = None,
+                 failure_ttl: float = DEFAULT_FAILURE_TTL):
+        self.base_url = base_url or get_base_url()
+        self.api_key = api_key or get_api_key()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        # The cache file name is derived from a hash, so the API key itself is never written to disk
+        digest = hashlib.sha256(f"{self.base_url}|{self.api_key}".encode('utf-8')).hexdigest()[:16]
+        self.cache_path = os.path.join(cache_dir or tempfile.gettempdir(), f"browser_use_health_{digest}.json")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def probe(self) -> Dict[str, Any]:
+        """
+        Contact the API now and store the result in the cache
+
+        Returns:
+            Dictionary with 'ok' (credentials accepted), 'reachable' (API answered),
+            'status_code', 'latency_ms', 'checked_at' and 'error'
+        """
+        start = time.perf_counter()
+        status_code = None
+        error = None
+        try:
+            response = http.get(f"{self.base_url}/account/info", '/account/info', headers=self.headers,
+                                timeout=PROBE_TIMEOUT, max_retries=0)
+            status_code = response.status_code
+            if status_code != 200:
+                error = f"HTTP {status_code}"
+        except requests.exceptions.RequestException as e:
+            error = f"{type(e).__name__}: {e}"
+
+        result = {
+            'ok': status_code == 200,
+            'reachable': status_code is not None and status_code < 500,
+            'status_code': status_code,
+            'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+            'checked_at': time.time(),
+            'error': error
+        }
+        self._write_cache(result)
+        return result
+
+    def check(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Return a fresh-enough probe result, probing only if the cache has expired
+
+        Successful results are reused for `ttl` seconds, failed ones for `failure_ttl`.
+
+        Args:
+            force: Ignore the cache and probe now
+
+        Returns:
+            Probe result (see probe()) with 'cached' set when it came from the cache
+        """
+        if not force:
+            cached = self._read_cache()
+            ttl = self.ttl if cached and cached.get('ok') else min(self.ttl, self.failure_ttl)
+            if cached is not None and time.time() - cached.get('checked_at', 0) < ttl:
+                cached['cached'] = True
+                return cached
+        result = self.probe()
+        result['cached'] = False
+        return result
+
+    def start_background(self, interval: float = 60) -> threading.Thread:
+        """Refresh the cached result every `interval` seconds from a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.probe()
+                except Exception as e:
+                    logger.warning("Background health probe failed: %s", e)
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=loop, name='browser-use-health-probe', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop_background(self):
+        """Stop the background refresh thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=PROBE_TIMEOUT)
+            self._thread = None
+
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, result: Dict[str, Any]):
+        # Write then rename so concurrent readers never see a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_path), prefix='.browser_use_health_')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug("Could not write health cache %s: %s", self.cache_path, e)
@@ -49,7 +49,8 @@ controller.resume_task(task_id)
 media = MediaManager()
 screenshots = media.get_task_screenshots(task_id)
 
-# Task monitoring
+# Task monitoring (progress is logged; configure_logging() makes it visible)
+configure_logging()
 monitor = TaskMonitor()
 monitor.monitor_task_progress(task_id)
 
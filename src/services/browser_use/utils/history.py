@@ -0,0 +1,144 @@
+"""
+Task Duration History for Browser Use API
+
+This module keeps a bounded record of how long tasks of each type took, with their
+final status and any extra attributes (e.g. the configuration used). It answers
+percentile queries and can persist itself to a JSON file so the history survives
+restarts and can be shared by separate runs. Saves after a record are batched: the file
+is rewritten at most once per `save_interval` seconds, and unsaved samples are written
+by flush() or at interpreter exit.
+"""
+import atexit
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Dict, Any, Optional, List, Deque
+
+DEFAULT_MAX_SAMPLES = 500
+DEFAULT_SAVE_INTERVAL = 5.0
+
+# Histories with samples not yet written to their file
+_unsaved: 'weakref.WeakSet[TaskHistory]' = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for history in list(_unsaved):
+        history.flush()
+
+
+class TaskHistory:
+    """Per-task-type record of completed task durations"""
+
+    def __init__(self, path: Optional[str] = None, max_samples: int = DEFAULT_MAX_SAMPLES,
+                 save_interval: float = DEFAULT_SAVE_INTERVAL):
+        """
+        Args:
+            path: Optional JSON file to load from and save to after records
+            max_samples: Samples kept per task type (oldest are dropped first)
+            save_interval: Minimum seconds between saves triggered by record() (0 saves every record)
+        """
+        self.path = path
+        self.max_samples = max_samples
+        self.save_interval = save_interval
+        self._samples: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        if path and os.path.exists(path):
+            self.load()
+
+    def record(self, task_type: str, duration: float, status: str = 'finished', **attributes: Any):
+        """
+        Record a completed task
+
+        Args:
+            task_type: Task type the duration belongs to
+            duration: Seconds from submission to completion
+            status: Final task status
+            **attributes: Extra JSON-serializable values to keep with the sample
+        """
+        sample = {'duration': round(duration, 3), 'status': status, **attributes}
+        with self._lock:
+            self._series(task_type).append(sample)
+            if not self.path:
+                return
+            self._dirty = True
+            due = time.monotonic() - self._last_save >= self.save_interval
+        if due:
+            self.save()
+        else:
+            _unsaved.add(self)
+
+    def samples(self, task_type: str) -> List[Dict[str, Any]]:
+        """All kept samples for a task type, oldest first"""
+        with self._lock:
+            return list(self._samples.get(task_type, ()))
+
+    def durations(self, task_type: str, status: Optional[str] = 'finished') -> List[float]:
+        """Durations for a task type, restricted to one final status (None for all)"""
+        return [s['duration'] for s in self.samples(task_type) if status is None or s['status'] == status]
+
+    def count(self, task_type: str, status: Optional[str] = 'finished') -> int:
+        return len(self.durations(task_type, status))
+
+    def percentile(self, task_type: str, q: float, status: Optional[str] = 'finished') -> Optional[float]:
+        """
+        Duration percentile for a task type
+
+        Args:
+            task_type: Task type to query
+            q: Percentile between 0 and 100
+            status: Only consider samples with this final status (None for all)
+
+        Returns:
+            The nearest-rank percentile in seconds, or None without samples
+        """
+        values = sorted(self.durations(task_type, status))
+        if not values:
+            return None
+        rank = max(1, math.ceil(q / 100 * len(values)))
+        return values[min(rank, len(values)) - 1]
+
+    def task_types(self) -> List[str]:
+        with self._lock:
+            return list(self._samples)
+
+    def _series(self, task_type: str) -> Deque[Dict[str, Any]]:
+        series = self._samples.get(task_type)
+        if series is None:
+            series = self._samples[task_type] = deque(maxlen=self.max_samples)
+        return series
+
+    def load(self):
+        """Read samples from the history file, replacing those in memory"""
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        with self._lock:
+            self._samples = {}
+            for task_type, samples in data.items():
+                self._series(task_type).extend(samples)
+
+    def flush(self):
+        """Write samples recorded since the last save, if any"""
+        if self.path and self._dirty:
+            self.save()
+
+    def save(self):
+        """Write samples to the history file atomically"""
+        with self._lock:
+            data = {task_type: list(samples) for task_type, samples in self._samples.items()}
+            self._dirty = False
+            self._last_save = time.monotonic()
+        _unsaved.discard(self)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.task_history_')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,168 @@
+"""
+Structured Logging for Browser Use API
+
+This module provides the package loggers and a non-blocking logging setup. Records
+are handed to a QueueHandler and written by a background QueueListener, so polling
+loops never block on stdout or file I/O. The QueueHandler still merges each message
+with its arguments (and renders any traceback) on the calling thread; only the sink
+formatters and the writes run on the listener thread. Messages use lazy %-style
+arguments, so nothing is formatted when a level is disabled.
+
+The package installs no handlers of its own: until configure_logging() (or the
+application's own logging setup) runs, INFO messages are not shown. The one exception
+is step progress: a caller passing show_steps=True gets the default configuration
+(ensure_logging()) if no handler is configured anywhere.
+
+Structured fields are passed with `extra`, e.g.
+    logger.info("Task %s completed: %s", task_id, status, extra={'task_id': task_id, 'status': status})
+and are emitted as keys by the JSON-lines sink.
+
+Usage:
+    from browser_use.utils.log import configure_logging
+    configure_logging(level='INFO', json_file='logs/events.jsonl')
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional, List, Union
+
+from ..constants import load_environment
+
+LOGGER_NAME = 'browser_use'
+CONSOLE_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+
+# Attributes present on every LogRecord; anything else came from `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+_configure_lock = threading.Lock()
+_traceback_formatter = logging.Formatter()
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Return a package logger
+
+    Args:
+        name: Module name (e.g. __name__) or short suffix; None returns the package logger
+    """
+    if not name or name == LOGGER_NAME:
+        return logging.getLogger(LOGGER_NAME)
+    if name.startswith(LOGGER_NAME + '.'):
+        return logging.getLogger(name)
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line: time, level, logger, message and extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        elif record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _TracebackQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback apart from the message, as exc_text"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare folds the traceback into msg; render it on its own so each sink
+        # places it (the JSON sink as its 'exception' key, text sinks after the message)
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _traceback_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: Optional[Union[int, str]] = None, log_file: Optional[str] = None,
+                      json_file: Optional[str] = None, console: bool = True) -> QueueListener:
+    """
+    Route package logs through a background queue to the configured sinks
+
+    Calling it again replaces the previous configuration.
+
+    Args:
+        level: Log level (defaults to LOG_LEVEL from the environment, else INFO)
+        log_file: Plain-text log file (defaults to LOG_FILE from the environment)
+        json_file: JSON-lines log file for machine consumption
+        console: Whether to also log to stderr
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    load_environment()
+    level = level or os.getenv('LOG_LEVEL') or 'INFO'
+    log_file = log_file or os.getenv('LOG_FILE')
+
+    handlers: List[logging.Handler] = []
+    if console:
+        handlers.append(logging.StreamHandler())
+    if log_file:
+        handlers.append(_file_handler(log_file))
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    if json_file:
+        json_handler = _file_handler(json_file)
+        json_handler.setFormatter(JSONLinesFormatter())
+        handlers.append(json_handler)
+
+    logger = get_logger()
+    if _listener is not None:
+        _listener.stop()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(_TracebackQueueHandler(log_queue))
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def ensure_logging():
+    """Apply the default configure_logging() if no log handler is configured anywhere"""
+    with _configure_lock:
+        if _listener is None and not get_logger().hasHandlers():
+            configure_logging()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _file_handler(path: str) -> logging.Handler:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return logging.FileHandler(path, encoding='utf-8')
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,319 @@
+"""
+Request and Task Instrumentation for Browser Use API
+
+This module provides latency histograms, counters and gauges for every API endpoint,
+task lifecycle timings (queue wait, time to first step, total duration), a pluggable
+hook API and a local Prometheus text exporter.
+
+Usage:
+    from browser_use.utils.metrics import get_metrics, start_metrics_server
+
+    metrics = get_metrics()
+    metrics.add_hook(lambda event, data: print(event, data))
+    start_metrics_server(port=9464)  # serves http://127.0.0.1:9464/metrics
+"""
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets
+REQUEST_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TASK_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+TERMINAL_STATUSES = ('finished', 'failed', 'stopped')
+
+# Tasks whose terminal status is never observed (e.g. not polled to completion) are
+# dropped from lifecycle tracking after this many seconds, or oldest first past the cap
+LIFECYCLE_TTL = 24 * 3600
+MAX_TRACKED_TASKS = 10000
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed-bucket histogram in the Prometheus style"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile (upper bound of the bucket containing it)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class Metrics:
+    """Thread-safe registry of API request and task lifecycle metrics"""
+
+    def __init__(self, lifecycle_ttl: float = LIFECYCLE_TTL, max_tracked_tasks: int = MAX_TRACKED_TASKS):
+        self.lifecycle_ttl = lifecycle_ttl
+        self.max_tracked_tasks = max_tracked_tasks
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._hooks: List[Callable[[str, Dict[str, Any]], None]] = []
+        # task_id -> [submitted_at, started_at, first_step_at], in submission order
+        self._lifecycle: Dict[str, List[Optional[float]]] = {}
+
+    # Hook API
+
+    def add_hook(self, hook: Callable[[str, Dict[str, Any]], None]):
+        """
+        Register a callable receiving (event, data) for every instrumentation event
+
+        Events: 'request', 'retry', 'task_submitted', 'task_started', 'task_first_step',
+        'task_finished'. Hooks run on the calling thread and must be fast; exceptions
+        raised by a hook are ignored.
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, Dict[str, Any]], None]):
+        """Unregister a hook added with add_hook"""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def _emit(self, event: str, data: Dict[str, Any]):
+        for hook in self._hooks:
+            try:
+                hook(event, data)
+            except Exception:
+                pass
+
+    # Primitive updates
+
+    def inc(self, name: str, value: float = 1.0, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str):
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._gauges[key] = self._gauges.get(key, 0.0) + delta
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = REQUEST_BUCKETS, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    # Request instrumentation
+
+    def request_started(self, endpoint: str):
+        """Mark a request as in flight"""
+        self.add_gauge('browser_use_requests_in_flight', 1, endpoint=endpoint)
+
+    def request_finished(self, method: str, endpoint: str, status: Optional[int], duration: float,
+                         error: Optional[str] = None):
+        """Record the outcome and latency of one HTTP request"""
+        self.add_gauge('browser_use_requests_in_flight', -1, endpoint=endpoint)
+        status_label = str(status) if status is not None else 'error'
+        self.inc('browser_use_requests_total', method=method, endpoint=endpoint, status=status_label)
+        self.observe('browser_use_request_duration_seconds', duration, method=method, endpoint=endpoint)
+        if error is not None or (status is not None and status >= 400):
+            self.inc('browser_use_request_errors_total', method=method, endpoint=endpoint)
+        if self._hooks:
+            self._emit('request', {'method': method, 'endpoint': endpoint, 'status': status,
+                                   'duration': duration, 'error': error})
+
+    def request_retried(self, method: str, endpoint: str, status: Optional[int]):
+        """Count a retried request"""
+        self.inc('browser_use_request_retries_total', method=method, endpoint=endpoint)
+        if self._hooks:
+            self._emit('retry', {'method': method, 'endpoint': endpoint, 'status': status})
+
+    # Task lifecycle instrumentation
+
+    def task_submitted(self, task_id: str):
+        """Start lifecycle timing for a newly created task"""
+        now = time.monotonic()
+        with self._lock:
+            self._lifecycle.pop(task_id, None)
+            self._lifecycle[task_id] = [now, None, None]
+            expired = 0
+            for oldest, entry in list(self._lifecycle.items()):
+                if len(self._lifecycle) <= self.max_tracked_tasks and now - entry[0] <= self.lifecycle_ttl:
+                    break
+                del self._lifecycle[oldest]
+                expired += 1
+            if expired:
+                key = ('browser_use_task_lifecycle_expired_total', ())
+                self._counters[key] = self._counters.get(key, 0.0) + expired
+            self._gauges[('browser_use_tasks_in_flight', ())] = float(len(self._lifecycle))
+        if self._hooks:
+            self._emit('task_submitted', {'task_id': task_id})
+
+    def task_observed(self, task_id: str, status: Optional[str], step_count: Optional[int] = None):
+        """
+        Update lifecycle timings from a polled status (and step count, if known)
+
+        Queue wait is measured until the task is first seen running, time to first
+        step until steps are first seen, and duration until a terminal status is seen.
+        Timings are therefore as precise as the polling interval.
+        """
+        if status is None:
+            return
+        now = time.monotonic()
+        events = []
+        with self._lock:
+            entry = self._lifecycle.get(task_id)
+            if entry is None:
+                return
+            submitted = entry[0]
+            if entry[1] is None and (status != 'created' or (step_count or 0) > 0):
+                entry[1] = now
+                events.append(('task_started', 'browser_use_task_queue_wait_seconds', 'queue_wait'))
+            if entry[2] is None and step_count:
+                entry[2] = now
+                events.append(('task_first_step', 'browser_use_task_time_to_first_step_seconds',
+                               'time_to_first_step'))
+            finished = status in TERMINAL_STATUSES
+            if finished:
+                del self._lifecycle[task_id]
+                self._gauges[('browser_use_tasks_in_flight', ())] = float(len(self._lifecycle))
+
+        elapsed = now - submitted
+        for event, metric, field in events:
+            self.observe(metric, elapsed, TASK_BUCKETS)
+            if self._hooks:
+                self._emit(event, {'task_id': task_id, field: elapsed})
+        if finished:
+            self.observe('browser_use_task_duration_seconds', elapsed, TASK_BUCKETS, status=status)
+            self.inc('browser_use_tasks_completed_total', status=status)
+            if self._hooks:
+                self._emit('task_finished', {'task_id': task_id, 'status': status, 'duration': elapsed})
+
+    # Reading
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of all metrics"""
+        def fmt(key):
+            name, labels = key
+            return name + ('{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}' if labels else '')
+
+        with self._lock:
+            return {
+                'counters': {fmt(k): v for k, v in self._counters.items()},
+                'gauges': {fmt(k): v for k, v in self._gauges.items()},
+                'histograms': {fmt(k): {'count': h.count, 'sum': h.sum,
+                                        'p50': h.quantile(0.5), 'p99': h.quantile(0.99)}
+                               for k, h in self._histograms.items()}
+            }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        def label_text(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+            pairs = list(labels) + ([extra] if extra else [])
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}' if pairs else ''
+
+        lines = []
+        with self._lock:
+            for kind, series in (('counter', self._counters), ('gauge', self._gauges)):
+                declared = set()
+                for (name, labels), value in sorted(series.items()):
+                    if name not in declared:
+                        lines.append(f"# TYPE {name} {kind}")
+                        declared.add(name)
+                    lines.append(f"{name}{label_text(labels)} {value}")
+
+            declared = set()
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                if name not in declared:
+                    lines.append(f"# TYPE {name} histogram")
+                    declared.add(name)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{label_text(labels, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{name}_bucket{label_text(labels, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{name}_sum{label_text(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{label_text(labels)} {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Clear all recorded metrics (hooks are kept)"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._lifecycle.clear()
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value for the Prometheus text format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """Return the process-wide metrics registry"""
+    return _metrics
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: Metrics = _metrics
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int = 9464, host: str = '127.0.0.1',
+                         registry: Optional[Metrics] = None) -> ThreadingHTTPServer:
+    """
+    Serve metrics at http://host:port/metrics from a background thread
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        host: Interface to bind (local only by default)
+        registry: Metrics registry to expose (the process-wide one by default)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry or _metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, name='browser-use-metrics', daemon=True)
+    thread.start()
+    return server
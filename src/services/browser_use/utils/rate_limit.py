@@ -0,0 +1,35 @@
+"""
+Rate Limiting for Browser Use API
+
+This module provides a thread-safe limiter that spaces out calls (e.g. task
+submissions) to a maximum rate. One limiter can be shared by several runners so
+their combined rate stays under the limit.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Allow at most `rate` acquisitions per second, with bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
@@ -0,0 +1,149 @@
+"""
+Structured Output Parsing for Browser Use API
+
+This module provides bulk validation of structured task outputs for Browser Use API.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ..models.models import (
+    SocialMediaCompanies, WebsiteAnalysis, WebsiteAnalysisPack,
+    PriceComparisonResults, NewsCollection
+)
+
+# Output model used by each kind of structured task
+OUTPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    'social_media_companies': SocialMediaCompanies,
+    'website_analysis': WebsiteAnalysis,
+    'website_analysis_pack': WebsiteAnalysisPack,
+    'price_comparison': PriceComparisonResults,
+    'news_collection': NewsCollection
+}
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(model: Any) -> TypeAdapter:
+    """Return the compiled TypeAdapter for a model, building it only once per process"""
+    return TypeAdapter(model)
+
+
+def _validate_items(model: Any, items: List[Tuple[Any, Any]]) -> Tuple[Dict[Any, Any], Dict[Any, str]]:
+    """
+    Validate (key, output) pairs against a model, collecting errors instead of raising
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+    adapter = get_type_adapter(model)
+    validate_json = adapter.validate_json
+    validate_python = adapter.validate_python
+
+    parsed = {}
+    errors = {}
+    for key, output in items:
+        if output is None:
+            errors[key] = "No output"
+            continue
+        try:
+            if isinstance(output, (str, bytes, bytearray)):
+                parsed[key] = validate_json(output)
+            else:
+                parsed[key] = validate_python(output)
+        except ValidationError as e:
+            errors[key] = str(e)
+    return parsed, errors
+
+
+class ResultParser:
+    """Validate structured task outputs in bulk using cached validators"""
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 500):
+        """
+        Args:
+            max_workers: Number of worker processes for bulk validation (None validates in-process)
+            chunk_size: Number of outputs sent to a worker process at a time
+        """
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def get_model(output_type: Union[str, Type[BaseModel]]) -> Type[BaseModel]:
+        """Resolve a task output type name (e.g. 'news_collection') or model class to a model class"""
+        if isinstance(output_type, str):
+            if output_type not in OUTPUT_MODELS:
+                raise ValueError(f"Unknown output type: {output_type}")
+            return OUTPUT_MODELS[output_type]
+        return output_type
+
+    def parse(self, output: Any, output_type: Union[str, Type[BaseModel]]) -> Any:
+        """
+        Validate a single output, raising ValidationError if it does not match
+
+        Args:
+            output: Raw JSON string/bytes or already-decoded data
+            output_type: Output type name or model class
+
+        Returns:
+            The validated model instance
+        """
+        adapter = get_type_adapter(self.get_model(output_type))
+        if isinstance(output, (str, bytes, bytearray)):
+            return adapter.validate_json(output)
+        return adapter.validate_python(output)
+
+    def parse_many(self, outputs: Union[Dict[Any, Any], List[Any]],
+                   output_type: Union[str, Type[BaseModel]]) -> Dict[str, Any]:
+        """
+        Validate many outputs against the same model without stopping on bad items
+
+        Args:
+            outputs: Mapping of key (e.g. task ID) to output, or a list of outputs keyed by index
+            output_type: Output type name or model class
+
+        Returns:
+            Dictionary with 'parsed' (key -> model instance) and 'errors' (key -> error message)
+        """
+        model = self.get_model(output_type)
+        items = list(outputs.items()) if isinstance(outputs, dict) else list(enumerate(outputs))
+
+        if not self.max_workers or self.max_workers <= 1 or len(items) <= self.chunk_size:
+            parsed, errors = _validate_items(model, items)
+            return {'parsed': parsed, 'errors': errors}
+
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        parsed = {}
+        errors = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_parsed, chunk_errors in executor.map(_validate_items, [model] * len(chunks), chunks):
+                parsed.update(chunk_parsed)
+                errors.update(chunk_errors)
+        return {'parsed': parsed, 'errors': errors}
+
+    def parse_task_results(self, results: Dict[str, Any],
+                           output_type: Union[str, Type[BaseModel]]) -> Dict[str, Any]:
+        """
+        Validate batch results as returned by BatchTaskManager.wait_for_batch_completion
+
+        Finished tasks are validated with a single cached validator; tasks that did not
+        finish are reported in 'errors'.
+
+        Args:
+            results: Dictionary of task ID to {'status': ..., 'output': ...}
+            output_type: Output type name or model class every task's output should match
+
+        Returns:
+            Dictionary with 'parsed' (task ID -> model instance) and 'errors' (task ID -> error message)
+        """
+        outputs = {}
+        errors = {}
+        for task_id, result in results.items():
+            if result.get('status') != 'finished':
+                errors[task_id] = f"Task ended with status: {result.get('status')}"
+            else:
+                outputs[task_id] = result.get('output')
+
+        report = self.parse_many(outputs, output_type)
+        report['errors'].update(errors)
+        return report
@@ -0,0 +1,287 @@
+"""
+Step Log Archive for Browser Use API
+
+This module provides an append-only archive for terminal task payloads (the full
+get_task_details response, steps included). Each task is stored as one compressed
+block, zstd when the optional zstandard package is installed and zlib otherwise, and
+a per-task offset index sits next to the archive. Reading a task maps the archive
+with mmap and decompresses only that task's block. Appending a task again supersedes
+the earlier block; compact() rewrites the archive without superseded or dropped blocks.
+
+File layout:
+    <path>        blocks: MAGIC, codec (1 byte), task ID length (2 bytes), payload
+                  length (4 bytes), archive time (8-byte float), task ID, compressed payload
+    <path>.idx    JSON lines: {"id", "offset", "length", "codec", "archived_at"}
+
+The index can always be rebuilt by scanning the block headers, so a missing or
+truncated index (e.g. after a crash) is repaired on open, timestamps included.
+
+Usage:
+    with StepArchive('steps.bua') as archive:
+        archive.append(task_id, client.get_task_details(task_id))
+        details = archive.get(task_id)
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Any, Optional, List, Callable, Iterator
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional zstd codec
+    zstandard = None
+
+from ..api.json_stream import loads
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b'BUA2'
+HEADER = struct.Struct('<4sBHId')
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+DEFAULT_LEVEL = {CODEC_ZLIB: 6, CODEC_ZSTD: 9}
+
+
+def _dumps(details: Dict[str, Any]) -> bytes:
+    return json.dumps(details, separators=(',', ':'), default=str).encode('utf-8')
+
+
+class StepArchive:
+    """Append-only compressed archive of task payloads with per-task random access"""
+
+    def __init__(self, path: str, codec: Optional[str] = None, level: Optional[int] = None):
+        """
+        Args:
+            path: Archive file (created if missing); the index is kept at <path>.idx
+            codec: 'zstd' or 'zlib' for new blocks (default: zstd if zstandard is installed)
+            level: Compression level (codec default if not given)
+        """
+        if codec is None:
+            codec = 'zstd' if zstandard is not None else 'zlib'
+        if codec == 'zstd' and zstandard is None:
+            raise ValueError("zstd codec requested but zstandard is not installed")
+        if codec not in ('zstd', 'zlib'):
+            raise ValueError(f"Unknown codec: {codec}")
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.codec = CODEC_ZSTD if codec == 'zstd' else CODEC_ZLIB
+        self.level = level if level is not None else DEFAULT_LEVEL[self.codec]
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a+b')
+        self._load_index()
+
+    # Writing
+
+    def append(self, task_id: str, details: Dict[str, Any]):
+        """Archive a task payload, superseding any earlier copy of the same task"""
+        payload = self._compress(_dumps(details))
+        key = task_id.encode('utf-8')
+        archived_at = round(time.time(), 3)
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(HEADER.pack(MAGIC, self.codec, len(key), len(payload), archived_at) + key + payload)
+            self._file.flush()
+            entry = {'id': task_id, 'offset': offset, 'length': len(payload), 'codec': self.codec,
+                     'archived_at': archived_at}
+            self._entries[task_id] = entry
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def archive_task(self, client, task_id: str) -> Dict[str, Any]:
+        """Fetch a terminal task's full details through a BrowserUseClient and archive them"""
+        details = client.get_task_details(task_id)
+        self.append(task_id, details)
+        return details
+
+    # Reading
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def task_ids(self) -> List[str]:
+        """Archived task IDs in archive order"""
+        with self._lock:
+            return [e['id'] for e in sorted(self._entries.values(), key=lambda e: e['offset'])]
+
+    def get(self, task_id: str) -> Dict[str, Any]:
+        """Payload of an archived task (raises KeyError if it is not archived)"""
+        return loads(self.get_raw(task_id))
+
+    def get_raw(self, task_id: str) -> bytes:
+        """Decompressed JSON bytes of an archived task"""
+        with self._lock:
+            entry = self._entries[task_id]
+            start = entry['offset'] + self._block_header_size(entry)
+            block = self._view(start + entry['length'])[start:start + entry['length']]
+        return self._decompress(entry['codec'], block)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for task_id in self.task_ids():
+            yield self.get(task_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Task count, archive size and bytes taken by superseded blocks"""
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            size = self._file.tell()
+            live = sum(self._block_header_size(e) + e['length'] for e in self._entries.values())
+        return {'tasks': len(self._entries), 'bytes': size, 'reclaimable_bytes': size - live}
+
+    # Maintenance
+
+    def compact(self, keep: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Dict[str, int]:
+        """
+        Rewrite the archive with only the latest block of each task
+
+        Blocks are copied without recompression unless they use a different codec.
+
+        Args:
+            keep: Optional predicate on an index entry ('id', 'archived_at', ...); tasks for
+                which it returns False are dropped, e.g. lambda e: e['archived_at'] > cutoff
+
+        Returns:
+            Dictionary with 'tasks', 'dropped', 'bytes_before' and 'bytes_after'
+        """
+        bytes_before = self.stats()['bytes']
+        tmp_path = f"{self.path}.compact"
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e['offset'])
+            kept = [e for e in entries if keep is None or keep(e)]
+            self._file.seek(0, os.SEEK_END)
+            view = self._view(self._file.tell()) if kept else None
+            new_entries: Dict[str, Dict[str, Any]] = {}
+            with open(tmp_path, 'wb') as out, open(f"{tmp_path}.idx", 'w', encoding='utf-8') as index:
+                for entry in kept:
+                    start = entry['offset'] + self._block_header_size(entry)
+                    payload = bytes(view[start:start + entry['length']])
+                    codec = entry['codec']
+                    if codec != self.codec:
+                        payload, codec = self._compress(self._decompress(codec, payload)), self.codec
+                    key = entry['id'].encode('utf-8')
+                    new_entry = {**entry, 'offset': out.tell(), 'length': len(payload), 'codec': codec}
+                    out.write(HEADER.pack(MAGIC, codec, len(key), len(payload), entry['archived_at']) + key + payload)
+                    index.write(json.dumps(new_entry) + '\n')
+                    new_entries[entry['id']] = new_entry
+                out.flush()
+                os.fsync(out.fileno())
+            self._close_files()
+            # Without an index, an interrupted swap is repaired by rescanning on the next open
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+            os.replace(tmp_path, self.path)
+            os.replace(f"{tmp_path}.idx", self.index_path)
+            self._file = open(self.path, 'a+b')
+            self._entries = new_entries
+        result = {'tasks': len(kept), 'dropped': len(entries) - len(kept),
+                  'bytes_before': bytes_before, 'bytes_after': self.stats()['bytes']}
+        logger.info("Compacted %s: %d tasks, %d dropped, %d -> %d bytes", self.path, result['tasks'],
+                    result['dropped'], result['bytes_before'], result['bytes_after'])
+        return result
+
+    def close(self):
+        with self._lock:
+            self._close_files()
+
+    def __enter__(self) -> 'StepArchive':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Internals
+
+    @staticmethod
+    def _block_header_size(entry: Dict[str, Any]) -> int:
+        return HEADER.size + len(entry['id'].encode('utf-8'))
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def _decompress(codec: int, block: bytes) -> bytes:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("Archive block is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(block)
+        return zlib.decompress(block)
+
+    def _view(self, needed: int) -> mmap.mmap:
+        """Read-only map of the archive covering at least `needed` bytes"""
+        if self._mmap is None or self._mapped_size < needed:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._file.flush()
+            self._mapped_size = os.fstat(self._file.fileno()).st_size
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _close_files(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._mapped_size = 0
+        if not self._file.closed:
+            self._file.close()
+
+    def _load_index(self):
+        """Read the index, then scan any blocks written after its last entry"""
+        end = 0
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn final line
+                    self._entries[entry['id']] = entry
+                    end = max(end, entry['offset'] + self._block_header_size(entry) + entry['length'])
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size and self._view(size)[:len(MAGIC)] != MAGIC:
+            # Don't let recovery truncate a foreign file or an archive in an older format
+            self._close_files()
+            raise ValueError(f"{self.path} is not a step archive in the current format")
+        if end < size:
+            self._scan(end, size)
+
+    def _scan(self, offset: int, size: int):
+        view = self._view(size)
+        recovered = 0
+        with open(self.index_path, 'a', encoding='utf-8') as index:
+            while offset + HEADER.size <= size:
+                magic, codec, key_length, length, archived_at = HEADER.unpack_from(view, offset)
+                end = offset + HEADER.size + key_length + length
+                if magic != MAGIC or end > size:
+                    break
+                task_id = bytes(view[offset + HEADER.size:offset + HEADER.size + key_length]).decode('utf-8')
+                entry = {'id': task_id, 'offset': offset, 'length': length, 'codec': codec,
+                         'archived_at': archived_at}
+                self._entries[task_id] = entry
+                index.write(json.dumps(entry) + '\n')
+                recovered += 1
+                offset = end
+        if offset < size:
+            # Drop the torn block so new blocks are appended after the last complete one
+            logger.warning("Truncating %d trailing bytes of incomplete block in %s", size - offset, self.path)
+            self._mmap.close()
+            self._mmap = None
+            self._mapped_size = 0
+            self._file.truncate(offset)
+        if recovered:
+            logger.info("Rebuilt %d index entries for %s", recovered, self.path)
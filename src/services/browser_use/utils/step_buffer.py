@@ -0,0 +1,134 @@
+"""
+Step Ring Buffer for Browser Use API
+
+This module provides a fixed-size in-memory buffer of a task's most recent steps.
+Steps pushed out of the buffer are appended to a JSON-lines spill file on disk, so
+memory use per watched task stays constant however many steps the agent takes.
+
+Spill files outlive the buffer so TaskSummary.iter_steps() can read them; remove one
+with TaskSummary.discard_spill() once it is no longer needed. Files older than
+SPILL_RETENTION are deleted the first time a process spills into their directory.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Deque, Callable
+
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BUFFER_SIZE = 20
+# Seconds a spill file is kept before a later process removes it
+SPILL_RETENTION = 7 * 24 * 3600
+SPILL_SUFFIX = '.steps.jsonl'
+
+_pruned_dirs = set()
+_prune_lock = threading.Lock()
+
+
+def default_spill_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), 'browser_use_steps')
+
+
+def prune_spill_dir(spill_dir: str, max_age: float = SPILL_RETENTION) -> int:
+    """Delete spill files not modified for max_age seconds; returns how many were removed"""
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        entries = list(os.scandir(spill_dir))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.endswith(SPILL_SUFFIX):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass  # removed concurrently or not ours to remove
+    if removed:
+        logger.info("Removed %d spill files older than %.0f days from %s", removed, max_age / 86400, spill_dir)
+    return removed
+
+
+class StepBuffer:
+    """Ring buffer of recent steps that spills older steps to disk"""
+
+    def __init__(self, task_id: str, size: int = DEFAULT_BUFFER_SIZE, spill_dir: Optional[str] = None):
+        """
+        Args:
+            task_id: Task the steps belong to (names the spill file)
+            size: Steps kept in memory
+            spill_dir: Directory for spill files (a temp directory by default); '' disables
+                spilling, so older steps are dropped
+        """
+        self.task_id = task_id
+        self.size = size
+        self.spill_dir = default_spill_dir() if spill_dir is None else spill_dir
+        self.spill_path = os.path.join(self.spill_dir, f"{task_id}{SPILL_SUFFIX}") if self.spill_dir else None
+        self.spilled = 0
+        self._steps: Deque[Dict[str, Any]] = deque()
+
+    def extend(self, steps: List[Dict[str, Any]]):
+        """Add new steps, spilling the oldest ones beyond the buffer size"""
+        overflow = []
+        for step in steps:
+            self._steps.append(step)
+            if len(self._steps) > self.size:
+                overflow.append(self._steps.popleft())
+        if overflow and self.spill_path:
+            self._spill(overflow)
+
+    def recent(self) -> List[Dict[str, Any]]:
+        return list(self._steps)
+
+    def rebuild(self, fill: Callable[[Callable[[Dict[str, Any]], None]], None]):
+        """
+        Replace the buffered and spilled steps with a complete step list
+
+        Args:
+            fill: Called with an add(step) callback, which it calls for every step in
+                order; if it raises, the buffer and spill file are left unchanged
+        """
+        steps: Deque[Dict[str, Any]] = deque()
+        spilled = 0
+        tmp_path = f"{self.spill_path}.tmp"
+        self._prepare_dir()
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                def add(step: Dict[str, Any]):
+                    nonlocal spilled
+                    steps.append(step)
+                    if len(steps) > self.size:
+                        f.write(json.dumps(steps.popleft(), separators=(',', ':')) + '\n')
+                        spilled += 1
+
+                fill(add)
+            os.replace(tmp_path, self.spill_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._steps = steps
+        self.spilled = spilled
+
+    def _prepare_dir(self):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        with _prune_lock:
+            if self.spill_dir in _pruned_dirs:
+                return
+            _pruned_dirs.add(self.spill_dir)
+        prune_spill_dir(self.spill_dir)
+
+    def _spill(self, steps: List[Dict[str, Any]]):
+        # Opened per batch rather than held open, so thousands of watched tasks need no open files
+        self._prepare_dir()
+        with open(self.spill_path, 'a' if self.spilled else 'w', encoding='utf-8') as f:
+            for step in steps:
+                f.write(json.dumps(step, separators=(',', ':')) + '\n')
+        self.spilled += len(steps)
@@ -6,50 +6,45 @@ This module provides validation functionality for Browser Use API.
 import requests
 from typing import Dict, Any, Optional
 
-from ..constants import BASE_URL, API_KEY
+from ..constants import get_base_url, get_api_key, DEFAULT_API_KEY
+from .health import HealthProbe
 
 class ValidationUtils:
     """Utilities for API validation and error handling"""
     
     @staticmethod
-    def validate_api_connection() -> bool:
-        """Validate API connection and credentials"""
-        try:
-            print("🔍 Validating API connection...")
-            
-            # Check if API key is configured
-            if API_KEY == "your_api_key_here" or not API_KEY:
-                print("❌ API key not configured. Please set BROWSER_USE_API_KEY environment variable.")
-                return False
-            
-            # Import client here to avoid circular imports
-            from ..api.client import BrowserUseClient
-            
-            # Try to create a simple test task to validate credentials
-            client = BrowserUseClient()
-            test_task_id = client.create_task("Simple validation test - just return 'API connection successful'")
-            print(f"✅ API connection successful! Test task ID: {test_task_id}")
-            
-            # Stop the test task immediately to avoid unnecessary usage
-            try:
-                # Import controller here to avoid circular imports
-                from ..controllers.task_controller import TaskController
-                controller = TaskController()
-                controller.stop_task(test_task_id)
-                print("✅ Test task stopped successfully")
-            except Exception as e:
-                print(f"⚠️ Could not stop test task, but API connection is working: {e}")
-            
-            return True
-        except Exception as e:
-            print(f"❌ API connection failed: {e}")
-            if "401" in str(e) or "Unauthorized" in str(e):
-                print("💡 Hint: Check your API key in the .env file")
-            elif "403" in str(e) or "Forbidden" in str(e):
-                print("💡 Hint: Your API key might not have the required permissions")
-            elif "404" in str(e):
-                print("💡 Hint: Check the BASE_URL configuration")
+    def validate_api_connection(force: bool = False) -> bool:
+        """
+        Validate API connection and credentials
+
+        Uses the cached read-only health probe, so no task is created and repeated
+        calls (including from other processes) within the cache TTL cost nothing.
+
+        Args:
+            force: Ignore the cached result and probe the API now
+        """
+        print("🔍 Validating API connection...")
+        
+        # Check if API key is configured
+        api_key = get_api_key()
+        if api_key == DEFAULT_API_KEY or not api_key:
+            print("❌ API key not configured. Please set BROWSER_USE_API_KEY environment variable.")
             return False
+        
+        result = HealthProbe().check(force=force)
+        if result['ok']:
+            source = "cached" if result['cached'] else "measured"
+            print(f"✅ API connection successful! Round-trip: {result['latency_ms']:.0f} ms ({source})")
+            return True
+        
+        print(f"❌ API connection failed: {result['error']}")
+        if result['status_code'] == 401:
+            print("💡 Hint: Check your API key in the .env file")
+        elif result['status_code'] == 403:
+            print("💡 Hint: Your API key might not have the required permissions")
+        elif result['status_code'] == 404:
+            print("💡 Hint: Check the BASE_URL configuration")
+        return False
     
     @staticmethod
     def handle_api_error(response: requests.Response, context: str = "API call") -> bool:
@@ -82,44 +77,38 @@ class ValidationUtils:
         return False
     
     @staticmethod
-    def check_api_status() -> bool:
-        """Check API service status"""
-        try:
-            # Simple health check - try to access the base URL
-            response = requests.get(f"{BASE_URL.replace('/api/v1', '')}", timeout=10)
-            if response.status_code == 200:
-                print("✅ Browser Use API service is online")
-                return True
-            else:
-                print(f"⚠️ API service returned status code: {response.status_code}")
-                return False
-        except requests.exceptions.ConnectionError:
-            print("❌ Cannot connect to Browser Use API service")
-            return False
-        except requests.exceptions.Timeout:
+    def check_api_status(force: bool = False) -> bool:
+        """Check API service status (any non-5xx answer from the API counts as online)"""
+        result = HealthProbe().check(force=force)
+        if result['reachable']:
+            print(f"✅ Browser Use API service is online ({result['latency_ms']:.0f} ms)")
+            return True
+        if result['status_code'] is not None:
+            print(f"⚠️ API service returned status code: {result['status_code']}")
+        elif 'Timeout' in (result['error'] or ''):
             print("⏰ API service connection timed out")
-            return False
-        except Exception as e:
-            print(f"❌ Error checking API status: {e}")
-            return False
+        else:
+            print(f"❌ Cannot connect to Browser Use API service: {result['error']}")
+        return False
     
     @staticmethod
     def list_all_task_endpoints():
         """Display all available API endpoints for reference"""
+        base_url = get_base_url()
         endpoints = {
             "🎯 Task Management": [
-                f"POST {BASE_URL}/run-task - Create a new task",
-                f"GET {BASE_URL}/task/{{task_id}} - Get task details",
-                f"GET {BASE_URL}/task/{{task_id}}/status - Get task status",
-                f"PUT {BASE_URL}/pause-task?task_id={{task_id}} - Pause task",
-                f"PUT {BASE_URL}/resume-task?task_id={{task_id}} - Resume task", 
-                f"PUT {BASE_URL}/stop-task?task_id={{task_id}} - Stop task"
+                f"POST {base_url}/run-task - Create a new task",
+                f"GET {base_url}/task/{{task_id}} - Get task details",
+                f"GET {base_url}/task/{{task_id}}/status - Get task status",
+                f"PUT {base_url}/pause-task?task_id={{task_id}} - Pause task",
+                f"PUT {base_url}/resume-task?task_id={{task_id}} - Resume task", 
+                f"PUT {base_url}/stop-task?task_id={{task_id}} - Stop task"
             ],
             "📁 Media & Files": [
-                f"GET {BASE_URL}/task/{{task_id}}/media - Get task recordings",
-                f"GET {BASE_URL}/task/{{task_id}}/screenshots - Get task screenshots",
-                f"GET {BASE_URL}/task/{{task_id}}/gif - Get task GIF",
-                f"POST {BASE_URL}/uploads/presigned-url - Get upload URL"
+                f"GET {base_url}/task/{{task_id}}/media - Get task recordings",
+                f"GET {base_url}/task/{{task_id}}/screenshots - Get task screenshots",
+                f"GET {base_url}/task/{{task_id}}/gif - Get task GIF",
+                f"POST {base_url}/uploads/presigned-url - Get upload URL"
             ]
         }
         
@@ -0,0 +1,76 @@
+"""Tests for BatchTaskManager.run_batch"""
+import threading
+import time
+
+import pytest
+
+from weblens.controllers.batch_task_manager import BatchTaskManager
+
+from conftest import API_KEY
+
+SLOW = {'steps_per_task': 5, 'step_interval': 0.2}
+
+
+class InFlightCounter:
+    """on_submit/on_complete callbacks that track the peak number of tasks in flight"""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.submitted = []
+        self._lock = threading.Lock()
+
+    def on_submit(self, index, task_id):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            self.submitted.append((time.monotonic(), index))
+
+    def on_complete(self, index, result):
+        with self._lock:
+            if result.task_id is not None:
+                self.current -= 1
+
+
+@pytest.fixture
+def manager(simulator):
+    return BatchTaskManager(simulator.base_url, API_KEY)
+
+
+def test_concurrency_limit_is_respected(manager):
+    counter = InFlightCounter()
+    configs = [{'instructions': f"Task {i}"} for i in range(5)]
+
+    results = manager.run_batch(configs, concurrency=2, poll_interval=0.05,
+                                on_submit=counter.on_submit, on_complete=counter.on_complete)
+
+    assert sorted(results) == list(range(5))
+    assert all(result.status == 'finished' for result in results.values())
+    assert counter.peak == 2
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_over_limit_tasks_are_stopped_and_slots_refilled(simulator, manager):
+    counter = InFlightCounter()
+    configs = [{'instructions': f"Task {i}", 'deadline': 0.2} for i in range(2)]
+    configs += [{'instructions': f"Task {i}", 'max_steps': 1} for i in range(2, 4)]
+    started = time.monotonic()
+
+    results = manager.run_batch(configs, concurrency=2, poll_interval=0.05,
+                                on_submit=counter.on_submit, on_complete=counter.on_complete)
+
+    # Each task would take 1s to finish; stopping them frees the slots for the next ones early
+    assert time.monotonic() - started < 1.5
+    assert [results[i].status for i in range(4)] == ['stopped'] * 4
+    assert all(task.stopped_at is not None for task in simulator.tasks.values())
+    assert counter.peak == 2
+    assert counter.submitted[2][0] - started < 0.6
+
+
+def test_creation_errors_complete_without_a_task(simulator, manager):
+    results = manager.run_batch([{'instructions': "Task"}, {}], concurrency=2, poll_interval=0.05)
+
+    assert results[0].status == 'finished'
+    assert results[1].status == 'error'
+    assert results[1].task_id is None
+    assert len(simulator.tasks) == 1
@@ -0,0 +1,64 @@
+"""Tests for cassette record/replay"""
+import time
+
+import pytest
+
+from weblens.api.cassette import Cassette, CassetteMiss
+from weblens.api.client import BrowserUseClient
+from weblens.utils.metrics import get_metrics
+
+from conftest import API_KEY
+
+
+@pytest.fixture
+def recorded(simulator, tmp_path):
+    """Cassette path, base URL and task ID of a recording that polls one task twice 0.3s apart"""
+    path = str(tmp_path / 'run.cassette')
+    client = BrowserUseClient(simulator.base_url, API_KEY)
+    with Cassette(path, mode='record'):
+        task_id = client.create_task("Open example.com")
+        client.get_task_status(task_id)
+        time.sleep(0.3)
+        client.get_task_status(task_id)
+    return path, simulator.base_url, task_id
+
+
+def test_replay_serves_recorded_responses_offline(recorded, simulator):
+    path, base_url, task_id = recorded
+    requests_before = simulator.request_count
+    client = BrowserUseClient(base_url, API_KEY)
+
+    with Cassette(path, mode='replay', speed=None):
+        assert client.create_task("Open example.com") == task_id
+        assert client.get_task_status(task_id) in ('created', 'running', 'finished')
+
+    assert simulator.request_count == requests_before
+
+
+def test_replay_keeps_gaps_between_requests(recorded):
+    path, base_url, task_id = recorded
+    client = BrowserUseClient(base_url, API_KEY)
+
+    with Cassette(path, mode='replay', speed=1.0):
+        start = time.monotonic()
+        client.create_task("Open example.com")
+        client.get_task_status(task_id)
+        client.get_task_status(task_id)
+        elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.3
+
+
+def test_miss_raises_request_exception_and_releases_gauge(recorded):
+    path, base_url, _ = recorded
+    client = BrowserUseClient(base_url, API_KEY)
+    get_metrics().reset()
+
+    with Cassette(path, mode='replay', speed=None):
+        with pytest.raises(CassetteMiss):
+            client.get_task_status('unknown-task')
+
+    snapshot = get_metrics().snapshot()
+    assert snapshot['gauges']['browser_use_requests_in_flight{endpoint="/task/{id}/status"}'] == 0
+    assert snapshot['counters'][
+        'browser_use_requests_total{endpoint="/task/{id}/status",method="GET",status="error"}'] == 1
@@ -0,0 +1,28 @@
+"""Tests for optimizer-driven task settings"""
+from weblens.controllers.batch_task_manager import BatchTaskManager
+from weblens.utils.config import ConfigManager
+from weblens.utils.config_optimizer import ConfigOptimizer
+
+from conftest import API_KEY
+
+
+def test_static_lookup_does_not_consult_optimizer():
+    optimizer = ConfigOptimizer(seed=1)
+    config_manager = ConfigManager(optimizer=optimizer)
+
+    assert config_manager.get_config_for_task_type('web_scraping') == ConfigManager().get_config_for_task_type(
+        'web_scraping')
+
+
+def test_run_batch_records_settings_and_steps(simulator):
+    optimizer = ConfigOptimizer(seed=1)
+    manager = BatchTaskManager(simulator.base_url, API_KEY, ConfigManager(optimizer=optimizer))
+    configs = [{'instructions': f"Task {i}", 'task_type': 'web_scraping'} for i in range(3)]
+
+    results = manager.run_batch(configs, concurrency=3, poll_interval=0.05)
+
+    assert [r.status for r in results.values()] == ['finished'] * 3
+    samples = optimizer.history.samples('web_scraping')
+    assert len(samples) == 3
+    assert all(s['steps'] == 3 and 'profile' in s for s in samples)
+    assert optimizer.stats('web_scraping')
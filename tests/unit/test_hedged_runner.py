@@ -0,0 +1,52 @@
+"""Tests for hedged task execution"""
+import pytest
+
+from weblens.controllers.hedged_runner import HedgedRunner
+from weblens.utils.history import TaskHistory
+
+from conftest import API_KEY
+
+SLOW = {'steps_per_task': 3, 'step_interval': 0.2}
+
+
+@pytest.fixture
+def history():
+    history = TaskHistory()
+    for _ in range(3):
+        history.record('lookup', 0.1)
+    return history
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_straggler_is_hedged_and_loser_stopped(simulator, history):
+    runner = HedgedRunner(simulator.base_url, API_KEY, history=history, percentile=50, min_samples=3,
+                          max_hedge_rate=1.0, poll_interval=0.05)
+
+    result = runner.run("Look up the price", task_type='lookup')
+
+    assert result.status == 'finished'
+    assert runner.get_stats()['hedges'] == 1
+    assert len(simulator.tasks) == 2
+    loser = [task for task_id, task in simulator.tasks.items() if task_id != result.task_id]
+    assert loser[0].stopped_at is not None
+    assert history.count('lookup') == 4
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_extra_task_cap_prevents_hedging(simulator, history):
+    runner = HedgedRunner(simulator.base_url, API_KEY, history=history, percentile=50, min_samples=3,
+                          max_hedge_rate=1.0, max_extra_tasks=0, poll_interval=0.05)
+
+    result = runner.run("Look up the price", task_type='lookup')
+
+    assert result.status == 'finished'
+    assert runner.get_stats()['hedges'] == 0
+    assert len(simulator.tasks) == 1
+
+
+def test_thin_history_is_not_hedged(simulator):
+    runner = HedgedRunner(simulator.base_url, API_KEY, min_samples=3, max_hedge_rate=1.0, poll_interval=0.05)
+
+    assert runner.hedge_delay('lookup') is None
+    assert runner.run("Look up the price", task_type='lookup').status == 'finished'
+    assert len(simulator.tasks) == 1
@@ -0,0 +1,38 @@
+"""Tests for the queue-based logging setup"""
+import json
+import logging
+
+import pytest
+
+from weblens.utils.log import configure_logging, get_logger, shutdown_logging
+
+
+@pytest.fixture
+def package_logger():
+    logger = get_logger()
+    yield logger
+    shutdown_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+def test_json_sink_emits_exception_key(package_logger, tmp_path):
+    json_file = tmp_path / 'events.jsonl'
+    text_file = tmp_path / 'events.log'
+    configure_logging(level='INFO', log_file=str(text_file), json_file=str(json_file), console=False)
+
+    try:
+        raise ValueError("bad status")
+    except ValueError:
+        get_logger('tests').exception("Polling task %s failed", 'task-1', extra={'task_id': 'task-1'})
+    shutdown_logging()
+
+    entry = json.loads(json_file.read_text().strip())
+    assert entry['message'] == "Polling task task-1 failed"
+    assert entry['task_id'] == 'task-1'
+    assert 'ValueError: bad status' in entry['exception']
+    text = text_file.read_text()
+    assert "Polling task task-1 failed\nTraceback" in text
+    assert text.count('ValueError: bad status') == 1
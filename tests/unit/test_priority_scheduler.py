@@ -0,0 +1,49 @@
+"""Tests for priority scheduling with preemption"""
+import time
+
+import pytest
+
+from weblens.controllers.priority_scheduler import PriorityScheduler
+
+from conftest import API_KEY
+
+SLOW = {'steps_per_task': 4, 'step_interval': 0.1}
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_high_priority_task_preempts_and_low_priority_resumes(simulator):
+    with PriorityScheduler(simulator.base_url, API_KEY, concurrency=1, poll_interval=0.05,
+                           aging_interval=0) as scheduler:
+        low = scheduler.submit("Crawl", priority=0, tenant='bulk')
+        wait_until(lambda: low.state == 'running')
+        high = scheduler.submit("Look up", priority=10, tenant='interactive')
+
+        high_result = high.wait(timeout=5)
+        low_result = low.wait(timeout=5)
+
+    assert high_result.status == low_result.status == 'finished'
+    assert low.preemptions == 1
+    assert high_result.completed_at < low_result.completed_at
+    assert simulator.tasks[low.task_id].paused_total > 0
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_equal_priority_does_not_preempt(simulator):
+    with PriorityScheduler(simulator.base_url, API_KEY, concurrency=1, poll_interval=0.05,
+                           aging_interval=0) as scheduler:
+        first = scheduler.submit("First", tenant='a')
+        wait_until(lambda: first.state == 'running')
+        second = scheduler.submit("Second", tenant='b')
+
+        assert first.wait(timeout=5).status == 'finished'
+        assert second.wait(timeout=5).status == 'finished'
+
+    assert first.preemptions == 0
+    assert simulator.tasks[first.task_id].paused_total == 0
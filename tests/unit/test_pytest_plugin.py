@@ -0,0 +1,99 @@
+"""Tests for the browser_task pytest plugin"""
+import json
+
+import pytest
+# Imported here so in-process pytester runs share these modules instead of re-importing them
+import requests  # noqa: F401
+import weblens.pytest_plugin  # noqa: F401
+
+PLUGIN = ('-p', 'weblens.pytest_plugin', '-W', 'ignore::pytest.PytestAssertRewriteWarning')
+
+BROWSER_TESTS = """
+import pytest
+
+@pytest.mark.browser_task("Open example.com")
+def test_fast(browser_task):
+    assert browser_task.status == 'finished'
+
+@pytest.mark.browser_task("Open example.org")
+def test_slow(browser_task):
+    assert browser_task.status == 'finished'
+
+@pytest.mark.browser_task("Open example.net")
+def test_new(browser_task):
+    assert browser_task.status == 'finished'
+
+def test_plain():
+    pass
+"""
+
+
+def test_orders_browser_tests_longest_first(pytester):
+    pytester.makepyfile(test_order=BROWSER_TESTS)
+    durations = {
+        'test_order.py::test_fast': [{'duration': 1.0, 'status': 'finished'}],
+        'test_order.py::test_slow': [{'duration': 30.0, 'status': 'finished'}]
+    }
+    cache_dir = pytester.path / '.pytest_cache' / 'd' / 'browser_use'
+    cache_dir.mkdir(parents=True)
+    (cache_dir / 'durations.json').write_text(json.dumps(durations))
+
+    result = pytester.runpytest(*PLUGIN, '--collect-only', '-q')
+
+    order = [line for line in result.outlines if line.startswith('test_order.py::')]
+    # No history first (may be the slowest), then longest recorded duration first, then unmarked tests
+    assert order == ['test_order.py::test_new', 'test_order.py::test_slow',
+                     'test_order.py::test_fast', 'test_order.py::test_plain']
+
+
+def test_runs_without_cache_plugin(pytester, api_env):
+    pytester.makepyfile(test_order=BROWSER_TESTS)
+
+    result = pytester.runpytest(*PLUGIN, '-p', 'no:cacheprovider')
+
+    result.assert_outcomes(passed=4)
+
+
+def test_fixture_returns_task_result(pytester, api_env):
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.browser_task("Open example.com", llm_model='gpt-4o')
+        def test_task(browser_task):
+            assert browser_task.status == 'finished'
+            assert browser_task.task_id
+    """)
+
+    result = pytester.runpytest(*PLUGIN)
+
+    result.assert_outcomes(passed=1)
+    durations = json.loads((pytester.path / '.pytest_cache' / 'd' / 'browser_use' / 'durations.json').read_text())
+    assert list(durations) == ['test_fixture_returns_task_result.py::test_task']
+
+
+def test_fixture_requires_marker(pytester, api_env):
+    pytester.makepyfile("""
+        def test_unmarked(browser_task):
+            pass
+    """)
+
+    result = pytester.runpytest(*PLUGIN)
+
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(['*needs a @pytest.mark.browser_task(instructions) marker*'])
+
+
+@pytest.mark.parametrize('simulator', [{'step_interval': 1.0}], indirect=True)
+def test_timeout_stops_task_and_fails_test(pytester, api_env):
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.browser_task("Take a long time")
+        def test_slow(browser_task):
+            pass
+    """)
+
+    result = pytester.runpytest(*PLUGIN, '--browser-timeout', '300', '--browser-poll-interval', '0.05')
+
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(['*stopped (timeout 0.3s)*'])
@@ -0,0 +1,16 @@
+"""Tests for compact task records"""
+import json
+
+from weblens.models.records import TaskResult
+
+
+def test_task_result_is_a_mapping():
+    result = TaskResult('task-1', 'finished', output='done', name='Scrape')
+
+    assert result['id'] == result['task_id'] == 'task-1'
+    assert result['final_status'] == 'finished'
+    assert dict(result) == result.to_dict()
+    assert {**result}['output'] == 'done'
+    assert set(result.keys()) == set(TaskResult.__slots__)
+    assert json.loads(json.dumps(result.to_dict()))['name'] == 'Scrape'
+    assert result.get('missing', 'default') == 'default'
@@ -0,0 +1,22 @@
+"""Tests for bulk output validation"""
+import json
+
+from weblens.models.models import NewsCollection
+from weblens.utils.result_parser import ResultParser
+
+NEWS = json.dumps({'articles': [{'title': "T", 'summary': "S", 'author': "A", 'published_date': "2026-01-01",
+                                 'source': "example.com", 'category': "tech"}], 'total_count': 1})
+
+
+def test_parse_task_results_reports_every_task():
+    results = {
+        'ok': {'status': 'finished', 'output': NEWS},
+        'invalid': {'status': 'finished', 'output': '{"articles": []}'},
+        'failed': {'status': 'failed', 'output': None},
+    }
+
+    report = ResultParser().parse_task_results(results, 'news_collection')
+
+    assert isinstance(report['parsed']['ok'], NewsCollection)
+    assert set(report['errors']) == {'invalid', 'failed'}
+    assert report['errors']['failed'] == "Task ended with status: failed"
@@ -0,0 +1,65 @@
+"""Tests for the step archive"""
+import os
+import time
+
+import pytest
+
+from weblens.utils.step_archive import StepArchive
+
+
+def details(task_id, steps=3):
+    return {'id': task_id, 'status': 'finished', 'steps': [{'step': i, 'next_goal': f"Goal {i}"} for i in range(steps)]}
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = str(tmp_path / 'steps.bua')
+    with StepArchive(path, codec='zlib') as archive:
+        archive.append('task-1', details('task-1'))
+        archive.append('task-2', details('task-2', steps=5))
+    return path
+
+
+def test_missing_index_is_rebuilt_with_timestamps(archive_path):
+    os.remove(f"{archive_path}.idx")
+
+    with StepArchive(archive_path) as archive:
+        assert archive.task_ids() == ['task-1', 'task-2']
+        assert archive.get('task-2') == details('task-2', steps=5)
+        assert archive.compact(lambda e: e['archived_at'] > time.time() - 60)['dropped'] == 0
+        assert archive.compact(lambda e: e['archived_at'] > time.time() + 60)['dropped'] == 2
+
+
+def test_torn_block_is_truncated_and_appends_continue(archive_path):
+    size = os.path.getsize(archive_path)
+    with open(archive_path, 'ab') as f:
+        f.write(b'BUA2\x01partial')
+
+    with StepArchive(archive_path) as archive:
+        assert os.path.getsize(archive_path) == size
+        archive.append('task-3', details('task-3'))
+
+    with StepArchive(archive_path) as archive:
+        assert archive.task_ids() == ['task-1', 'task-2', 'task-3']
+        assert archive.get('task-1') == details('task-1')
+
+
+def test_superseded_blocks_are_compacted_away(archive_path):
+    with StepArchive(archive_path) as archive:
+        archive.append('task-1', details('task-1', steps=1))
+        assert archive.stats()['reclaimable_bytes'] > 0
+
+        result = archive.compact()
+
+        assert result['tasks'] == 2
+        assert archive.stats()['reclaimable_bytes'] == 0
+        assert archive.get('task-1') == details('task-1', steps=1)
+
+
+def test_foreign_file_is_rejected(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_bytes(b'not an archive')
+
+    with pytest.raises(ValueError):
+        StepArchive(str(path))
+    assert path.read_bytes() == b'not an archive'
@@ -0,0 +1,68 @@
+"""Tests for TaskMonitor limit enforcement"""
+import pytest
+
+from weblens.api.client import BrowserUseClient
+from weblens.controllers.task_monitor import TaskMonitor
+
+from conftest import API_KEY
+
+SLOW = {'steps_per_task': 5, 'step_interval': 0.2}
+
+
+@pytest.fixture
+def monitor(simulator):
+    return TaskMonitor(simulator.base_url, API_KEY)
+
+
+@pytest.fixture
+def task_id(simulator):
+    return BrowserUseClient(simulator.base_url, API_KEY).create_task("Open example.com")
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_deadline_stops_task(monitor, task_id):
+    details = monitor.wait_for_completion(task_id, poll_interval=0.05, show_steps=False, deadline=0.3)
+
+    assert details['status'] == 'stopped'
+    assert details['stop_reason'] == 'deadline'
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_step_budget_stops_task(monitor, task_id):
+    details = monitor.wait_for_completion(task_id, poll_interval=0.05, show_steps=False, max_steps=2)
+
+    assert details['status'] == 'stopped'
+    assert details['stop_reason'] == 'max_steps'
+    assert 2 <= len(details['steps']) < 5
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_failed_stop_keeps_polling_at_interval(simulator, monitor, task_id, monkeypatch):
+    def refuse(task_id):
+        raise RuntimeError("409 Conflict")
+
+    monkeypatch.setattr(monitor.controller, 'stop_task', refuse)
+    requests_before = simulator.request_count
+
+    details = monitor.wait_for_completion(task_id, poll_interval=0.1, show_steps=False, deadline=0.3)
+
+    # The task runs to the end (about 1s) since it could not be stopped; polling stays at the interval
+    assert details['status'] == 'finished'
+    assert details['stop_reason'] == 'deadline'
+    assert simulator.request_count - requests_before < 30
+
+
+@pytest.mark.parametrize('simulator', [SLOW], indirect=True)
+def test_summary_failed_stop_keeps_polling_at_interval(simulator, monitor, task_id, monkeypatch, tmp_path):
+    def refuse(task_id):
+        raise RuntimeError("409 Conflict")
+
+    monkeypatch.setattr(monitor.controller, 'stop_task', refuse)
+    requests_before = simulator.request_count
+
+    summary = monitor.wait_for_summary(task_id, poll_interval=0.1, show_steps=False, spill_dir=str(tmp_path),
+                                       deadline=0.3)
+
+    assert summary.status == 'finished'
+    assert summary.stop_reason == 'deadline'
+    assert simulator.request_count - requests_before < 30